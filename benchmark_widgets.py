@@ -0,0 +1,287 @@
+"""
+Widget benchmark suite - cost of widget operations without display
+
+Usage: python benchmark_widgets.py [output.json] [--types button slider] [--scales 4 8 16]
+                                   [--repeat N] [--compare baseline.json] [--counters]
+output.json - machine-readable results (default: benchmark.json)
+--compare - print median change of every operation against earlier results
+--counters - also record Qt operations per widget (children, stylesheets, geometry, repaints)
+
+Every widget type is measured for each of its patterns (slider: orientation)
+and every scale. Operations: construct, set_pattern, hover (enter + leave),
+press_release, paint, drag_step (sliders) and teardown. Times are in
+microseconds, samples of each combination are summarized by median and
+percentiles.
+"""
+import os
+import gc
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+
+# Works without display, the platform can still be overridden from environment
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtCore import Qt, QEvent, QPointF, QT_VERSION_STR, PYQT_VERSION_STR
+from PyQt6.QtGui import QEnterEvent, QImage, QMouseEvent
+
+from managers import ButtonPatternManager, TogglePatternManager
+from widgets.widget_specs import WidgetSpecs
+from widgets.instrumentation import WidgetCounters, COUNTERS
+
+SCALES = tuple(range(4, 17))
+OPERATIONS = ('construct', 'set_pattern', 'hover', 'press_release', 'paint', 'drag_step', 'teardown')
+DRAG_STEPS = 8  # Drag moves measured per slider instance
+RESULT_VERSION = 1
+
+def variants(widget_type):
+    """Return variants of widget type: pattern names, slider orientations or (None,)"""
+    if widget_type == 'button':
+        return ButtonPatternManager.get_pattern_names()
+    if widget_type == 'toggle':
+        return TogglePatternManager.get_pattern_names()
+    if widget_type == 'slider':
+        return ('vertical', 'horizontal')
+    return (None,)
+
+def percentile(ordered, fraction):
+    """Return percentile of sorted samples with linear interpolation"""
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def summarize(samples):
+    """Return statistics of samples in nanoseconds as microseconds"""
+    ordered = sorted(sample / 1000 for sample in samples)
+    return {
+        'n': len(ordered),
+        'median_us': round(percentile(ordered, 0.5), 2),
+        'p90_us': round(percentile(ordered, 0.9), 2),
+        'p99_us': round(percentile(ordered, 0.99), 2),
+        'mean_us': round(sum(ordered) / len(ordered), 2),
+        'min_us': round(ordered[0], 2),
+        'max_us': round(ordered[-1], 2)
+    }
+
+def mouse_event(event_type, pos, button=Qt.MouseButton.LeftButton):
+    """Return left button mouse event at pos (QPointF)"""
+    buttons = Qt.MouseButton.NoButton if event_type == QEvent.Type.MouseButtonRelease else button
+    return QMouseEvent(event_type, pos, pos, button, buttons, Qt.KeyboardModifier.NoModifier)
+
+class WidgetBenchmark:
+    """
+    Measure operations of one widget combination (type, variant, scale)
+
+    Widgets live in a hidden host widget, events are delivered with
+    QApplication.sendEvent, so only widget code is timed (no event loop).
+    """
+
+    def __init__(self, app, repeat):
+        self.app = app
+        self.repeat = repeat
+        self.host = QWidget()
+
+    def run(self, widget_type, variant, scale):
+        """Return {operation: [ns, ...]} for combination"""
+        spec = {'type': widget_type, 'scale': scale}
+        if widget_type == 'slider':
+            spec['orientation'] = variant
+        pattern = variant if widget_type in WidgetSpecs.DEFAULT_PATTERNS else None
+
+        samples = {operation: [] for operation in OPERATIONS}
+        timer = time.perf_counter_ns
+        gc.collect()
+        gc.disable()
+        try:
+            # First widget warms up caches (patterns, geometry, styles) and isn't recorded
+            for iteration in range(self.repeat + 1):
+                if iteration == 1:
+                    samples = {operation: [] for operation in OPERATIONS}
+                start = timer()
+                widget = WidgetSpecs.create_widget(spec, self.host)
+                samples['construct'].append(timer() - start)
+
+                if pattern is not None:
+                    start = timer()
+                    widget.set_pattern(pattern)
+                    samples['set_pattern'].append(timer() - start)
+
+                samples['hover'].append(self.hover(widget))
+                samples['press_release'].append(self.press_release(widget))
+                samples['paint'].append(self.paint(widget))
+                if widget_type == 'slider':
+                    samples['drag_step'].extend(self.drag_steps(widget))
+
+                start = timer()
+                widget.setParent(None)
+                widget.deleteLater()
+                self.app.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+                samples['teardown'].append(timer() - start)
+        finally:
+            gc.enable()
+        return {operation: values for operation, values in samples.items() if values}
+
+    def hover(self, widget):
+        """Time mouse enter and leave (restyle in and out)"""
+        pos = QPointF(1, 1)
+        start = time.perf_counter_ns()
+        QApplication.sendEvent(widget, QEnterEvent(pos, pos, pos))
+        QApplication.sendEvent(widget, QEvent(QEvent.Type.Leave))
+        return time.perf_counter_ns() - start
+
+    def press_release(self, widget):
+        """Time left button press and release in widget center"""
+        pos = QPointF(widget.width() / 2, widget.height() / 2)
+        start = time.perf_counter_ns()
+        QApplication.sendEvent(widget, mouse_event(QEvent.Type.MouseButtonPress, pos))
+        QApplication.sendEvent(widget, mouse_event(QEvent.Type.MouseButtonRelease, pos))
+        return time.perf_counter_ns() - start
+
+    def paint(self, widget):
+        """Time rendering widget with children into image"""
+        image = QImage(widget.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        start = time.perf_counter_ns()
+        widget.render(image)
+        return time.perf_counter_ns() - start
+
+    def drag_steps(self, slider):
+        """Time drag moves of slider handle, every move applied right away (as when frame timer fires)"""
+        handle = slider.slider_button
+        center = QPointF(handle.width() / 2, handle.height() / 2)
+        QApplication.sendEvent(handle, mouse_event(QEvent.Type.MouseButtonPress, center))
+        step = 3 * slider.scale
+        times = []
+        for index in range(DRAG_STEPS):
+            offset = step if index % 2 == 0 else -step
+            if slider.orientation == 'vertical':
+                pos = QPointF(center.x(), center.y() + offset)
+            else:
+                pos = QPointF(center.x() + offset, center.y())
+            start = time.perf_counter_ns()
+            QApplication.sendEvent(handle, mouse_event(QEvent.Type.MouseMove, pos, Qt.MouseButton.NoButton))
+            slider.apply_drag()
+            times.append(time.perf_counter_ns() - start)
+        QApplication.sendEvent(handle, mouse_event(QEvent.Type.MouseButtonRelease, center))
+        return times
+
+def git_commit():
+    """Return current commit hash or None outside git checkout"""
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+def result_key(result):
+    """Return key of combination and operation"""
+    return result['type'], result['variant'], result['scale'], result['operation']
+
+def aggregate(results):
+    """Return {(type, operation): median of combination medians}"""
+    grouped = {}
+    for result in results:
+        grouped.setdefault((result['type'], result['operation']), []).append(result['median_us'])
+    return {key: percentile(sorted(values), 0.5) for key, values in grouped.items()}
+
+def print_summary(results):
+    """Print median over all combinations of every type and operation"""
+    summary = aggregate(results)
+    types = sorted({widget_type for widget_type, _ in summary}, key=WidgetSpecs.TYPES.index)
+    print(f"{'median us':>10} " + ''.join(f"{operation:>14}" for operation in OPERATIONS))
+    for widget_type in types:
+        cells = ''.join(f"{summary[widget_type, operation]:14.1f}" if (widget_type, operation) in summary
+                        else f"{'-':>14}" for operation in OPERATIONS)
+        print(f"{widget_type:>10} {cells}")
+
+def print_comparison(results, baseline_path, threshold=0.1):
+    """Print change of aggregated medians against baseline results file"""
+    with open(baseline_path, encoding='utf-8') as baseline_file:
+        baseline_results = json.load(baseline_file)['results']
+    # Only combinations measured in both runs are compared
+    common = {result_key(result) for result in baseline_results} & {result_key(result) for result in results}
+    baseline = aggregate(result for result in baseline_results if result_key(result) in common)
+    current = aggregate(result for result in results if result_key(result) in common)
+    print(f"\nCompared with {baseline_path} (changes over {threshold:.0%} marked):")
+    for key in sorted(current, key=lambda key: (WidgetSpecs.TYPES.index(key[0]), OPERATIONS.index(key[1]))):
+        if key not in baseline:
+            continue
+        change = (current[key] - baseline[key]) / baseline[key] if baseline[key] else 0.0
+        mark = ' <-- slower' if change > threshold else ' <-- faster' if change < -threshold else ''
+        print(f"  {key[0]:>8} {key[1]:<14} {baseline[key]:10.1f} -> {current[key]:10.1f} us "
+              f"({change:+.1%}){mark}")
+
+def parse_args(argv):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Benchmark widget operations without UI")
+    parser.add_argument('output', nargs='?', default='benchmark.json', help="JSON file for results")
+    parser.add_argument('--types', nargs='+', choices=WidgetSpecs.TYPES, default=list(WidgetSpecs.TYPES),
+                        help="Widget types to measure")
+    parser.add_argument('--scales', type=int, nargs='+', default=list(SCALES), help="Scales to measure")
+    parser.add_argument('--repeat', type=int, default=30, help="Widgets created per combination")
+    parser.add_argument('--compare', metavar='BASELINE', help="Earlier results file to compare with")
+    parser.add_argument('--counters', action='store_true',
+                        help="Record Qt operations per widget (slower, timings are not comparable)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Run benchmark and write results"""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    benchmark = WidgetBenchmark(app, max(1, args.repeat))
+    if args.counters:
+        WidgetCounters.enable()
+
+    results = []
+    counters = []
+    start = time.perf_counter()
+    for widget_type in args.types:
+        for variant in variants(widget_type):
+            for scale in args.scales:
+                WidgetCounters.reset()
+                for operation, samples in benchmark.run(widget_type, variant, scale).items():
+                    result = {'type': widget_type, 'variant': variant, 'scale': scale, 'operation': operation}
+                    result.update(summarize(samples))
+                    results.append(result)
+                if args.counters:
+                    # Average over all widgets of combination (including warmup widget)
+                    totals = WidgetCounters.totals()
+                    widgets = benchmark.repeat + 1
+                    counters.append(dict({'type': widget_type, 'variant': variant, 'scale': scale},
+                                         **{counter: totals[counter] / widgets for counter in COUNTERS}))
+    elapsed = time.perf_counter() - start
+    WidgetCounters.disable()
+
+    report = {
+        'version': RESULT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'commit': git_commit(),
+        'environment': {
+            'python': platform.python_version(),
+            'qt': QT_VERSION_STR,
+            'pyqt': PYQT_VERSION_STR,
+            'platform': platform.platform(),
+            'qpa': QApplication.platformName()
+        },
+        'settings': {'types': args.types, 'scales': args.scales, 'repeat': args.repeat,
+                     'drag_steps': DRAG_STEPS, 'counters': args.counters},
+        'results': results
+    }
+    if args.counters:
+        report['counters'] = counters
+    with open(args.output, 'w', encoding='utf-8') as output_file:
+        json.dump(report, output_file, indent=2)
+
+    print_summary(results)
+    print(f"\n{len(results)} results in {elapsed:.1f}s written to {args.output}")
+    if args.compare:
+        print_comparison(results, args.compare)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Startup import cost report - time spent importing every module
+
+Usage: python import_report.py [target ...] [--top N] [--repeat N] [--json FILE]
+target - 'package:Name' measures `from package import Name`,
+         'package.module' measures `import package.module`
+         (default: MinecraftButton alone, WidgetSpecs, whole generator)
+
+Every target is imported in a fresh interpreter with `python -X importtime`,
+so modules cached by earlier targets don't hide their cost.
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+DEFAULT_TARGETS = ('widgets:MinecraftButton', 'widgets:WidgetSpecs', 'widgets.widget_generator')
+PROJECT_PACKAGES = ('widgets', 'managers')
+
+def import_statement(target):
+    """Return Python statement that imports target"""
+    if ':' in target:
+        module, name = target.split(':', 1)
+        return f"from {module} import {name}"
+    return f"import {target}"
+
+def measure(target):
+    """Import target in fresh interpreter, return (total us, {module: (self us, cumulative us, depth)})"""
+    statement = import_statement(target)
+    code = ("import time; start = time.perf_counter(); "
+            f"{statement}; print(round((time.perf_counter() - start) * 1e6))")
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"'{statement}' failed:\n{result.stderr.strip().splitlines()[-1]}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2  # Nested imports are indented by 2 spaces
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return int(result.stdout.strip().splitlines()[-1]), modules
+
+def report(target, repeat):
+    """Measure target repeat times, return report dict with median times"""
+    runs = [measure(target) for _ in range(repeat)]
+    names = set().union(*(modules for _, modules in runs))
+    modules = []
+    for name in names:
+        samples = [modules[name] for _, modules in runs if name in modules]
+        modules.append({
+            'module': name,
+            'self_us': round(statistics.median(sample[0] for sample in samples)),
+            'cumulative_us': round(statistics.median(sample[1] for sample in samples)),
+            'depth': samples[0][2]
+        })
+    modules.sort(key=lambda module: module['self_us'], reverse=True)
+
+    packages = {}  # Top-level package -> total self time
+    for module in modules:
+        package = module['module'].split('.', 1)[0]
+        packages[package] = packages.get(package, 0) + module['self_us']
+
+    return {
+        'target': target,
+        'statement': import_statement(target),
+        'total_us': round(statistics.median(total for total, _ in runs)),
+        'module_count': len(modules),
+        'packages': dict(sorted(packages.items(), key=lambda item: item[1], reverse=True)),
+        'modules': modules
+    }
+
+def print_report(result, top):
+    """Print report of one target"""
+    print(f"{result['statement']}: {result['total_us'] / 1000:.1f} ms, {result['module_count']} modules")
+    print("  by package (self ms):  " + ", ".join(
+        f"{package} {us / 1000:.1f}" for package, us in list(result['packages'].items())[:8]))
+    project = [module for module in result['modules'] if module['module'].split('.', 1)[0] in PROJECT_PACKAGES]
+    print("  project modules:")
+    for module in sorted(project, key=lambda module: module['cumulative_us'], reverse=True):
+        print(f"    {module['self_us'] / 1000:8.2f} ms self {module['cumulative_us'] / 1000:8.2f} ms total  "
+              f"{module['module']}")
+    print(f"  top {top} by self time:")
+    for module in result['modules'][:top]:
+        print(f"    {module['self_us'] / 1000:8.2f} ms  {module['module']}")
+    print()
+
+def parse_args(argv):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Report import cost of project modules")
+    parser.add_argument('targets', nargs='*', default=list(DEFAULT_TARGETS),
+                        help="'package:Name' or 'package.module' to import")
+    parser.add_argument('--top', type=int, default=10, help="Number of slowest modules to list")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per target, median is reported")
+    parser.add_argument('--json', metavar='FILE', help="Also write report as JSON")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Measure and print import cost of all targets"""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    results = []
+    for target in args.targets:
+        try:
+            result = report(target, max(1, args.repeat))
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            return 1
+        results.append(result)
+        print_report(result, args.top)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as report_file:
+            json.dump(results, report_file, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,6 +25,13 @@ def main():
         generator.show()
         print("Вікно показано!")
 
+        # Лічильники Qt-операцій віджетів: WIDGET_COUNTERS=counters.json python main.py
+        counters_path = os.environ.get('WIDGET_COUNTERS')
+        if counters_path:
+            from widgets.instrumentation import WidgetCounters
+            WidgetCounters.enable()
+            app.aboutToQuit.connect(lambda: WidgetCounters.dump(counters_path))
+
         # Запускаємо програму
         sys.exit(app.exec())
 
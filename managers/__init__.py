@@ -1,8 +1,48 @@
 """
 Менеджери для патернів та пресетів
+
+Підмодулі завантажуються при першому зверненні до імені (PEP 562), тож
+необов'язковий numpy імпортується лише разом з PatternBitmaps.
 """
-from .toggle_pattern_manager import TogglePatternManager
-from .button_pattern_manager import ButtonPatternManager
-from .preset_manager import ButtonPresetManager
+from typing import TYPE_CHECKING
+
+# Публічне ім'я -> підмодуль, що його визначає
+_LAZY_NAMES = {
+    'TogglePatternManager': 'toggle_pattern_manager',
+    'ButtonPatternManager': 'button_pattern_manager',
+    'ButtonPresetManager': 'preset_manager',
+    'PatternCompiler': 'pattern_compiler',
+    'CompiledPattern': 'pattern_compiler',
+    'PatternLibrary': 'pattern_library',
+    'Registry': 'registry',
+    'PatternBitmaps': 'pattern_bitmap',
+    'PatternBitmap': 'pattern_bitmap',
+}
+
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    """Імпортує підмодуль при першому зверненні до його імені"""
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # __import__ (не importlib) лишає ліниві імпорти видимими в `python -X importtime`
+    module = __import__(f"{__name__}.{module_name}", fromlist=(name,))
+    value = getattr(module, name)
+    globals()[name] = value  # Наступні звернення вже не проходять через __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
 
-__all__ = ['TogglePatternManager', 'ButtonPatternManager', 'ButtonPresetManager']
\ No newline at end of file
+if TYPE_CHECKING:
+    from .toggle_pattern_manager import TogglePatternManager
+    from .button_pattern_manager import ButtonPatternManager
+    from .preset_manager import ButtonPresetManager
+    from .pattern_compiler import PatternCompiler, CompiledPattern
+    from .pattern_library import PatternLibrary
+    from .registry import Registry
+    from .pattern_bitmap import PatternBitmaps, PatternBitmap
@@ -2,145 +2,208 @@
     Pattern manager for regular buttons
     Supports pattern overlay on buttons anchored to the top-left corner
 """
+import os
+
+from .pattern_library import PatternLibrary
+from .registry import Registry
+
 class ButtonPatternManager:
+    # Pattern files patterns/buttons/<name>.txt, file overrides built-in pattern with same name
+    library = PatternLibrary(os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'patterns', 'buttons'))
+
+    # Patterns and colors defined in code, built once and shared by all callers
+    builtin_patterns = Registry.freeze({
+        'None': None,  # No pattern
+        'Configure': [
+            "0000000000000000",
+            "0000000000000000",
+            "0000000000000000",
+            "0000000WW0000000",
+            "0000WW0WW0WW0000",
+            "0000WWWWWWWW0000",
+            "0000BWWBBWWB0000",
+            "000WWWB00BWWW000",
+            "000WWW0000WWW000",
+            "000BBWW00WWBB000",
+            "0000WWWWWWWW0000",
+            "0000WWBWWBWW0000",
+            "0000BB0WW0BB0000",
+            "0000000BB0000000",
+            "0000000000000000",
+            "0000000000000000"
+        ],
+        'Question': [
+            "0000000000000000",
+            "0000000000000000",
+            "0000000000000000",
+            "0000000000000000",
+            "000000WWWW000000",
+            "00000WWWWWW00000",
+            "00000WWBBWW00000",
+            "00000BB0WWW00000",
+            "0000000WWWB00000",
+            "0000000BBB000000",
+            "0000000WW0000000",
+            "0000000WW0000000",
+            "0000000BB0000000",
+            "0000000000000000",
+            "0000000000000000",
+            "0000000000000000"
+        ],
+        'Message': [
+            "0000000000000000",
+            "0000000000000000",
+            "0000000000000000",
+            "0000BBBBBBBB0000",
+            "000BWWWWWWWWB000",
+            "000BWWWWWWWWB000",
+            "000BWWWWWWWWB000",
+            "000BWWWWWWWWB000",
+            "000BWWWWWWWWB000",
+            "000BWWWWWWWWB000",
+            "0000BWWBBBBB0000",
+            "00000BB000000000",
+            "00000B0000000000",
+            "0000000000000000",
+            "0000000000000000",
+            "0000000000000000"
+        ],
+        'Point 1': [
+            "0000000000000000",
+            "0000000000000000",
+            "0000000000000000",
+            "0000000000000000",
+            "0000000WW0000000",
+            "000000WWWW000000",
+            "00000WWWWWW00000",
+            "0000WWWWWWWW0000",
+            "0000WWWWWWWW0000",
+            "0000BWWWWWWB0000",
+            "00000BWWWWB00000",
+            "000000BWWB000000",
+            "0000000BB0000000",
+            "0000000000000000",
+            "0000000000000000",
+            "0000000000000000"
+        ],
+        'Plus': [
+            "0000000000000000",
+            "0000000000000000",
+            "0000000000000000",
+            "000000WWWW000000",
+            "000000WWWW000000",
+            "000000WWWW000000",
+            "000WWWWWWWWWW000",
+            "000WWWWWWWWWW000",
+            "000WWWWWWWWWW000",
+            "000BBBWWWWBBB000",
+            "000000WWWW000000",
+            "000000WWWW000000",
+            "000000BBBB000000",
+            "0000000000000000",
+            "0000000000000000",
+            "0000000000000000"
+        ],
+        'Arrow Up': [
+            "0000000000000000",
+            "0000000000000000",
+            "0000000000000000",
+            "0000000WW0000000",
+            "000000WWWW000000",
+            "00000WWWWWW00000",
+            "0000WWWWWWWW0000",
+            "0000BBBWWBBB0000",
+            "0000000WW0000000",
+            "0000000WW0000000",
+            "0000000WW0000000",
+            "0000000WW0000000",
+            "0000000WW0000000",
+            "0000000BB0000000",
+            "0000000000000000",
+            "0000000000000000"
+        ],
+        'Arrow Down': [
+            "0000000000000000",
+            "0000000000000000",
+            "0000000000000000",
+            "0000000WW0000000",
+            "0000000WW0000000",
+            "0000000WW0000000",
+            "0000000WW0000000",
+            "0000000WW0000000",
+            "0000000WW0000000",
+            "0000WWWWWWWW0000",
+            "0000BWWWWWWB0000",
+            "00000BWWWWB00000",
+            "000000BWWB000000",
+            "0000000BB0000000",
+            "0000000000000000",
+            "0000000000000000"
+        ]
+    })
+
+    pattern_colors = Registry({
+        '0': None,           # Transparent
+        'W': '#F2F2F2',      # Light (242, 242, 242)
+        'B': '#4D4D67'       # Dark (77, 77, 103)
+    })
+
+    # Registry of built-in and file patterns, rebuilt only after something changed
+    patterns = None
+    patterns_version = None
+    pattern_names = None
+    pattern_names_version = None
+
+    @staticmethod
+    def get_builtin_patterns():
+        """Returns read-only registry with patterns defined in code"""
+        return ButtonPatternManager.builtin_patterns
+
     @staticmethod
     def get_patterns():
-        """Returns dictionary with all available patterns for buttons"""
-        return {
-            'None': None,  # No pattern
-            'Configure': [
-                "0000000000000000",
-                "0000000000000000",
-                "0000000000000000",
-                "0000000WW0000000",
-                "0000WW0WW0WW0000",
-                "0000WWWWWWWW0000",
-                "0000BWWBBWWB0000",
-                "000WWWB00BWWW000",
-                "000WWW0000WWW000",
-                "000BBWW00WWBB000",
-                "0000WWWWWWWW0000",
-                "0000WWBWWBWW0000",
-                "0000BB0WW0BB0000",
-                "0000000BB0000000",
-                "0000000000000000",
-                "0000000000000000"
-            ],
-            'Question': [
-                "0000000000000000",
-                "0000000000000000",
-                "0000000000000000",
-                "0000000000000000",
-                "000000WWWW000000",
-                "00000WWWWWW00000",
-                "00000WWBBWW00000",
-                "00000BB0WWW00000",
-                "0000000WWWB00000",
-                "0000000BBB000000",
-                "0000000WW0000000",
-                "0000000WW0000000",
-                "0000000BB0000000",
-                "0000000000000000",
-                "0000000000000000",
-                "0000000000000000"
-            ],
-            'Message': [
-                "0000000000000000",
-                "0000000000000000",
-                "0000000000000000",
-                "0000BBBBBBBB0000",
-                "000BWWWWWWWWB000",
-                "000BWWWWWWWWB000",
-                "000BWWWWWWWWB000",
-                "000BWWWWWWWWB000",
-                "000BWWWWWWWWB000",
-                "000BWWWWWWWWB000",
-                "0000BWWBBBBB0000",
-                "00000BB000000000",
-                "00000B0000000000",
-                "0000000000000000",
-                "0000000000000000",
-                "0000000000000000"
-            ],
-            'Point 1': [
-                "0000000000000000",
-                "0000000000000000",
-                "0000000000000000",
-                "0000000000000000",
-                "0000000WW0000000",
-                "000000WWWW000000",
-                "00000WWWWWW00000",
-                "0000WWWWWWWW0000",
-                "0000WWWWWWWW0000",
-                "0000BWWWWWWB0000",
-                "00000BWWWWB00000",
-                "000000BWWB000000",
-                "0000000BB0000000",
-                "0000000000000000",
-                "0000000000000000",
-                "0000000000000000"
-            ],
-            'Plus': [
-                "0000000000000000",
-                "0000000000000000",
-                "0000000000000000",
-                "000000WWWW000000",
-                "000000WWWW000000",
-                "000000WWWW000000",
-                "000WWWWWWWWWW000",
-                "000WWWWWWWWWW000",
-                "000WWWWWWWWWW000",
-                "000BBBWWWWBBB000",
-                "000000WWWW000000",
-                "000000WWWW000000",
-                "000000BBBB000000",
-                "0000000000000000",
-                "0000000000000000",
-                "0000000000000000"
-            ],
-            'Arrow Up': [
-                "0000000000000000",
-                "0000000000000000",
-                "0000000000000000",
-                "0000000WW0000000",
-                "000000WWWW000000",
-                "00000WWWWWW00000",
-                "0000WWWWWWWW0000",
-                "0000BBBWWBBB0000",
-                "0000000WW0000000",
-                "0000000WW0000000",
-                "0000000WW0000000",
-                "0000000WW0000000",
-                "0000000WW0000000",
-                "0000000BB0000000",
-                "0000000000000000",
-                "0000000000000000"
-            ],
-            'Arrow Down': [
-                "0000000000000000",
-                "0000000000000000",
-                "0000000000000000",
-                "0000000WW0000000",
-                "0000000WW0000000",
-                "0000000WW0000000",
-                "0000000WW0000000",
-                "0000000WW0000000",
-                "0000000WW0000000",
-                "0000WWWWWWWW0000",
-                "0000BWWWWWWB0000",
-                "00000BWWWWB00000",
-                "000000BWWB000000",
-                "0000000BB0000000",
-                "0000000000000000",
-                "0000000000000000"
-            ]
-        }
+        """Returns read-only registry with all patterns for buttons (loads every pattern file)"""
+        manager = ButtonPatternManager
+        manager.library.check()
+        version = (manager.builtin_patterns, manager.library.version)
+        if manager.patterns_version != version:
+            manager.patterns = manager.builtin_patterns.updated(
+                (name, rows) for name, rows in manager.library.load_all().items() if rows is not None)
+            manager.patterns_version = version
+        return manager.patterns
+
+    @staticmethod
+    def get_pattern_names():
+        """Returns tuple with names of all patterns without loading pattern files"""
+        manager = ButtonPatternManager
+        manager.library.check()
+        version = (manager.builtin_patterns, manager.library.version)
+        if manager.pattern_names_version != version:
+            names = list(manager.builtin_patterns)
+            names.extend(name for name in manager.library.names() if name not in manager.builtin_patterns)
+            manager.pattern_names = tuple(names)
+            manager.pattern_names_version = version
+        return manager.pattern_names
+
+    @staticmethod
+    def get_pattern(pattern_name):
+        """Returns rows of one pattern or None (no pattern or unknown name)"""
+        rows = ButtonPatternManager.library.get(pattern_name)
+        if rows is not None:
+            return rows
+        return ButtonPatternManager.builtin_patterns.get(pattern_name)
+
+    @staticmethod
+    def set_pattern(pattern_name, rows):
+        """Add or replace pattern defined in code (registries returned earlier stay unchanged)"""
+        ButtonPatternManager.builtin_patterns = ButtonPatternManager.builtin_patterns.updated({pattern_name: rows})
+
+    @staticmethod
+    def set_pattern_colors(colors):
+        """Replace colors of pattern symbols (registries returned earlier stay unchanged)"""
+        ButtonPatternManager.pattern_colors = Registry(colors)
 
     @staticmethod
     def get_pattern_colors():
-        """Returns colors for pattern symbols in buttons"""
-        return {
-            '0': None,           # Transparent
-            'W': '#F2F2F2',      # Light (242, 242, 242)
-            'B': '#4D4D67'       # Dark (77, 77, 103)
-        }
\ No newline at end of file
+        """Returns colors for pattern symbols in buttons (shared read-only registry)"""
+        return ButtonPatternManager.pattern_colors
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+Pattern bitmaps: patterns as NumPy arrays of palette indices (optional, needs numpy)
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+try:
+    import numpy
+except ImportError:  # Bitmaps are optional, everything else works without numpy
+    numpy = None
+
+from PyQt6.QtGui import QImage
+
+# Pattern as palette indices
+# indices - read-only uint8 array (rows, columns); 0 is transparent (also unknown symbols and short rows)
+# symbols - symbols of palette indices 1, 2, ...
+PatternBitmap = namedtuple('PatternBitmap', ['indices', 'symbols'])
+
+
+class PatternBitmaps:
+    """
+    Builds, recolours and upscales pattern bitmaps without Python loops over pixels
+
+    Palette is (N, 4) uint8 RGBA array, row 0 transparent. Recolouring is a
+    palette lookup (palette[indices]) and scaling repeats every pixel into a
+    scale x scale block, so themes can be generated for many patterns at once.
+    """
+
+    @staticmethod
+    def available():
+        """Return True if numpy is installed"""
+        return numpy is not None
+
+    @staticmethod
+    def require():
+        """Raise ImportError if numpy is not installed"""
+        if numpy is None:
+            raise ImportError("Pattern bitmaps need numpy (pip install numpy)")
+
+    @staticmethod
+    def from_manager(manager, pattern_name, clip_size=None):
+        """
+        Return PatternBitmap for pattern or None if there is no pattern
+
+        Palette symbols are the symbols with color in manager.get_pattern_colors().
+        clip_size - optional (columns, rows) limit in pattern pixels
+        """
+        pattern_data = manager.get_pattern(pattern_name)
+        if pattern_data is None:
+            return None  # No pattern
+
+        colors = manager.get_pattern_colors()
+        symbols = tuple(symbol for symbol, color in colors.items() if color)
+        return PatternBitmaps.from_rows(tuple(pattern_data), symbols,
+                                        tuple(clip_size) if clip_size else None)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def from_rows(rows, symbols, clip_size=None):
+        """Build PatternBitmap from pattern rows (tuple of strings) and palette symbols"""
+        PatternBitmaps.require()
+        if clip_size:
+            max_cols, max_rows = clip_size
+            rows = tuple(row[:max_cols] for row in rows[:max_rows])
+
+        width = max((len(row) for row in rows), default=0)
+        height = len(rows)
+        # One code point per symbol, short rows padded with NUL (transparent)
+        text = ''.join(row.ljust(width, '\0') for row in rows)
+        codes = numpy.frombuffer(text.encode('utf-32-le'), dtype='<u4').reshape(height, width)
+
+        # Lookup table code point -> palette index (unknown symbols stay 0)
+        codes_used = [ord(symbol) for symbol in symbols]
+        table = numpy.zeros(max(codes_used + [int(codes.max(initial=0))]) + 1, dtype=numpy.uint8)
+        table[codes_used] = numpy.arange(1, len(symbols) + 1, dtype=numpy.uint8)
+
+        indices = table[codes]
+        indices.flags.writeable = False
+        return PatternBitmap(indices, symbols)
+
+    @staticmethod
+    def parse_color(color):
+        """Return (r, g, b, a) for '#RRGGBB' / '#AARRGGBB' or transparent for None"""
+        if not color:
+            return (0, 0, 0, 0)
+        value = color.lstrip('#')
+        if len(value) == 6:
+            return (int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16), 255)
+        if len(value) == 8:
+            return (int(value[2:4], 16), int(value[4:6], 16), int(value[6:8], 16), int(value[0:2], 16))
+        raise ValueError(f"Unsupported color '{color}', expected #RRGGBB or #AARRGGBB")
+
+    @staticmethod
+    def palette(symbols, colors):
+        """Return (len(symbols) + 1, 4) RGBA palette for symbols, symbols missing in colors are transparent"""
+        PatternBitmaps.require()
+        palette = numpy.zeros((len(symbols) + 1, 4), dtype=numpy.uint8)
+        for index, symbol in enumerate(symbols, 1):
+            palette[index] = PatternBitmaps.parse_color(colors.get(symbol))
+        return palette
+
+    @staticmethod
+    def recolor(indices, palette):
+        """Return (rows, columns, 4) RGBA pixels; palette may also be (themes, N, 4) for many themes at once"""
+        palette = numpy.asarray(palette)
+        if palette.ndim == 3:
+            return palette[:, indices]
+        return palette[indices]
+
+    @staticmethod
+    def upscale(indices, scale):
+        """Repeat every pixel of index array (last two axes are rows and columns) into scale x scale block"""
+        if scale == 1:
+            return indices
+        return indices.repeat(scale, axis=-2).repeat(scale, axis=-1)
+
+    @staticmethod
+    def render(bitmap, colors, scale=1):
+        """Return (rows * scale, columns * scale, 4) RGBA pixels of bitmap with colors (symbol -> color)"""
+        palette = PatternBitmaps.palette(bitmap.symbols, colors)
+        # Indices are upscaled before the lookup - 4 times less data to repeat than RGBA
+        return PatternBitmaps.recolor(PatternBitmaps.upscale(bitmap.indices, scale), palette)
+
+    @staticmethod
+    def render_themes(bitmap, themes, scale=1):
+        """Return (themes, rows * scale, columns * scale, 4) RGBA pixels, one image per colors mapping"""
+        palettes = numpy.stack([PatternBitmaps.palette(bitmap.symbols, colors) for colors in themes])
+        return PatternBitmaps.recolor(PatternBitmaps.upscale(bitmap.indices, scale), palettes)
+
+    @staticmethod
+    def to_image(pixels):
+        """Return QImage (RGBA8888) with copy of (rows, columns, 4) RGBA pixels"""
+        pixels = numpy.ascontiguousarray(pixels, dtype=numpy.uint8)
+        height, width = pixels.shape[:2]
+        image = QImage(pixels.data, width, height, width * 4, QImage.Format.Format_RGBA8888)
+        return image.copy()  # QImage doesn't own the numpy buffer
@@ -0,0 +1,82 @@
+"""
+Pattern compiler: turns pattern rows into merged color rectangles
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+# Compiled pattern (all coordinates in pattern pixels)
+# width, height - size of the clipped pattern
+# spans - ((color, ((row, col, length), ...)), ...) horizontal runs per color
+# rects - ((color, ((x, y, w, h), ...)), ...) runs merged into rectangles per color
+CompiledPattern = namedtuple('CompiledPattern', ['width', 'height', 'spans', 'rects'])
+
+
+class PatternCompiler:
+    """
+    Compiles patterns from ButtonPatternManager / TogglePatternManager
+
+    Result is immutable and cached, so every renderer draws a handful of
+    rectangles instead of walking the pattern strings pixel by pixel.
+    """
+
+    @staticmethod
+    def compile(manager, pattern_name, clip_size=None):
+        """
+        Return CompiledPattern for pattern or None if there is no pattern
+
+        clip_size - optional (columns, rows) limit in pattern pixels
+        """
+        pattern_data = manager.get_pattern(pattern_name)
+        if pattern_data is None:
+            return None  # No pattern
+
+        colors = manager.get_pattern_colors()
+        color_map = tuple((symbol, color) for symbol, color in colors.items() if color)
+        return PatternCompiler.compile_rows(tuple(pattern_data), color_map,
+                                            tuple(clip_size) if clip_size else None)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def compile_rows(rows, color_map, clip_size=None):
+        """Compile pattern rows (tuple of strings) with (symbol, color) pairs"""
+        if clip_size:
+            max_cols, max_rows = clip_size
+            rows = tuple(row[:max_cols] for row in rows[:max_rows])
+
+        width = max((len(row) for row in rows), default=0)
+        height = len(rows)
+        symbol_colors = dict(color_map)
+
+        # Horizontal runs of same symbol in every row
+        runs = {}  # color -> [(row, col, length), ...]
+        for row_idx, row in enumerate(rows):
+            col_idx = 0
+            while col_idx < len(row):
+                symbol = row[col_idx]
+                start = col_idx
+                while col_idx < len(row) and row[col_idx] == symbol:
+                    col_idx += 1
+                color = symbol_colors.get(symbol)
+                if color:  # Skip transparent and unknown symbols
+                    runs.setdefault(color, []).append((row_idx, start, col_idx - start))
+
+        spans = tuple((color, tuple(color_runs)) for color, color_runs in runs.items())
+        rects = tuple((color, PatternCompiler.merge_runs(color_runs)) for color, color_runs in runs.items())
+        return CompiledPattern(width, height, spans, rects)
+
+    @staticmethod
+    def merge_runs(runs):
+        """Merge runs with same columns in consecutive rows into rectangles"""
+        open_rects = {}  # (col, length) -> [x, y, w, h]
+        rects = []
+        for row_idx, col, length in runs:  # Runs are sorted by row
+            rect = open_rects.get((col, length))
+            if rect is not None and rect[1] + rect[3] == row_idx:
+                rect[3] += 1  # Extend rectangle down
+            else:
+                if rect is not None:
+                    rects.append(tuple(rect))
+                open_rects[(col, length)] = [col, row_idx, length, 1]
+        rects.extend(tuple(rect) for rect in open_rects.values())
+        rects.sort(key=lambda rect: (rect[1], rect[0]))
+        return tuple(rects)
@@ -0,0 +1,117 @@
+"""
+Pattern library - patterns stored as files in a directory
+"""
+import os
+import time
+
+
+class PatternLibrary:
+    """
+    Directory of pattern files, every file is parsed on first use
+
+    File <name>.txt holds one pattern: one row of symbols per line, empty lines
+    and lines starting with '#' are skipped. Lookups are served from the cached
+    directory listing and parsed files; the directory and loaded files are
+    checked for changes by refresh(), which lookups call at most every
+    check_interval seconds.
+    """
+    EXTENSION = '.txt'
+    CHECK_INTERVAL = 2.0  # Seconds
+
+    def __init__(self, directory, check_interval=CHECK_INTERVAL):
+        self.directory = directory
+        self.check_interval = check_interval
+        self.checked = None  # time.monotonic() of last refresh
+        self.listing_mtime = None
+        self.files = {}  # name -> path
+        self.patterns = {}  # name -> (mtime_ns, rows)
+        self.loads = 0
+        self.version = 0  # Changes when refresh finds a changed listing or pattern file
+
+    def check(self):
+        """Refresh if the last refresh is older than check_interval"""
+        if self.checked is None or time.monotonic() - self.checked >= self.check_interval:
+            self.refresh()
+
+    def refresh(self):
+        """Rescan directory if it changed, forget parsed patterns whose file changed, return version"""
+        self.checked = time.monotonic()
+        changed = self.scan()
+        for name, (mtime, _) in list(self.patterns.items()):
+            if self.file_mtime(self.files[name]) != mtime:
+                del self.patterns[name]  # Parsed again on next get
+                changed = True
+        if changed:
+            self.version += 1
+        return self.version
+
+    def scan(self):
+        """Rescan directory if it changed since last scan, return True if it did"""
+        try:
+            mtime = os.stat(self.directory).st_mtime_ns
+        except OSError:
+            mtime = None  # No directory - empty library
+        if mtime == self.listing_mtime:
+            return False
+        self.listing_mtime = mtime
+
+        files = {}
+        if mtime is not None:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    name, extension = os.path.splitext(entry.name)
+                    if extension == self.EXTENSION and entry.is_file():
+                        files[name] = entry.path
+        self.files = files
+        # Forget parsed patterns of removed files
+        for name in [name for name in self.patterns if name not in files]:
+            del self.patterns[name]
+        return True
+
+    def names(self):
+        """Return sorted names of all patterns without loading them"""
+        self.check()
+        return sorted(self.files)
+
+    def __contains__(self, name):
+        self.check()
+        return name in self.files
+
+    def get(self, name):
+        """Return pattern rows (tuple of strings) or None if there is no such pattern"""
+        self.check()
+        cached = self.patterns.get(name)
+        if cached is not None:
+            return cached[1]
+
+        path = self.files.get(name)
+        if path is None:
+            return None
+        mtime = self.file_mtime(path)
+        if mtime is None:
+            return None  # Removed after last scan
+        rows = self.parse(path)
+        self.patterns[name] = (mtime, rows)
+        self.loads += 1
+        return rows
+
+    def load_all(self):
+        """Return dict of all patterns (loads every file that isn't cached)"""
+        return {name: self.get(name) for name in self.names()}
+
+    @staticmethod
+    def parse(path):
+        """Read pattern file and return tuple of rows"""
+        with open(path, encoding='utf-8') as pattern_file:
+            return tuple(
+                line.strip() for line in pattern_file
+                if line.strip() and not line.lstrip().startswith('#')
+            )
+
+    @staticmethod
+    def file_mtime(path):
+        """Return modification time of file in ns or None if it can't be read"""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
@@ -1,6 +1,7 @@
 """
 Менеджер кольорових пресетів
 """
+from .registry import Registry
 
 class ButtonPresetManager:
     """
@@ -11,41 +12,59 @@ class ButtonPresetManager:
     - MC_AE2_DARK: темна тема Applied Energistics 2
     """
 
+    # Пресети будуються один раз і спільні для всіх викликів
+    presets = Registry.freeze({
+        'MC_AE2_LIGHT': {
+            'button_normal': '#9A9FB4',
+            'button_hover': '#9CD3FF',
+            'button_selected': '#9CD3FF',
+            'border_normal': '#ADB0C4',
+            'border_hover': '#DAFFFF',
+            'border_selected': '#DAFFFF',
+            'bottom_normal': '#9A9FB4',
+            'bottom_hover': '#708CBA',
+            'indicator_color': '#DAFFFF',
+            'indicator_line_color': '#708CBA',
+            'bottom_space_normal': '#696D88',
+            'bottom_space_hover': '#708CBA',
+            'bottom_space_selected': '#708CBA'
+        },
+        'MC_AE2_DARK': {
+            'button_normal': '#696D88',
+            'button_hover': '#9CD3FF',
+            'button_pressed': '#9CD3FF',
+            'button_selected': '#9CD3FF',
+            'border_normal': '#878FA5',
+            'border_hover': '#DAFFFF',
+            'border_pressed': '#DAFFFF',
+            'border_selected': '#DAFFFF',
+            'bottom_normal': '#4D4D67',
+            'bottom_hover': '#708CBA',
+            'bottom_pressed': '#708CBA',
+            'indicator_color': '#DAFFFF',
+            'indicator_line_color': '#708CBA',
+            'bottom_space_normal': '#696D88',
+            'bottom_space_hover': '#708CBA',
+            'bottom_space_selected': '#708CBA'
+        }
+    })
+
     @staticmethod
     def get_presets():
-        """Повертає словник з усіма доступними пресетами"""
-        return {
-            'MC_AE2_LIGHT': {
-                'button_normal': '#9A9FB4',
-                'button_hover': '#9CD3FF',
-                'button_selected': '#9CD3FF',
-                'border_normal': '#ADB0C4',
-                'border_hover': '#DAFFFF',
-                'border_selected': '#DAFFFF',
-                'bottom_normal': '#9A9FB4',
-                'bottom_hover': '#708CBA',
-                'indicator_color': '#DAFFFF',
-                'indicator_line_color': '#708CBA',
-                'bottom_space_normal': '#696D88',
-                'bottom_space_hover': '#708CBA',
-                'bottom_space_selected': '#708CBA'
-            },
-            'MC_AE2_DARK': {
-                'button_normal': '#696D88',
-                'button_hover': '#9CD3FF',
-                'button_pressed': '#9CD3FF',
-                'button_selected': '#9CD3FF',
-                'border_normal': '#878FA5',
-                'border_hover': '#DAFFFF',
-                'border_pressed': '#DAFFFF',
-                'border_selected': '#DAFFFF',
-                'bottom_normal': '#4D4D67',
-                'bottom_hover': '#708CBA',
-                'bottom_pressed': '#708CBA',
-                'indicator_color': '#DAFFFF',
-                'indicator_line_color': '#708CBA',
-                'bottom_space_normal': '#696D88',
-                'bottom_space_hover': '#708CBA',
-                'bottom_space_selected': '#708CBA'
-            }
-        }
\ No newline at end of file
+        """Повертає реєстр (лише для читання) з усіма доступними пресетами"""
+        return ButtonPresetManager.presets
+
+    @staticmethod
+    def get_preset(preset_name):
+        """Повертає кольори одного пресету або None (невідома назва)"""
+        return ButtonPresetManager.presets.get(preset_name)
+
+    @staticmethod
+    def set_preset(preset_name, colors):
+        """Додає або замінює пресет (раніше отримані реєстри не змінюються)"""
+        ButtonPresetManager.presets = ButtonPresetManager.presets.updated({preset_name: colors})
+
+    @staticmethod
+    def remove_preset(preset_name):
+        """Видаляє пресет (раніше отримані реєстри не змінюються)"""
+        ButtonPresetManager.presets = ButtonPresetManager.presets.without(preset_name)
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+Read-only registry - mapping shared by all callers, changed only by copy
+"""
+from collections.abc import Mapping
+
+
+class Registry(Mapping):
+    """
+    Immutable mapping of names to values
+
+    Lookups go straight to the underlying dict and allocate nothing.
+    Changes never touch an existing registry: updated() and without()
+    return a new registry sharing all unchanged values (copy-on-write).
+    """
+    __slots__ = ('_entries',)
+
+    def __init__(self, entries=()):
+        self._entries = dict(entries)
+
+    @classmethod
+    def freeze(cls, data):
+        """Build registry from nested data: dicts become registries, lists become tuples"""
+        if isinstance(data, Registry):
+            return data
+        if isinstance(data, Mapping):
+            return cls((key, cls.freeze(value)) for key, value in data.items())
+        if isinstance(data, list):
+            return tuple(cls.freeze(value) for value in data)
+        return data
+
+    def __getitem__(self, name):
+        return self._entries[name]
+
+    def get(self, name, default=None):
+        return self._entries.get(name, default)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"Registry({self._entries!r})"
+
+    def updated(self, entries):
+        """Return new registry with entries added or replaced"""
+        new_entries = dict(self._entries)
+        new_entries.update((name, self.freeze(value)) for name, value in dict(entries).items())
+        return Registry(new_entries)
+
+    def without(self, *names):
+        """Return new registry without given names"""
+        return Registry((name, value) for name, value in self._entries.items() if name not in names)
+
+    def to_dict(self):
+        """Return mutable copy (nested registries become dicts)"""
+        return {
+            name: value.to_dict() if isinstance(value, Registry) else value
+            for name, value in self._entries.items()
+        }
@@ -1,6 +1,10 @@
 """
 Менеджер патернів для перемикачів (toggle switch)
 """
+import os
+
+from .pattern_library import PatternLibrary
+from .registry import Registry
 
 class TogglePatternManager:
     """
@@ -9,27 +13,85 @@ class TogglePatternManager:
     Підтримує накладання патернів на підложку toggle switch
     """
 
+    # Файли патернів patterns/toggles/<назва>.txt, файл перекриває вбудований патерн з тією ж назвою
+    library = PatternLibrary(os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'patterns', 'toggles'))
+
+    # Патерни та кольори, визначені в коді, будуються один раз і спільні для всіх
+    builtin_patterns = Registry.freeze({
+        'None': None,  # Без патерну
+        'Standard': [
+            "000000000000000000",
+            "000000000000000000",
+            "0000I000000000OOO0",
+            "0000I00000000O000O",
+            "0000I00000000O000O",
+            "0000I00000000O000O",
+            "0000I000000000OOO0"
+        ]
+    })
+
+    pattern_colors = Registry({
+        '0': None,           # Прозорий
+        'I': '#DAFFFF',      # (218, 255, 255)
+        'O': '#878FA5'       # (135, 143, 165)
+    })
+
+    # Реєстр вбудованих і файлових патернів, перебудовується лише після змін
+    patterns = None
+    patterns_version = None
+    pattern_names = None
+    pattern_names_version = None
+
+    @staticmethod
+    def get_builtin_patterns():
+        """Повертає реєстр (лише для читання) з патернами, визначеними в коді"""
+        return TogglePatternManager.builtin_patterns
+
     @staticmethod
     def get_patterns():
-        """Повертає словник з усіма доступними патернами"""
-        return {
-            'None': None,  # Без патерну
-            'Standard': [
-                "000000000000000000",
-                "000000000000000000",
-                "0000I000000000OOO0",
-                "0000I00000000O000O",
-                "0000I00000000O000O",
-                "0000I00000000O000O",
-                "0000I000000000OOO0"
-            ]
-        }
+        """Повертає реєстр (лише для читання) з усіма патернами (завантажує всі файли патернів)"""
+        manager = TogglePatternManager
+        manager.library.check()
+        version = (manager.builtin_patterns, manager.library.version)
+        if manager.patterns_version != version:
+            manager.patterns = manager.builtin_patterns.updated(
+                (name, rows) for name, rows in manager.library.load_all().items() if rows is not None)
+            manager.patterns_version = version
+        return manager.patterns
+
+    @staticmethod
+    def get_pattern_names():
+        """Повертає кортеж з назвами всіх патернів без завантаження файлів"""
+        manager = TogglePatternManager
+        manager.library.check()
+        version = (manager.builtin_patterns, manager.library.version)
+        if manager.pattern_names_version != version:
+            names = list(manager.builtin_patterns)
+            names.extend(name for name in manager.library.names() if name not in manager.builtin_patterns)
+            manager.pattern_names = tuple(names)
+            manager.pattern_names_version = version
+        return manager.pattern_names
+
+    @staticmethod
+    def get_pattern(pattern_name):
+        """Повертає рядки одного патерну або None (без патерну чи невідома назва)"""
+        rows = TogglePatternManager.library.get(pattern_name)
+        if rows is not None:
+            return rows
+        return TogglePatternManager.builtin_patterns.get(pattern_name)
+
+    @staticmethod
+    def set_pattern(pattern_name, rows):
+        """Додає або замінює патерн, визначений у коді (раніше отримані реєстри не змінюються)"""
+        TogglePatternManager.builtin_patterns = TogglePatternManager.builtin_patterns.updated({pattern_name: rows})
+
+    @staticmethod
+    def set_pattern_colors(colors):
+        """Замінює кольори символів патернів (раніше отримані реєстри не змінюються)"""
+        TogglePatternManager.pattern_colors = Registry(colors)
 
     @staticmethod
     def get_pattern_colors():
-        """Повертає кольори для символів патернів"""
-        return {
-            '0': None,           # Прозорий
-            'I': '#DAFFFF',      # (218, 255, 255)
-            'O': '#878FA5'       # (135, 143, 165)
-        }
\ No newline at end of file
+        """Повертає кольори для символів патернів (спільний реєстр лише для читання)"""
+        return TogglePatternManager.pattern_colors
\ No newline at end of file
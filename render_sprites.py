@@ -0,0 +1,75 @@
+"""
+Headless rendering of widget sprites - PNG for every visual state
+
+Usage: python render_sprites.py specs.json output_dir [--slider-positions 0 0.5 1] [--atlas NAME]
+                                [--processes N]
+specs.json - list of widget specs (see widgets.widget_specs.WidgetSpecs)
+--atlas - pack sprites into atlas pages with JSON manifest instead of separate PNGs
+--processes - render in N worker processes (0 - one per CPU core)
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+# Works without display, the platform can still be overridden from environment
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication
+
+from widgets.sprite_renderer import SpriteRenderer
+from widgets.texture_atlas import TextureAtlasExporter
+from widgets.render_pool import RenderPool
+
+def parse_args(argv):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Render widget sprites without UI")
+    parser.add_argument('specs', help="JSON file with list of widget specs")
+    parser.add_argument('output_dir', help="Directory for PNG files")
+    parser.add_argument('--slider-positions', type=float, nargs='+',
+                        default=list(SpriteRenderer.SLIDER_POSITIONS),
+                        help="Slider values (0.0 - 1.0) to render")
+    parser.add_argument('--atlas', metavar='NAME',
+                        help="Write atlas pages NAME_<page>.png and manifest NAME.json")
+    parser.add_argument('--page-size', type=int, default=TextureAtlasExporter.PAGE_SIZE,
+                        help="Maximum atlas page size in pixels")
+    parser.add_argument('--processes', type=int, default=1,
+                        help="Number of worker processes, 0 - one per CPU core, 1 - render in this process")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Render all specs from file"""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    with open(args.specs, encoding='utf-8') as spec_file:
+        specs = json.load(spec_file)
+
+    start = time.perf_counter()
+    renderer = SpriteRenderer(args.slider_positions)
+    pool = None
+    if args.processes != 1:
+        pool = RenderPool(args.processes or None, args.slider_positions)
+
+    failures = []
+    if args.atlas:
+        exporter = TextureAtlasExporter(renderer, args.page_size)
+        manifest = exporter.export(specs, args.output_dir, args.atlas, pool)
+        failures = [(failure['index'], failure['error']) for failure in manifest['failed']]
+        elapsed = time.perf_counter() - start
+        print(f"Packed {len(manifest['sprites'])} sprites for {len(specs)} specs "
+              f"into {len(manifest['pages'])} pages in {elapsed:.2f}s")
+    else:
+        writer = renderer if pool is None else pool
+        paths, failed = writer.write_sprites(specs, args.output_dir)
+        failures = sorted((result.index, result.error) for result in failed)
+        elapsed = time.perf_counter() - start
+        print(f"Rendered {len(paths)} sprites for {len(specs)} specs in {elapsed:.2f}s")
+
+    for index, error in failures:
+        print(f"Spec {index} failed: {error}", file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Soak test - memory and object leaks of generate/clear cycles in WidgetGenerator
+
+Usage: python soak_widgets.py [output.json] [--types button slider] [--cycles N]
+                              [--count N] [--warmup N] [--rss-limit MB]
+output.json - samples of every cycle and verdicts (default: soak.json)
+
+Every cycle generates --count widgets of one type (patterns, scales and
+orientations vary), scrolls the gallery through all of them so every cell
+gets a live widget (sliders flip orientation, radio pairs change selection),
+clears the gallery and flushes deferred deletes. After each cycle live Qt
+objects, Python objects of the project and process RSS are sampled. Warmup
+cycles fill caches and aren't judged; after them object counts must not
+grow at all and RSS must not grow by more than --rss-limit.
+Exit code is 1 if anything keeps growing.
+"""
+import os
+import gc
+import sys
+import json
+import time
+import argparse
+import contextlib
+
+from benchmark_widgets import git_commit, variants  # Also selects offscreen platform
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QObject, QEvent
+
+from widgets.widget_specs import WidgetSpecs
+from widgets.widget_generator import WidgetGenerator
+
+RESULT_VERSION = 1
+SCALES = (2, 3, 4, 6)
+PROJECT_PACKAGES = ('widgets', 'managers')
+COUNTERS = ('widgets', 'qobjects', 'wrappers', 'project_objects')  # Must not grow after warmup
+
+def rss_kb():
+    """Return resident set size of process in KB (peak RSS where current isn't available, None on Windows)"""
+    try:
+        with open('/proc/self/statm', encoding='ascii') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak  # macOS reports bytes
+
+def object_counts(app):
+    """Return live object counters (see COUNTERS)"""
+    wrappers = 0
+    project_objects = 0
+    for obj in gc.get_objects():
+        if isinstance(obj, QObject):
+            wrappers += 1
+        if type(obj).__module__.split('.', 1)[0] in PROJECT_PACKAGES:
+            project_objects += 1
+    return {
+        'widgets': len(app.allWidgets()),
+        'qobjects': sum(1 + len(widget.findChildren(QObject)) for widget in app.topLevelWidgets()),
+        'wrappers': wrappers,
+        'project_objects': project_objects
+    }
+
+def growth(values):
+    """Return how much the lowest value of the last third exceeds the highest of the first third"""
+    third = max(1, len(values) // 3)
+    return min(values[-third:]) - max(values[:third])
+
+class WidgetSoak:
+    """Generate and clear widgets of one type in a hidden WidgetGenerator"""
+
+    def __init__(self, app, count):
+        self.app = app
+        self.count = count
+        self.generator = WidgetGenerator()
+        self.generator.resize(800, 600)
+        self.generator.show()
+
+    def specs(self, widget_type):
+        """Return count specs of widget type with varying pattern/orientation and scale"""
+        choices = [(variant, scale) for variant in variants(widget_type) for scale in SCALES]
+        specs = []
+        for index in range(self.count):
+            variant, scale = choices[index % len(choices)]
+            spec = {'type': widget_type, 'scale': scale}
+            if widget_type == 'slider':
+                spec['orientation'] = variant
+            elif widget_type in WidgetSpecs.DEFAULT_PATTERNS:
+                spec['pattern'] = variant
+            specs.append(spec)
+        return specs
+
+    def flush(self):
+        """Run deferred deletes and pending events, collect garbage"""
+        self.app.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        self.app.processEvents()
+        self.app.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        gc.collect()
+
+    def scroll_through(self):
+        """Scroll gallery page by page, every cell gets a live widget on the way"""
+        gallery = self.generator.gallery
+        scroll_bar = gallery.verticalScrollBar()
+        step = max(1, gallery.viewport().height())
+        for value in range(0, scroll_bar.maximum() + step, step):
+            scroll_bar.setValue(value)
+            gallery.update_live_widgets()
+            for widget in gallery.live_widgets.values():
+                self.exercise(widget)
+            self.flush()
+
+    @staticmethod
+    def exercise(widget):
+        """Run operations that rebuild widget parts (slider orientation, radio selection)"""
+        if hasattr(widget, 'set_orientation'):
+            orientation = widget.orientation
+            widget.set_orientation('horizontal' if orientation == 'vertical' else 'vertical')
+            widget.set_orientation(orientation)
+        radio_group = getattr(widget, 'radio_group', None)
+        if radio_group is not None:
+            for radio_button in reversed(radio_group.radio_buttons):
+                radio_group.on_radio_clicked(radio_button)
+
+    def cycle(self, widget_type):
+        """Generate, scroll through and clear widgets, return (widgets created, samples)"""
+        self.generator.generate_widgets(self.specs(widget_type))
+        created = self.generator.gallery.count()
+        self.scroll_through()
+        self.generator.clear_generated_buttons()
+        self.flush()
+        sample = object_counts(self.app)
+        sample['rss_kb'] = rss_kb()
+        return created, sample
+
+def judge(samples, warmup, rss_limit_kb):
+    """Return {counter: {'growth': value, 'failed': bool}} for samples after warmup"""
+    judged = samples[warmup:]
+    verdicts = {}
+    for counter in COUNTERS:
+        value = growth([sample[counter] for sample in judged])
+        verdicts[counter] = {'growth': value, 'failed': value > 0}
+    rss = [sample['rss_kb'] for sample in judged]
+    if None not in rss:
+        value = growth(rss)
+        verdicts['rss_kb'] = {'growth': value, 'failed': value > rss_limit_kb}
+    return verdicts
+
+def parse_args(argv):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Check generate/clear cycles for leaks")
+    parser.add_argument('output', nargs='?', default='soak.json', help="JSON file for samples")
+    parser.add_argument('--types', nargs='+', choices=WidgetSpecs.TYPES, default=list(WidgetSpecs.TYPES),
+                        help="Widget types to soak")
+    parser.add_argument('--cycles', type=int, default=12, help="Judged generate/clear cycles per type")
+    parser.add_argument('--count', type=int, default=500, help="Widgets generated per cycle")
+    parser.add_argument('--warmup', type=int, default=3, help="Cycles per type that fill caches")
+    parser.add_argument('--rss-limit', type=float, default=16.0, help="Allowed RSS growth in MB")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Run soak test of all types, write samples and return 1 on growth"""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    soak = WidgetSoak(app, max(1, args.count))
+    cycles = max(3, args.cycles)
+    warmup = max(0, args.warmup)
+
+    report_types = {}
+    failed = False
+    start = time.perf_counter()
+    # Signal handlers of generated widgets print every change
+    quiet = open(os.devnull, 'w', encoding='utf-8')
+    for widget_type in args.types:
+        samples = []
+        created = 0
+        for cycle in range(warmup + cycles):
+            with contextlib.redirect_stdout(quiet):
+                count, sample = soak.cycle(widget_type)
+            created += count
+            sample['cycle'] = cycle
+            samples.append(sample)
+        verdicts = judge(samples, warmup, int(args.rss_limit * 1024))
+        failed_counters = [counter for counter, verdict in verdicts.items() if verdict['failed']]
+        failed = failed or bool(failed_counters)
+        report_types[widget_type] = {'created': created, 'samples': samples, 'verdicts': verdicts}
+
+        last = samples[-1]
+        rss = f"{last['rss_kb'] / 1024:.1f} MB" if last['rss_kb'] is not None else "n/a"
+        print(f"{widget_type:>8}: {created} widgets, widgets {last['widgets']}, qobjects {last['qobjects']}, "
+              f"wrappers {last['wrappers']}, rss {rss} - "
+              + (f"GROWING: {', '.join(failed_counters)}" if failed_counters else "ok"))
+    elapsed = time.perf_counter() - start
+    quiet.close()
+
+    report = {
+        'version': RESULT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'commit': git_commit(),
+        'settings': {'types': args.types, 'cycles': cycles, 'count': args.count, 'warmup': warmup,
+                     'rss_limit_mb': args.rss_limit},
+        'passed': not failed,
+        'types': report_types
+    }
+    with open(args.output, 'w', encoding='utf-8') as output_file:
+        json.dump(report, output_file, indent=2)
+
+    print(f"\n{'FAILED' if failed else 'passed'} in {elapsed:.1f}s, samples written to {args.output}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
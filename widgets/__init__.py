@@ -1,19 +1,75 @@
 """
 Minecraft-стильні віджети
+
+Підмодулі завантажуються при першому зверненні до імені (PEP 562), тож
+`from widgets import MinecraftButton` не імпортує генератор та інші віджети.
 """
-from .minecraft_button import MinecraftButton
-from .minecraft_radio_button import MinecraftRadioButton, MinecraftRadioGroup
-from .minecraft_toggle_button import MinecraftToggleButton
-from .minecraft_slider import MinecraftSlider
-from .minecraft_entry import MinecraftEntry
-from .widget_generator import WidgetGenerator
-
-__all__ = [
-    'MinecraftButton',
-    'MinecraftRadioButton',
-    'MinecraftRadioGroup',
-    'MinecraftToggleButton',
-    'MinecraftSlider',
-    'MinecraftEntry',
-    'ButtonGenerator'
-]
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+# Публічне ім'я -> підмодуль, що його визначає
+_LAZY_NAMES = {
+    'MinecraftButton': 'minecraft_button',
+    'MinecraftRadioButton': 'minecraft_radio_button',
+    'MinecraftRadioGroup': 'minecraft_radio_button',
+    'MinecraftToggleButton': 'minecraft_toggle_button',
+    'MinecraftSlider': 'minecraft_slider',
+    'MinecraftEntry': 'minecraft_entry',
+    'WidgetStyle': 'widget_style',
+    'ButtonStyle': 'minecraft_button',
+    'RadioButtonStyle': 'minecraft_radio_button',
+    'ToggleButtonStyle': 'minecraft_toggle_button',
+    'SliderStyle': 'minecraft_slider',
+    'EntryStyle': 'minecraft_entry',
+    'PatternPixmapCache': 'pattern_cache',
+    'BorderedBox': 'bordered_box',
+    'WidgetGallery': 'widget_gallery',
+    'WidgetSpecs': 'widget_specs',
+    'SpriteRenderer': 'sprite_renderer',
+    'RenderResult': 'sprite_renderer',
+    'TextureAtlasExporter': 'texture_atlas',
+    'MaxRectsBin': 'texture_atlas',
+    'RenderPool': 'render_pool',
+    'CodeExporter': 'code_exporter',
+    'WidgetCounters': 'instrumentation',
+    'PerformanceMonitor': 'performance_hud',
+    'PerformanceHud': 'performance_hud',
+    'WidgetGenerator': 'widget_generator',
+}
+
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    """Імпортує підмодуль при першому зверненні до його імені"""
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # __import__ (не importlib) лишає ліниві імпорти видимими в `python -X importtime`
+    module = __import__(f"{__name__}.{module_name}", fromlist=(name,))
+    value = getattr(module, name)
+    globals()[name] = value  # Наступні звернення вже не проходять через __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
+
+if TYPE_CHECKING:
+    from .minecraft_button import MinecraftButton, ButtonStyle
+    from .minecraft_radio_button import MinecraftRadioButton, MinecraftRadioGroup, RadioButtonStyle
+    from .minecraft_toggle_button import MinecraftToggleButton, ToggleButtonStyle
+    from .minecraft_slider import MinecraftSlider, SliderStyle
+    from .minecraft_entry import MinecraftEntry, EntryStyle
+    from .widget_style import WidgetStyle
+    from .pattern_cache import PatternPixmapCache
+    from .bordered_box import BorderedBox
+    from .widget_gallery import WidgetGallery
+    from .widget_specs import WidgetSpecs
+    from .sprite_renderer import SpriteRenderer, RenderResult
+    from .texture_atlas import TextureAtlasExporter, MaxRectsBin
+    from .render_pool import RenderPool
+    from .code_exporter import CodeExporter
+    from .instrumentation import WidgetCounters
+    from .performance_hud import PerformanceMonitor, PerformanceHud
+    from .widget_generator import WidgetGenerator
@@ -0,0 +1,64 @@
+"""
+Bordered box - common frame of all Minecraft-style widgets
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+from PyQt6.QtCore import QRect
+
+# Box geometry in real pixels relative to box origin (rects are shared, don't modify them)
+# outer - whole box with outer border
+# top_border - top row of outer border
+# body - main area (inner border included)
+# body_fill - main area inside inner border
+# bottom_space - space under main area (None if box has no bottom space)
+BoxGeometry = namedtuple('BoxGeometry', ['outer', 'top_border', 'body', 'body_fill', 'bottom_space'])
+
+
+class BorderedBox:
+    """
+    Box with outer border, main area with inner border and bottom space
+
+    Layout in proportional pixels (width x height of main area):
+    - outer border of 1 pixel around everything
+    - main area, optionally with 1 pixel inner border
+    - bottom space under main area
+    """
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def geometry(width, height, scale, bottom_space=2):
+        """Return cached BoxGeometry for main area size, scale and bottom space height"""
+        outer = QRect(0, 0, (width + 2) * scale, (height + bottom_space + 2) * scale)
+        top_border = QRect(0, 0, outer.width(), scale)
+        body = QRect(scale, scale, width * scale, height * scale)
+        body_fill = body.adjusted(scale, scale, -scale, -scale)
+        if bottom_space:
+            space = QRect(scale, (1 + height) * scale, width * scale, bottom_space * scale)
+        else:
+            space = None
+        return BoxGeometry(outer, top_border, body, body_fill, space)
+
+    @staticmethod
+    def paint(painter, geometry, border_color, body_color=None, body_border_color=None,
+              bottom_color=None, offset=0, top_border_color=None):
+        """
+        Draw box in a single pass
+
+        offset - main area moves down and bottom space decreases by offset (press animation)
+        top_border_color - color of top border if it differs from outer border
+        body_border_color - inner border color, without it main area is filled with body_color
+        """
+        painter.fillRect(geometry.outer, border_color)
+        if top_border_color is not None:
+            painter.fillRect(geometry.top_border, top_border_color)
+
+        if bottom_color is not None and geometry.bottom_space is not None:
+            painter.fillRect(geometry.bottom_space.adjusted(0, offset, 0, 0), bottom_color)
+
+        if body_border_color is not None:
+            painter.fillRect(geometry.body.translated(0, offset), body_border_color)
+            if body_color is not None:
+                painter.fillRect(geometry.body_fill.translated(0, offset), body_color)
+        elif body_color is not None:
+            painter.fillRect(geometry.body.translated(0, offset), body_color)
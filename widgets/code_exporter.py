@@ -0,0 +1,530 @@
+"""
+Code exporter - standalone widget modules with precomputed drawing
+"""
+import re
+import base64
+import pprint
+from string import Template
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage
+
+from managers import PatternCompiler
+from .sprite_renderer import SpriteRenderer, encode_png
+from .widget_specs import WidgetSpecs
+
+
+# Module header, $frames_code loads and draws frames of the chosen mode
+MODULE_TEMPLATE = Template('''"""
+$class_name - Minecraft-style $widget_type exported by Widget Generator
+
+Generated file, don't edit. Geometry, colors and pattern are precomputed:
+constructing the widget only sets its size and every state is drawn by a
+single paintEvent without child frames. Needs only PyQt6.
+"""
+$imports
+
+SIZE = $size
+
+$frames_code
+
+$class_code''')
+
+# Frames as color rectangles: state -> ((color, ((x, y, w, h), ...)), ...)
+RECTS_FRAMES = Template('''# state -> ((color, ((x, y, width, height), ...)), ...) in pixels
+FRAME_DATA = $frame_data
+
+
+def load_frame(data):
+    """Return ((QColor, (QRect, ...)), ...) for frame data"""
+    return tuple((QColor(color), tuple(QRect(*rect) for rect in rects)) for color, rects in data)
+
+
+def draw_frame(painter, frame, x=0, y=0):
+    """Fill all rectangles of frame moved by (x, y)"""
+    painter.translate(x, y)
+    for color, rects in frame:
+        for rect in rects:
+            painter.fillRect(rect, color)
+    painter.translate(-x, -y)''')
+
+# Frames as embedded PNG images
+IMAGE_FRAMES = Template('''# state -> PNG image (base64)
+FRAME_DATA = $frame_data
+
+
+def load_frame(data):
+    """Return QImage decoded from base64 PNG"""
+    return QImage.fromData(base64.b64decode(data), "PNG")
+
+
+def draw_frame(painter, frame, x=0, y=0):
+    """Draw frame image at (x, y)"""
+    painter.drawImage(x, y, frame)''')
+
+BUTTON_CLASS = Template('''ANIMATION_ENABLED = $animation_enabled
+
+
+class $class_name(QWidget):
+    """Button with normal, hover and pressed states"""
+    clicked = pyqtSignal()
+
+    frames = None  # state -> loaded frame, shared by all instances
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        if $class_name.frames is None:
+            $class_name.frames = {state: load_frame(data) for state, data in FRAME_DATA.items()}
+        self.setFixedSize(*SIZE)
+        self.hover_state = False
+        self.pressed_state = False
+
+    def paintEvent(self, event):
+        if self.pressed_state:
+            state = 'pressed'
+        elif self.hover_state:
+            state = 'hover'
+        else:
+            state = 'normal'
+        painter = QPainter(self)
+        draw_frame(painter, self.frames[state])
+        painter.end()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton and ANIMATION_ENABLED:
+            self.pressed_state = True
+            self.update()
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            if self.pressed_state:
+                self.pressed_state = False
+                self.update()
+            if self.rect().contains(event.pos()):
+                self.clicked.emit()
+        super().mouseReleaseEvent(event)
+
+    def enterEvent(self, event):
+        self.hover_state = True
+        self.update()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.hover_state = False
+        self.update()
+        super().leaveEvent(event)
+''')
+
+RADIO_CLASS = Template('''RADIO_WIDTH = $radio_width  # Clicks on text don't change selection
+
+
+class $class_name(QWidget):
+    """Radio button with normal, hover and selected states"""
+    clicked = pyqtSignal()
+    stateChanged = pyqtSignal(bool)  # True when selected
+
+    frames = None  # state -> loaded frame, shared by all instances
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        if $class_name.frames is None:
+            $class_name.frames = {state: load_frame(data) for state, data in FRAME_DATA.items()}
+        self.setFixedSize(*SIZE)
+        self.hover_state = False
+        self.selected = False
+
+    def paintEvent(self, event):
+        if self.selected:
+            state = 'selected'
+        elif self.hover_state:
+            state = 'hover'
+        else:
+            state = 'normal'
+        painter = QPainter(self)
+        draw_frame(painter, self.frames[state])
+        painter.end()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton and event.pos().x() <= RADIO_WIDTH:
+            self.selected = not self.selected
+            self.update()
+            self.clicked.emit()
+            self.stateChanged.emit(self.selected)
+        super().mousePressEvent(event)
+
+    def enterEvent(self, event):
+        self.hover_state = True
+        self.update()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.hover_state = False
+        self.update()
+        super().leaveEvent(event)
+
+    def set_selected(self, selected):
+        if self.selected != selected:
+            self.selected = selected
+            self.update()
+            self.stateChanged.emit(self.selected)
+
+    def is_selected(self):
+        return self.selected
+''')
+
+TOGGLE_CLASS = Template('''class $class_name(QWidget):
+    """Toggle switch with off/on states, each with hover variant"""
+    clicked = pyqtSignal()
+    stateChanged = pyqtSignal(bool)  # True when enabled
+
+    frames = None  # state -> loaded frame, shared by all instances
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        if $class_name.frames is None:
+            $class_name.frames = {state: load_frame(data) for state, data in FRAME_DATA.items()}
+        self.setFixedSize(*SIZE)
+        self.toggled = False
+        self.hover_state = False
+        self.hover_active = True  # Hover effect is off after click until mouse leaves
+
+    def paintEvent(self, event):
+        state = 'on' if self.toggled else 'off'
+        if self.hover_state and self.hover_active:
+            state += '_hover'
+        painter = QPainter(self)
+        draw_frame(painter, self.frames[state])
+        painter.end()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.hover_active = False
+            self.toggled = not self.toggled
+            self.update()
+            self.clicked.emit()
+            self.stateChanged.emit(self.toggled)
+        super().mousePressEvent(event)
+
+    def enterEvent(self, event):
+        self.hover_state = True
+        self.update()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.hover_state = False
+        self.hover_active = True
+        self.update()
+        super().leaveEvent(event)
+
+    def set_toggled(self, toggled):
+        if self.toggled != toggled:
+            self.toggled = toggled
+            self.update()
+            self.stateChanged.emit(self.toggled)
+
+    def is_toggled(self):
+        return self.toggled
+''')
+
+SLIDER_CLASS = Template('''VERTICAL = $vertical
+HANDLE_SIZE = $handle_size  # (width, height)
+TRACK_START = $track_start  # First handle position along the track
+TRACK_RANGE = $track_range  # Handle travel in pixels
+HANDLE_CROSS = $handle_cross  # Handle position across the track
+
+
+class $class_name(QWidget):
+    """Slider, track and handle are drawn in one paintEvent"""
+    valueChanged = pyqtSignal(float)  # 0.0 - 1.0 (while dragging)
+    valueCommitted = pyqtSignal(float)  # Final value (release, set_value)
+
+    frames = None  # 'track' / 'handle' -> loaded frame, shared by all instances
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        if $class_name.frames is None:
+            $class_name.frames = {state: load_frame(data) for state, data in FRAME_DATA.items()}
+        self.setFixedSize(*SIZE)
+        self.value = 0.0
+        self.drag_offset = None  # Cursor position inside handle while dragging
+
+    def handle_position(self):
+        """Return (x, y) of handle"""
+        along = TRACK_START + int(self.value * TRACK_RANGE) if TRACK_RANGE > 0 else TRACK_START
+        return (HANDLE_CROSS, along) if VERTICAL else (along, HANDLE_CROSS)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        draw_frame(painter, self.frames['track'])
+        draw_frame(painter, self.frames['handle'], *self.handle_position())
+        painter.end()
+
+    def move_handle(self, position):
+        """Move handle start to position along the track"""
+        if TRACK_RANGE <= 0:
+            return
+        value = (max(TRACK_START, min(TRACK_START + TRACK_RANGE, position)) - TRACK_START) / TRACK_RANGE
+        if value != self.value:
+            self.value = value
+            self.update()
+            self.valueChanged.emit(self.value)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            x, y = self.handle_position()
+            pos = event.pos().y() if VERTICAL else event.pos().x()
+            start = y if VERTICAL else x
+            handle_length = HANDLE_SIZE[1] if VERTICAL else HANDLE_SIZE[0]
+            if not start <= pos < start + handle_length:
+                # Click on track centers handle under cursor
+                self.move_handle(pos - handle_length // 2)
+                start = self.handle_position()[1 if VERTICAL else 0]
+            self.drag_offset = pos - start
+
+    def mouseMoveEvent(self, event):
+        if self.drag_offset is not None:
+            pos = event.pos().y() if VERTICAL else event.pos().x()
+            self.move_handle(pos - self.drag_offset)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton and self.drag_offset is not None:
+            self.drag_offset = None
+            self.valueCommitted.emit(self.value)
+        super().mouseReleaseEvent(event)
+
+    def set_value(self, value):
+        self.value = max(0.0, min(1.0, value))
+        self.update()
+        self.valueChanged.emit(self.value)
+        self.valueCommitted.emit(self.value)
+
+    def get_value(self):
+        return self.value
+''')
+
+ENTRY_CLASS = Template('''TEXT_GEOMETRY = $text_geometry  # (x, y, width, height) of text field
+TEXT_FONT = $text_font  # (family, point size)
+TEXT_STYLE = $text_style
+PLACEHOLDER = $placeholder
+
+
+class $class_name(QWidget):
+    """Text entry, background is drawn in paintEvent, only the text field is a child widget"""
+    textChanged = pyqtSignal(str)
+    returnPressed = pyqtSignal()
+
+    frames = None  # 'normal' -> loaded frame, shared by all instances
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        if $class_name.frames is None:
+            $class_name.frames = {state: load_frame(data) for state, data in FRAME_DATA.items()}
+        self.setFixedSize(*SIZE)
+
+        self.text_input = QLineEdit(self)
+        self.text_input.setGeometry(*TEXT_GEOMETRY)
+        self.text_input.setFont(QFont(*TEXT_FONT))
+        self.text_input.setStyleSheet(TEXT_STYLE)
+        self.text_input.setPlaceholderText(PLACEHOLDER)
+        self.text_input.textChanged.connect(self.textChanged.emit)
+        self.text_input.returnPressed.connect(self.returnPressed.emit)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        draw_frame(painter, self.frames['normal'])
+        painter.end()
+
+    def get_text(self):
+        return self.text_input.text()
+
+    def set_text(self, text):
+        self.text_input.setText(text)
+
+    def clear(self):
+        self.text_input.clear()
+
+    def set_placeholder(self, placeholder):
+        self.text_input.setPlaceholderText(placeholder)
+
+    def set_readonly(self, readonly):
+        self.text_input.setReadOnly(readonly)
+''')
+
+
+class CodeExporter:
+    """
+    Export widget spec as standalone Python module
+
+    Every visual state is rendered once here and stored in the module either
+    as merged color rectangles ('rects') or as embedded PNG ('image').
+    'auto' uses rectangles when every frame consists of whole proportional
+    pixels (no text), otherwise images.
+    """
+    MODES = ('auto', 'rects', 'image')
+
+    def __init__(self, renderer=None):
+        self.renderer = renderer or SpriteRenderer()
+
+    @staticmethod
+    def class_name(spec):
+        """Return class name for spec ('name' in CamelCase or Exported<Type>)"""
+        words = re.findall(r'[A-Za-z0-9]+', spec.get('name') or '')
+        name = ''.join(word[:1].upper() + word[1:] for word in words)
+        if not name or not name[0].isalpha():
+            name = f"Exported{WidgetSpecs.get_type(spec).capitalize()}{name}"
+        return name
+
+    def collect_frames(self, spec):
+        """Return (frames, values) - list of (state, QImage) and template values of the widget type"""
+        widget_type = WidgetSpecs.get_type(spec)
+        config = WidgetSpecs.build_config(spec)
+
+        if widget_type == 'slider':
+            slider = WidgetSpecs.create_widget(spec)
+            handle = slider.slider_button
+            handle.hide()
+            track = self.renderer.render_widget(slider)
+            handle.show()
+            handle_frame = self.renderer.render_widget(handle)
+            if slider.orientation == 'vertical':
+                track_range = slider.track_height - 2 * slider.scale - handle.height()
+                handle_cross = (slider.width() - handle.width()) // 2
+            else:
+                track_range = slider.track_width - 2 * slider.scale - handle.width()
+                handle_cross = (slider.height() - handle.height()) // 2
+            values = {
+                'vertical': slider.orientation == 'vertical',
+                'handle_size': (handle.width(), handle.height()),
+                'track_start': slider.scale,
+                'track_range': track_range,
+                'handle_cross': handle_cross
+            }
+            return [('track', track), ('handle', handle_frame)], values
+
+        if widget_type == 'entry':
+            entry = WidgetSpecs.create_widget(spec)
+            text_input = entry.text_input
+            text_input.hide()
+            background = self.renderer.render_widget(entry)
+            geometry = text_input.geometry()
+            values = {
+                'text_geometry': (geometry.x(), geometry.y(), geometry.width(), geometry.height()),
+                'text_font': (text_input.font().family(), text_input.font().pointSize()),
+                'text_style': repr(text_input.styleSheet()),
+                'placeholder': repr(config['placeholder'])
+            }
+            return [('normal', background)], values
+
+        frames = self.renderer.render_spec(spec)
+        values = {}
+        if widget_type == 'button':
+            values['animation_enabled'] = bool(config['animation_enabled'])
+            if not config['animation_enabled']:
+                frames = [(state, image) for state, image in frames if state != 'pressed']
+        elif widget_type == 'radio':
+            values['radio_width'] = 12 * config['scale']
+        return frames, values
+
+    @staticmethod
+    def pixel_grid(image, scale):
+        """Return image reduced to proportional pixels or None if it has finer details"""
+        width, height = image.width(), image.height()
+        if scale <= 1 or width % scale or height % scale:
+            return None
+        small = image.scaled(width // scale, height // scale,
+                             Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.FastTransformation)
+        restored = small.scaled(width, height,
+                                Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.FastTransformation)
+        return small if restored == image else None
+
+    @staticmethod
+    def image_rects(image, unit=1):
+        """Return ((color, ((x, y, w, h), ...)), ...) covering all visible pixels of image"""
+        image = image.convertToFormat(QImage.Format.Format_ARGB32)
+        width = image.width()
+        pixels = image.constBits()
+        pixels.setsize(image.sizeInBytes())
+        pixels = memoryview(pixels).cast('I')
+        row_length = image.bytesPerLine() // 4
+
+        # Horizontal runs of same color in every row
+        runs = {}  # argb -> [(row, col, length), ...]
+        for row in range(image.height()):
+            line = pixels[row * row_length:row * row_length + width]
+            col = 0
+            while col < width:
+                argb = line[col]
+                start = col
+                while col < width and line[col] == argb:
+                    col += 1
+                if argb >> 24:  # Skip transparent pixels
+                    runs.setdefault(argb, []).append((row, start, col - start))
+
+        layers = []
+        for argb, color_runs in runs.items():
+            alpha = argb >> 24
+            color = f"#{argb & 0xFFFFFF:06X}" if alpha == 255 else f"#{argb:08X}"
+            rects = tuple((x * unit, y * unit, w * unit, h * unit)
+                          for x, y, w, h in PatternCompiler.merge_runs(color_runs))
+            layers.append((color, rects))
+        return tuple(layers)
+
+    def export_module(self, spec, mode='auto'):
+        """Return source of standalone module with widget class for spec"""
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown export mode '{mode}', expected one of {', '.join(self.MODES)}")
+        widget_type = WidgetSpecs.get_type(spec)
+        scale = WidgetSpecs.build_config(spec)['scale']
+        frames, values = self.collect_frames(spec)
+
+        if mode != 'image':
+            grids = [self.pixel_grid(image, scale) for _, image in frames]
+            if mode == 'auto':
+                mode = 'rects' if all(grid is not None for grid in grids) else 'image'
+
+        if mode == 'rects':
+            frame_data = {
+                state: self.image_rects(grid, scale) if grid is not None else self.image_rects(image)
+                for (state, image), grid in zip(frames, grids)
+            }
+            frames_code = RECTS_FRAMES.substitute(frame_data=pprint.pformat(frame_data, width=100))
+        else:
+            frame_data = {state: base64.b64encode(encode_png(image)).decode('ascii') for state, image in frames}
+            frames_code = IMAGE_FRAMES.substitute(frame_data=pprint.pformat(frame_data, width=100))
+
+        imports = ["from PyQt6.QtWidgets import QWidget" + (", QLineEdit" if widget_type == 'entry' else ""),
+                   "from PyQt6.QtCore import Qt, pyqtSignal" + (", QRect" if mode == 'rects' else "")]
+        gui_names = ["QPainter"]
+        if mode == 'rects':
+            gui_names.insert(0, "QColor")
+        else:
+            gui_names.append("QImage")
+        if widget_type == 'entry':
+            gui_names.insert(0, "QFont")
+        imports.append(f"from PyQt6.QtGui import {', '.join(gui_names)}")
+        if mode == 'image':
+            imports.insert(0, "import base64\n")
+
+        class_name = self.class_name(spec)
+        class_template = {
+            'button': BUTTON_CLASS,
+            'radio': RADIO_CLASS,
+            'toggle': TOGGLE_CLASS,
+            'slider': SLIDER_CLASS,
+            'entry': ENTRY_CLASS
+        }[widget_type]
+        size = frames[0][1].size()
+        return MODULE_TEMPLATE.substitute(
+            class_name=class_name,
+            widget_type=widget_type,
+            imports='\n'.join(imports),
+            size=(size.width(), size.height()),
+            frames_code=frames_code,
+            class_code=class_template.substitute(class_name=class_name, **values)
+        )
+
+    def write_module(self, spec, path, mode='auto'):
+        """Write standalone module for spec to path"""
+        with open(path, 'w', encoding='utf-8') as module_file:
+            module_file.write(self.export_module(spec, mode))
@@ -0,0 +1,176 @@
+"""
+Opt-in counters of Qt operations caused by widgets (children, stylesheets, geometry, repaints)
+"""
+import json
+from weakref import WeakKeyDictionary
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QEvent
+from PyQt6.QtWidgets import QApplication, QWidget
+
+COUNTERS = ('children', 'stylesheets', 'geometry', 'repaints')
+
+# QWidget methods counted while enabled -> counter
+PATCHED_METHODS = {
+    'setStyleSheet': 'stylesheets',
+    'setGeometry': 'geometry',
+    'move': 'geometry',
+    'resize': 'geometry',
+    'setFixedSize': 'geometry',
+}
+
+
+class CounterFilter(QObject):
+    """Application event filter counting paint events and child widgets"""
+
+    def eventFilter(self, watched, event):
+        event_type = event.type()
+        if event_type == QEvent.Type.Paint:
+            WidgetCounters.count(watched, 'repaints')
+        elif event_type == QEvent.Type.ChildAdded and event.child().isWidgetType():
+            WidgetCounters.count(watched, 'children')
+        return False
+
+
+class WidgetCounters:
+    """
+    Counts Qt operations per widget instance and per widget class
+
+    Disabled by default and then costs nothing: enable() wraps the QWidget
+    methods in PATCHED_METHODS and installs an application event filter,
+    disable() restores the original methods. Every operation is charged to
+    the outermost tracked widget containing the receiver, so stylesheets of
+    an entry's QLineEdit or moves of a slider handle count for the entry or
+    slider. Only calls made from Python are counted for the patched methods
+    (layouts moving widgets from C++ are not).
+    """
+    tracked = ()  # Widget classes operations are charged to
+    enabled = False
+    instances = WeakKeyDictionary()  # Live widget -> {counter: value}
+    classes = {}  # Class name -> {'instances': n, counter: value}, kept after widgets are deleted
+    originals = {}  # Method name -> original QWidget method descriptor
+    event_filter = None
+
+    @classmethod
+    def default_classes(cls):
+        """Return widget classes tracked when enable() gets no classes"""
+        from .minecraft_button import MinecraftButton
+        from .minecraft_radio_button import MinecraftRadioButton
+        from .minecraft_toggle_button import MinecraftToggleButton
+        from .minecraft_slider import MinecraftSlider
+        from .minecraft_entry import MinecraftEntry
+        return (MinecraftButton, MinecraftRadioButton, MinecraftToggleButton, MinecraftSlider, MinecraftEntry)
+
+    @classmethod
+    def enable(cls, classes=None):
+        """Start counting operations of widget classes (default: all Minecraft widgets)"""
+        app = QApplication.instance()
+        if app is None:
+            raise RuntimeError("WidgetCounters.enable() needs a QApplication")
+        cls.tracked = tuple(classes) if classes else cls.default_classes()
+        if cls.enabled:
+            return
+
+        for name, counter in PATCHED_METHODS.items():
+            cls.originals[name] = QWidget.__dict__[name]  # Descriptor, restored as it was
+            setattr(QWidget, name, cls.counted(getattr(QWidget, name), counter))
+        cls.event_filter = CounterFilter()
+        app.installEventFilter(cls.event_filter)
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls):
+        """Stop counting and restore original methods (counts are kept)"""
+        if not cls.enabled:
+            return
+        for name, original in cls.originals.items():
+            setattr(QWidget, name, original)
+        cls.originals = {}
+        app = QApplication.instance()
+        if app is not None:
+            app.removeEventFilter(cls.event_filter)
+        cls.event_filter = None
+        cls.enabled = False
+
+    @staticmethod
+    def counted(original, counter):
+        """Return wrapper of QWidget method that counts calls before calling original"""
+        def wrapper(widget, *args):
+            WidgetCounters.count(widget, counter)
+            return original(widget, *args)
+        wrapper.__name__ = original.__name__
+        wrapper.__doc__ = original.__doc__
+        return wrapper
+
+    @classmethod
+    def owner(cls, widget):
+        """Return outermost tracked widget containing widget (or widget itself), None if there is none"""
+        owner = None
+        while widget is not None:
+            if isinstance(widget, cls.tracked):
+                owner = widget
+            widget = widget.parentWidget()
+        return owner
+
+    @classmethod
+    def count(cls, widget, counter):
+        """Add one operation to counter of widget's owner (ignored if widget isn't tracked)"""
+        if not isinstance(widget, QWidget):
+            return
+        owner = cls.owner(widget)
+        if owner is None:
+            return
+
+        counts = cls.instances.get(owner)
+        class_counts = cls.classes.get(type(owner).__name__)
+        if class_counts is None:
+            class_counts = cls.classes[type(owner).__name__] = dict.fromkeys(('instances',) + COUNTERS, 0)
+        if counts is None:
+            counts = cls.instances[owner] = dict.fromkeys(COUNTERS, 0)
+            class_counts['instances'] += 1
+        counts[counter] += 1
+        class_counts[counter] += 1
+
+    @classmethod
+    def reset(cls):
+        """Forget all counts"""
+        cls.instances = WeakKeyDictionary()
+        cls.classes = {}
+
+    @classmethod
+    def counts(cls, widget):
+        """Return {counter: value} of widget (zeros if nothing was counted)"""
+        counts = cls.instances.get(widget)
+        return dict(counts) if counts else dict.fromkeys(COUNTERS, 0)
+
+    @classmethod
+    def class_totals(cls):
+        """Return {class name: {'instances': n, counter: value}} including deleted widgets"""
+        return {name: dict(counts) for name, counts in sorted(cls.classes.items())}
+
+    @classmethod
+    def totals(cls):
+        """Return {counter: value} over all widgets"""
+        return {counter: sum(counts[counter] for counts in cls.classes.values()) for counter in COUNTERS}
+
+    @classmethod
+    def get_stats(cls):
+        """Return totals, class totals and counts of live widgets (busiest first)"""
+        instances = [
+            dict({'class': type(widget).__name__, 'id': hex(id(widget)), 'name': widget.objectName()}, **counts)
+            for widget, counts in list(cls.instances.items())
+            if not sip.isdeleted(widget)
+        ]
+        instances.sort(key=lambda entry: sum(entry[counter] for counter in COUNTERS), reverse=True)
+        return {
+            'enabled': cls.enabled,
+            'totals': cls.totals(),
+            'classes': cls.class_totals(),
+            'instances': instances
+        }
+
+    @classmethod
+    def dump(cls, path):
+        """Write get_stats() to JSON file"""
+        with open(path, 'w', encoding='utf-8') as stats_file:
+            json.dump(cls.get_stats(), stats_file, indent=2)
@@ -2,8 +2,27 @@
 Minecraft-style text entry field
 """
 from PyQt6.QtWidgets import QFrame, QLineEdit
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QRect, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QPainter
+
+from .bordered_box import BorderedBox
+from .widget_style import WidgetStyle
+
+class EntryStyle(WidgetStyle):
+    """Style of MinecraftEntry"""
+    DEFAULTS = {
+        'entry_width': 60,          # Width in proportional pixels
+        'entry_height': 10,         # Height in proportional pixels
+        'scale': 8,
+        'border_color': '#F2F2F2',      # Light border
+        'top_space_color': '#696D88',   # Top space color
+        'background_color': '#9A9FB4',  # Main background
+        'text_color': 'white',
+        'font_family': 'Minecraft Standard',
+        'placeholder': '',
+        'font_size': None  # Calculated from scale when not set
+    }
+    __slots__ = tuple(DEFAULTS)
 
 class MinecraftEntry(QFrame):
     """
@@ -13,26 +32,17 @@ class MinecraftEntry(QFrame):
     textChanged = pyqtSignal(str)
     returnPressed = pyqtSignal()
 
+    # Config keys grouped by the parts they affect
+    GEOMETRY_KEYS = frozenset(('scale', 'entry_width', 'entry_height'))
+    COLOR_KEYS = frozenset(('border_color', 'top_space_color', 'background_color'))
+    FONT_KEYS = frozenset(('font_family', 'font_size'))
+    TEXT_STYLE_KEYS = frozenset(('text_color', 'background_color'))
+
     def __init__(self, placeholder="", style_config=None, parent=None):
         super().__init__(parent)
 
-        # Default configuration for Entry
-        self.default_config = {
-            'entry_width': 60,          # Width in proportional pixels
-            'entry_height': 10,         # Height in proportional pixels
-            'scale': 8,
-            'border_color': '#F2F2F2',      # Light border
-            'top_space_color': '#696D88',   # Top space color
-            'background_color': '#9A9FB4',  # Main background
-            'text_color': 'white',
-            'font_family': 'Minecraft Standard',
-            'placeholder': placeholder
-        }
-
-        # Apply user configuration
-        self.config = self.default_config.copy()
-        if style_config:
-            self.config.update(style_config)
+        # Shared immutable style: defaults with user configuration applied
+        self.config = EntryStyle.compile({'placeholder': placeholder}, style_config)
 
         self.focused = False
         self.setup_entry()
@@ -40,17 +50,8 @@ class MinecraftEntry(QFrame):
     def setup_entry(self):
         """Setup text entry field"""
         try:
-            self.scale = self.config['scale']
-
-            # Calculate dimensions with borders
-            entry_width = self.config['entry_width']
-            entry_height = self.config['entry_height']
-
-            # Total dimensions: borders (1+1) + main area
-            self.base_width = (entry_width + 2) * self.scale
-            self.base_height = (entry_height + 2) * self.scale
-
-            self.setFixedSize(self.base_width, self.base_height)
+            # Border and background are drawn in paintEvent, only text input is a child widget
+            self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
 
             # Create elements
             self.create_entry_border()
@@ -61,52 +62,64 @@ class MinecraftEntry(QFrame):
 
     def create_entry_border(self):
         """Create Entry border"""
-        border_color = self.config['border_color']  # #F2F2F2
-
-        # Top border
-        self.top_border = QFrame(self)
-        self.top_border.setGeometry(0, 0, self.base_width, self.scale)
-        self.top_border.setStyleSheet(f"background-color: {border_color}; border-radius: 0px;")
-
-        # Left border
-        self.left_border = QFrame(self)
-        self.left_border.setGeometry(0, self.scale, self.scale, self.config['entry_height'] * self.scale)
-        self.left_border.setStyleSheet(f"background-color: {border_color}; border-radius: 0px;")
-
-        # Right border
-        self.right_border = QFrame(self)
-        self.right_border.setGeometry((self.config['entry_width'] + 1) * self.scale, self.scale,
-                                     self.scale, self.config['entry_height'] * self.scale)
-        self.right_border.setStyleSheet(f"background-color: {border_color}; border-radius: 0px;")
-
-        # Bottom border
-        self.bottom_border = QFrame(self)
-        self.bottom_border.setGeometry(0, (self.config['entry_height'] + 1) * self.scale,
-                                     self.base_width, self.scale)
-        self.bottom_border.setStyleSheet(f"background-color: {border_color}; border-radius: 0px;")
+        self.scale = self.config.scale
+
+        # Calculate dimensions with borders
+        entry_width = self.config.entry_width
+        entry_height = self.config.entry_height
+
+        # Total dimensions: borders (1+1) + main area
+        self.base_width = (entry_width + 2) * self.scale
+        self.base_height = (entry_height + 2) * self.scale
+
+        self.setFixedSize(self.base_width, self.base_height)
+
+        # Box without bottom space, shared by all entries with same size and scale
+        self.box = BorderedBox.geometry(entry_width, entry_height, self.scale, bottom_space=0)
+        self.border_color = QColor(self.config.border_color)  # #F2F2F2
 
     def create_entry_background(self):
         """Create Entry background"""
-        entry_width = self.config['entry_width']
-        entry_height = self.config['entry_height']
+        entry_width = self.config.entry_width
 
         # Top space (2 proportional pixels after border)
-        self.top_space = QFrame(self)
-        self.top_space.setGeometry(self.scale, self.scale,
-                                 entry_width * self.scale, 2 * self.scale)
-        self.top_space.setStyleSheet(f"background-color: {self.config['top_space_color']}; border-radius: 0px;")
-
-        # Main area (remainder after top space)
-        main_height = entry_height - 2  # Subtract 2 pixels of top space
-        self.main_background = QFrame(self)
-        self.main_background.setGeometry(self.scale, (1 + 2) * self.scale,
-                                       entry_width * self.scale, main_height * self.scale)
-        self.main_background.setStyleSheet(f"background-color: {self.config['background_color']}; border-radius: 0px;")
+        self.top_space_rect = QRect(self.scale, self.scale, entry_width * self.scale, 2 * self.scale)
+        self.top_space_color = QColor(self.config.top_space_color)
+
+        # Main area (remainder after top space) is the box main area
+        self.background_color = QColor(self.config.background_color)
+
+    def paintEvent(self, event):
+        """Draw border, top space and background in a single pass"""
+        painter = QPainter(self)
+        BorderedBox.paint(painter, self.box, self.border_color, self.background_color)
+        painter.fillRect(self.top_space_rect, self.top_space_color)
+        painter.end()
 
     def create_text_input(self):
         """Create text input field"""
-        entry_width = self.config['entry_width']
-        entry_height = self.config['entry_height']
+        self.text_input = QLineEdit(self)
+
+        self.update_text_geometry()
+        self.update_text_font()
+        self.update_text_style()
+
+        # Placeholder
+        if self.config.placeholder:
+            self.text_input.setPlaceholderText(self.config.placeholder)
+
+        # Connect signals
+        self.text_input.textChanged.connect(self.textChanged.emit)
+        self.text_input.returnPressed.connect(self.returnPressed.emit)
+
+        # Safe focus handlers through signals
+        self.text_input.focusInEvent = lambda event: self.handle_focus_in(event)
+        self.text_input.focusOutEvent = lambda event: self.handle_focus_out(event)
+
+    def update_text_geometry(self):
+        """Position text field inside main area"""
+        entry_width = self.config.entry_width
+        entry_height = self.config.entry_height
 
         # Position text field 2 proportional pixels above border (in main area)
         text_y = (1 + 2) * self.scale - 2 * self.scale  # After border + after top space - 2 pixels up
@@ -114,8 +127,6 @@ class MinecraftEntry(QFrame):
         # Height of main area WITHOUT bottom margin + compensation for upward movement
         text_height = (entry_height - 2) * self.scale + 2 * self.scale  # +2 pixels to compensate movement
 
-        self.text_input = QLineEdit(self)
-
         # Keep full width but add internal padding through CSS
         self.text_input.setGeometry(
             self.scale,  # Only border offset
@@ -124,50 +135,70 @@ class MinecraftEntry(QFrame):
             text_height
         )
 
+    def update_text_font(self):
+        """Setup text field font"""
         # Calculate font size based on scale
         # Formula: font_size = scale * 4 (for larger, readable text)
         calculated_font_size = self.scale * 4
 
         # If font_size is explicitly specified in config, use it
-        if 'font_size' in self.config:
-            font_size = self.config['font_size']
+        if self.config.font_size is not None:
+            font_size = self.config.font_size
         else:
             font_size = calculated_font_size
 
         # Setup font with scaled size
-        font = QFont(self.config['font_family'], font_size)
+        font = QFont(self.config.font_family, font_size)
         self.text_input.setFont(font)
 
+    def update_text_style(self):
+        """Setup text field stylesheet"""
         # Styles for text field
         self.text_input.setStyleSheet(f"""
         QLineEdit {{
             background-color: transparent;
             border: none;
-            color: {self.config['text_color']};
+            color: {self.config.text_color};
             padding-left: {self.scale}px;
             padding-right: 0px;
             padding-top: 0px;
             padding-bottom: 0px;
             margin: 0px;
-            selection-background-color: {self.config['text_color']};
-            selection-color: {self.config['background_color']};
+            selection-background-color: {self.config.text_color};
+            selection-color: {self.config.background_color};
         }}
         QLineEdit:focus {{
             outline: none;
         }}
         """)
 
-        # Placeholder
-        if self.config['placeholder']:
-            self.text_input.setPlaceholderText(self.config['placeholder'])
+    def reconfigure(self, style_config):
+        """
+        Apply config changes in place
 
-        # Connect signals
-        self.text_input.textChanged.connect(self.textChanged.emit)
-        self.text_input.returnPressed.connect(self.returnPressed.emit)
-
-        # Safe focus handlers through signals
-        self.text_input.focusInEvent = lambda event: self.handle_focus_in(event)
-        self.text_input.focusOutEvent = lambda event: self.handle_focus_out(event)
+        Only parts affected by changed keys are updated, text field is reused.
+        """
+        try:
+            changed = self.config.changes(style_config)
+            if not changed:
+                return
+            self.config = self.config.updated(style_config)
+
+            geometry_changed = bool(changed & self.GEOMETRY_KEYS)
+            if geometry_changed or changed & self.COLOR_KEYS:
+                self.create_entry_border()
+                self.create_entry_background()
+            if geometry_changed:
+                self.update_text_geometry()
+            if geometry_changed or changed & self.FONT_KEYS:
+                self.update_text_font()
+            if geometry_changed or changed & self.TEXT_STYLE_KEYS:
+                self.update_text_style()
+            if 'placeholder' in changed:
+                self.text_input.setPlaceholderText(self.config.placeholder)
+            self.update()
+        except Exception as e:
+            print(f"Reconfigure error: {e}")
 
     def handle_focus_in(self, event):
         """Safe focus in handler"""
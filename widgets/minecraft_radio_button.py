@@ -2,8 +2,35 @@
 Minecraft-style radio buttons
 """
 from PyQt6.QtWidgets import QFrame, QLabel
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QObject, QRect, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QPainter
+
+from .bordered_box import BorderedBox
+from .state_styles import StateStyles
+from .widget_style import WidgetStyle
+
+class RadioButtonStyle(WidgetStyle):
+    """Style of MinecraftRadioButton"""
+    DEFAULTS = {
+        'text': '',
+        'scale': 8,
+        'border_color': '#413F54',
+        'button_normal': '#9A9FB4',
+        'button_hover': '#9CD3FF',
+        'button_selected': '#9CD3FF',
+        'border_normal': '#ADB0C4',
+        'border_hover': '#DAFFFF',
+        'border_selected': '#DAFFFF',
+        'indicator_color': '#DAFFFF',
+        'indicator_line_color': '#708CBA',  # Line color (51 74 97)
+        'bottom_space_normal': '#696D88',   # Bottom space color (inactive)
+        'bottom_space_hover': '#708CBA',    # Bottom space color (hover)
+        'bottom_space_selected': '#708CBA', # Bottom space color (selected)
+        'text_color': 'white',
+        'font_family': 'Minecraftia'
+    }
+    __slots__ = tuple(DEFAULTS)
 
 class MinecraftRadioButton(QFrame):
     """
@@ -12,39 +39,47 @@ class MinecraftRadioButton(QFrame):
     clicked = pyqtSignal()
     stateChanged = pyqtSignal(bool)  # True when selected
 
+    # Top border color in selected state (matches preview background)
+    SELECTED_TOP_BORDER_COLOR = QColor('#CBCCD4')
+
+    # Config keys that change size of the radio button and its text
+    GEOMETRY_KEYS = frozenset(('scale', 'text'))
+    TEXT_KEYS = frozenset(('text_color', 'font_family'))
+
+    # Config keys of (main area, inner border, bottom space) colors for each state
+    STATE_COLOR_KEYS = (
+        ('button_normal', 'border_normal', 'bottom_space_normal'),        # StateStyles.NORMAL
+        ('button_hover', 'border_hover', 'bottom_space_hover'),           # StateStyles.HOVER
+        None,                                                             # StateStyles.PRESSED
+        ('button_selected', 'border_selected', 'bottom_space_selected'),  # StateStyles.SELECTED
+    )
+
     def __init__(self, text="", style_config=None, parent=None):
         super().__init__(parent)
-        # Default configuration for radio button
-        self.default_config = {
-            'text': text,
-            'scale': 8,
-            'border_color': '#413F54',
-            'button_normal': '#9A9FB4',
-            'button_hover': '#9CD3FF',
-            'button_selected': '#9CD3FF',
-            'border_normal': '#ADB0C4',
-            'border_hover': '#DAFFFF',
-            'border_selected': '#DAFFFF',
-            'indicator_color': '#DAFFFF',
-            'indicator_line_color': '#708CBA',  # Line color (51 74 97)
-            'bottom_space_normal': '#696D88',   # Bottom space color (inactive)
-            'bottom_space_hover': '#708CBA',    # Bottom space color (hover)
-            'bottom_space_selected': '#708CBA', # Bottom space color (selected)
-            'text_color': 'white',
-            'font_family': 'Minecraftia'
-        }
-
-        # Apply user configuration
-        self.config = self.default_config.copy()
-        if style_config:
-            self.config.update(style_config)
+
+        # Shared immutable style: defaults with user configuration applied
+        self.config = RadioButtonStyle.compile({'text': text}, style_config)
         self.selected = False
         self.hover_state = False
         self.setup_radio_button()
 
     def setup_radio_button(self):
         """Setup radio button"""
-        self.scale = self.config['scale']
+        self.text_label = None
+
+        # Radio button is drawn in paintEvent, only text stays a child widget
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+        # Create elements
+        self.create_radio_box()
+        self.create_radio_indicator()
+        self.create_radio_text()
+        self.create_radio_styles()
+        self.update_radio_styles()
+
+    def create_radio_box(self):
+        """Create borders, main area (10x9) and bottom space"""
+        self.scale = self.config.scale
 
         # Dimensions: reduced main area (10x9) + borders + bottom space
         main_width = 10  # was 12, minus 1 left and 1 right
@@ -54,49 +89,14 @@ class MinecraftRadioButton(QFrame):
 
         # If there's text, add space for it
         text_width = 0
-        if self.config['text']:
-            text_width = len(self.config['text']) * 10 + 10  # Fixed calculation
+        if self.config.text:
+            text_width = len(self.config.text) * 10 + 10  # Fixed calculation
 
         total_width = self.radio_width + text_width
         self.setFixedSize(total_width, self.radio_height)
 
-        # Create elements
-        self.create_radio_borders()
-        self.create_radio_main()
-        self.create_radio_indicator()
-        self.create_radio_bottom_space()
-        self.create_radio_text()
-        self.update_radio_styles()
-
-    def create_radio_borders(self):
-        """Create radio button borders"""
-        border_color = self.config['border_color']
-
-        # Top border
-        self.top_border = QFrame(self)
-        self.top_border.setGeometry(0, 0, self.radio_width, self.scale)
-        self.top_border.setStyleSheet(f"background-color: {border_color}; border-radius: 0px;")
-
-        # Left border (height for main area 9 + bottom space 2)
-        self.left_border = QFrame(self)
-        self.left_border.setGeometry(0, self.scale, self.scale, 11 * self.scale)
-        self.left_border.setStyleSheet(f"background-color: {border_color}; border-radius: 0px;")
-
-        # Right border (position for width 10+1)
-        self.right_border = QFrame(self)
-        self.right_border.setGeometry(11 * self.scale, self.scale, self.scale, 11 * self.scale)
-        self.right_border.setStyleSheet(f"background-color: {border_color}; border-radius: 0px;")
-
-        # Bottom border (position for height 9+2+1)
-        self.bottom_border = QFrame(self)
-        self.bottom_border.setGeometry(0, 12 * self.scale, self.radio_width, self.scale)
-        self.bottom_border.setStyleSheet(f"background-color: {border_color}; border-radius: 0px;")
-
-    def create_radio_main(self):
-        """Create main radio button area"""
-        self.main_area = QFrame(self)
-        # New main area: 10x9 pixels
-        self.main_area.setGeometry(self.scale, self.scale, 10 * self.scale, 9 * self.scale)
+        # Geometry is shared by all radio buttons with same scale
+        self.box = BorderedBox.geometry(main_width, main_height, self.scale)
 
     def create_radio_indicator(self):
         """Create center indicator for selected state"""
@@ -107,38 +107,77 @@ class MinecraftRadioButton(QFrame):
         indicator_x = self.scale + 3 * self.scale  # 3 pixel offset from left edge of main area
         indicator_y = self.scale + 3 * self.scale  # 3 pixel offset from top edge
 
-        self.indicator = QFrame(self)
-        self.indicator.setGeometry(indicator_x, indicator_y, indicator_size, indicator_size)
-        self.indicator.hide()  # Initially hidden
+        self.indicator_rect = QRect(indicator_x, indicator_y, indicator_size, indicator_size)
 
         # Horizontal line inside indicator (4x1 pixel) - in first row
         line_y = indicator_y  # In first row of square
-        self.indicator_line = QFrame(self)
-        self.indicator_line.setGeometry(indicator_x, line_y, indicator_size, self.scale)
-        self.indicator_line.hide()  # Initially hidden
-
-    def create_radio_bottom_space(self):
-        """Create radio button bottom space"""
-        # Bottom space takes full width of new main area (10 pixels)
-        space_width = 10 * self.scale  # Full width inside borders
-        space_x = self.scale  # Starts right after left border
-        space_y = 10 * self.scale  # Under main area (1 + 9)
-
-        self.radio_bottom_space = QFrame(self)
-        self.radio_bottom_space.setGeometry(space_x, space_y, space_width, 2 * self.scale)
+        self.indicator_line_rect = QRect(indicator_x, line_y, indicator_size, self.scale)
 
     def create_radio_text(self):
         """Create radio button text"""
-        if self.config['text']:
-            self.text_label = QLabel(self.config['text'], self)
-            font = QFont(self.config['font_family'], 16)  # Fixed size
-            self.text_label.setFont(font)
-            self.text_label.setStyleSheet(f"color: {self.config['text_color']}; background: transparent;")
-
-            # Position text to the right of radio button
-            text_x = self.radio_width + 5
-            text_y = (self.radio_height - 16) // 2  # Fixed font size
-            self.text_label.move(text_x, text_y)
+        if not self.config.text:
+            if self.text_label is not None:
+                self.text_label.hide()
+            return
+
+        # Label is created once and reused on reconfigure
+        if self.text_label is None:
+            self.text_label = QLabel(self)
+        self.text_label.setText(self.config.text)
+        font = QFont(self.config.font_family, 16)  # Fixed size
+        self.text_label.setFont(font)
+        self.text_label.setStyleSheet(f"color: {self.config.text_color}; background: transparent;")
+        self.text_label.adjustSize()
+
+        # Position text to the right of radio button
+        text_x = self.radio_width + 5
+        text_y = (self.radio_height - 16) // 2  # Fixed font size
+        self.text_label.move(text_x, text_y)
+        self.text_label.show()
+
+    def reconfigure(self, style_config):
+        """
+        Apply config changes in place
+
+        Only parts affected by changed keys are rebuilt, text label is reused.
+        """
+        changed = self.config.changes(style_config)
+        if not changed:
+            return
+        self.config = self.config.updated(style_config)
+
+        if changed & self.GEOMETRY_KEYS:
+            self.create_radio_box()
+            self.create_radio_indicator()
+        if changed & (self.GEOMETRY_KEYS | self.TEXT_KEYS):
+            self.create_radio_text()
+        if changed - self.GEOMETRY_KEYS - self.TEXT_KEYS:
+            self.create_radio_styles()
+            self.update_radio_styles()
+        self.update()
+
+    def paintEvent(self, event):
+        """Draw the whole radio button in a single pass"""
+        painter = QPainter(self)
+
+        # Area behind text has border color
+        if self.width() > self.radio_width:
+            painter.fillRect(self.radio_width, 0, self.width() - self.radio_width, self.height(), self.border_color)
+
+        # Selected state moves main area down by 1 pixel and reduces bottom space (like pressed button),
+        # top border changes color
+        offset = self.scale if self.selected else 0
+        BorderedBox.paint(
+            painter, self.box, self.border_color,
+            self.main_color, self.main_border_color, self.bottom_space_color,
+            offset, self.SELECTED_TOP_BORDER_COLOR if self.selected else None
+        )
+
+        # Indicator is shown only in selected state
+        if self.selected:
+            painter.fillRect(self.indicator_rect, self.indicator_color)
+            painter.fillRect(self.indicator_line_rect, self.indicator_line_color)
+        painter.end()
 
     def mousePressEvent(self, event):
         """Handle press"""
@@ -178,127 +217,230 @@ class MinecraftRadioButton(QFrame):
         """Return selection state"""
         return self.selected
 
+    def create_radio_styles(self):
+        """Build color tables for all states (call again after config changes)"""
+        self.state_styles = StateStyles.get(self.config, self.STATE_COLOR_KEYS)
+        self.border_color = QColor(self.config.border_color)
+        self.indicator_color = QColor(self.config.indicator_color)
+        self.indicator_line_color = QColor(self.config.indicator_line_color)
+        self.style_state = None
+
     def update_radio_styles(self):
         """Update radio button styles"""
         if self.selected:
             # Selected state (like pressed button)
-            button_bg = self.config['button_selected']
-            border_color = self.config['border_selected']
-            bottom_space_color = self.config['bottom_space_selected']
-
-            # Move main area down by 1 pixel
-            self.main_area.setGeometry(self.scale, 2 * self.scale, 10 * self.scale, 9 * self.scale)
-
-            # Bottom space reduces to 1 pixel (like pressed button)
-            self.radio_bottom_space.setGeometry(self.scale, 11 * self.scale, 10 * self.scale, 1 * self.scale)
-
-            # Show indicator
-            self.indicator.show()
-            self.indicator_line.show()
-
-            # Change top border
-            self.top_border.setStyleSheet("background-color: #CBCCD4; border-radius: 0px;")
-
+            state = StateStyles.SELECTED
         elif self.hover_state:
-            # Hover state
-            button_bg = self.config['button_hover']
-            border_color = self.config['border_hover']
-            bottom_space_color = self.config['bottom_space_hover']
-
-            # Normal position
-            self.main_area.setGeometry(self.scale, self.scale, 10 * self.scale, 9 * self.scale)
-
-            # Normal bottom space size (2 pixels)
-            self.radio_bottom_space.setGeometry(self.scale, 10 * self.scale, 10 * self.scale, 2 * self.scale)
+            state = StateStyles.HOVER
+        else:
+            state = StateStyles.NORMAL
 
-            # Hide indicator
-            self.indicator.hide()
-            self.indicator_line.hide()
+        if state == self.style_state:
+            return
+        self.style_state = state
 
-            # Restore top border
-            self.top_border.setStyleSheet(f"background-color: {self.config['border_color']}; border-radius: 0px;")
+        # Colors used by paintEvent
+        self.main_color, self.main_border_color, self.bottom_space_color = self.state_styles[state]
+        self.update()
 
-        else:
-            # Normal state
-            button_bg = self.config['button_normal']
-            border_color = self.config['border_normal']
-            bottom_space_color = self.config['bottom_space_normal']
-
-            # Normal position
-            self.main_area.setGeometry(self.scale, self.scale, 10 * self.scale, 9 * self.scale)
-
-            # Normal bottom space size (2 pixels)
-            self.radio_bottom_space.setGeometry(self.scale, 10 * self.scale, 10 * self.scale, 2 * self.scale)
-
-            # Hide indicator
-            self.indicator.hide()
-            self.indicator_line.hide()
-
-            # Restore top border
-            self.top_border.setStyleSheet(f"background-color: {self.config['border_color']}; border-radius: 0px;")
-
-        # Apply styles
-        main_style = f"""QFrame {{ 
-            background-color: {button_bg}; 
-            border: {self.scale}px solid {border_color};
-            border-radius: 0px;
-        }}"""
-
-        indicator_style = f"""QFrame {{ 
-            background-color: {self.config['indicator_color']}; 
-            border: none;
-            border-radius: 0px;
-        }}"""
-
-        line_style = f"""QFrame {{ 
-            background-color: {self.config['indicator_line_color']}; 
-            border: none;
-            border-radius: 0px;
-        }}"""
-
-        bottom_space_style = f"""QFrame {{ 
-            background-color: {bottom_space_color}; 
-            border: none;
-            border-radius: 0px;
-        }}"""
-
-        self.main_area.setStyleSheet(main_style)
-        self.indicator.setStyleSheet(indicator_style)
-        self.indicator_line.setStyleSheet(line_style)
-        self.radio_bottom_space.setStyleSheet(bottom_space_style)
-        self.setStyleSheet(f"background-color: {self.config['border_color']}; border-radius: 0px;")
-
-class MinecraftRadioGroup:
+class MinecraftRadioGroup(QObject):
     """
     Radio button group (only one can be selected at a time)
+
+    The selected button is tracked directly, so changing selection touches
+    only the previous and the new button. The group follows stateChanged of
+    its members, so buttons selected with set_selected() outside the group
+    are tracked too. Buttons can be addressed by index or by an optional key.
+    Bulk add/remove emits buttonsChanged and selectionChanged at most once
+    per call. Buttons leave the group when they are destroyed; buttons
+    destroyed together (a deleted container) are dropped from the indexes
+    at once when control returns to the event loop.
     """
-    def __init__(self):
+    selectionChanged = pyqtSignal(object)  # Selected radio button or None
+    buttonsChanged = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self.radio_buttons = []
         self.selected_button = None
-
-    def add_radio_button(self, radio_button):
-        """Add radio button to group"""
-        if radio_button not in self.radio_buttons:
+        self.positions = {}  # button -> index in radio_buttons
+        self.keys = {}  # key -> button
+        self.button_keys = {}  # button -> key
+        self.connections = {}  # button -> (clicked, stateChanged, destroyed) connections
+        self.destroyed_buttons = set()  # Destroyed buttons still in radio_buttons and positions
+
+    def add_radio_button(self, radio_button, key=None):
+        """Add radio button to group, optionally under key"""
+        self.add_radio_buttons([radio_button], None if key is None else [key])
+
+    def add_radio_buttons(self, radio_buttons, keys=None):
+        """
+        Add radio buttons (and keys in the same order) to group
+
+        If the group has no selection, the first already selected new button
+        becomes selected; other selected new buttons are deselected.
+        """
+        radio_buttons = list(radio_buttons)
+        keys = [None] * len(radio_buttons) if keys is None else list(keys)
+        if len(keys) != len(radio_buttons):
+            raise ValueError("Number of keys doesn't match number of radio buttons")
+        # Keys are checked before anything changes, failed call leaves group as it was
+        new_keys = {}
+        for radio_button, key in zip(radio_buttons, keys):
+            if key is None:
+                continue
+            if new_keys.setdefault(key, radio_button) is not radio_button or \
+                    self.keys.get(key, radio_button) is not radio_button:
+                raise ValueError(f"Key {key!r} is already used in group")
+
+        previous = self.selected_button
+        added = False
+        for radio_button, key in zip(radio_buttons, keys):
+            if radio_button in self.positions:
+                continue
+            self.positions[radio_button] = len(self.radio_buttons)
             self.radio_buttons.append(radio_button)
-            radio_button.clicked.connect(lambda: self.on_radio_clicked(radio_button))
+            if key is not None:
+                self.keys[key] = radio_button
+                self.button_keys[radio_button] = key
+            self.connections[radio_button] = (
+                radio_button.clicked.connect(lambda button=radio_button: self.on_radio_clicked(button)),
+                radio_button.stateChanged.connect(
+                    lambda selected, button=radio_button: self.on_radio_state_changed(button, selected)),
+                radio_button.destroyed.connect(lambda _=None, button=radio_button: self.forget(button))
+            )
+            added = True
+
+            if radio_button.is_selected():
+                if self.selected_button is None:
+                    self.selected_button = radio_button
+                else:
+                    radio_button.set_selected(False)
+
+        if added:
+            self.buttonsChanged.emit()
+        if self.selected_button is not previous:
+            self.selectionChanged.emit(self.selected_button)
+
+    def remove_radio_button(self, radio_button):
+        """Remove radio button from group (its selection state is kept)"""
+        self.remove_radio_buttons([radio_button])
+
+    def remove_radio_buttons(self, radio_buttons):
+        """Remove radio buttons from group, selection is cleared if selected button is removed"""
+        removed = {button for button in radio_buttons if button in self.positions}
+        if not removed:
+            return
+        for radio_button in removed:
+            clicked, state_changed, destroyed = self.connections.pop(radio_button)
+            if not sip.isdeleted(radio_button):
+                radio_button.clicked.disconnect(clicked)
+                radio_button.stateChanged.disconnect(state_changed)
+                radio_button.destroyed.disconnect(destroyed)
+        self.forget_buttons(removed)
+
+    def forget(self, radio_button):
+        """Drop destroyed radio button from group, indexes are rebuilt once for all destroyed buttons"""
+        if sip.isdeleted(self) or radio_button not in self.positions or radio_button in self.destroyed_buttons:
+            return
+        self.connections.pop(radio_button, None)
+        key = self.button_keys.pop(radio_button, None)
+        if key is not None:
+            del self.keys[key]
+        if not self.destroyed_buttons:
+            QTimer.singleShot(0, self.forget_destroyed)
+        self.destroyed_buttons.add(radio_button)
+        if radio_button is self.selected_button:
+            self.selected_button = None
+            self.selectionChanged.emit(None)
+
+    def forget_destroyed(self):
+        """Drop destroyed buttons from radio_buttons and positions"""
+        if self.destroyed_buttons and not sip.isdeleted(self):
+            self.forget_buttons(set())
+
+    def forget_buttons(self, removed):
+        """Drop buttons (set) and destroyed buttons from indexes and emit signals once"""
+        removed = removed | self.destroyed_buttons
+        self.destroyed_buttons = set()
+        self.radio_buttons = [button for button in self.radio_buttons if button not in removed]
+        self.positions = {button: index for index, button in enumerate(self.radio_buttons)}
+        for radio_button in removed:
+            key = self.button_keys.pop(radio_button, None)
+            if key is not None:
+                del self.keys[key]
+
+        self.buttonsChanged.emit()
+        if self.selected_button in removed:
+            self.selected_button = None
+            self.selectionChanged.emit(None)
 
     def on_radio_clicked(self, clicked_button):
         """Handle radio button click"""
-        # Deselect all buttons
-        for button in self.radio_buttons:
-            if button != clicked_button:
-                button.set_selected(False)
-
-        # Select clicked button
-        self.selected_button = clicked_button
-        clicked_button.set_selected(True)
+        self.select(clicked_button)
+
+    def on_radio_state_changed(self, radio_button, selected):
+        """Follow selection changes of members made outside the group (set_selected)"""
+        if selected:
+            if radio_button is not self.selected_button:
+                previous = self.selected_button
+                self.selected_button = radio_button
+                if previous is not None:
+                    previous.set_selected(False)
+                self.selectionChanged.emit(radio_button)
+        elif radio_button is self.selected_button:
+            self.selected_button = None
+            self.selectionChanged.emit(None)
+
+    def select(self, radio_button):
+        """Select radio button of group (None clears selection), only previous and new button are updated"""
+        if radio_button is not None and radio_button not in self.positions:
+            raise ValueError("Radio button is not in group")
+
+        previous = self.selected_button
+        if radio_button is previous:
+            if radio_button is not None:
+                radio_button.set_selected(True)  # Click toggled it off, selected button stays selected
+            return
+
+        self.selected_button = radio_button
+        if previous is not None:
+            previous.set_selected(False)
+        if radio_button is not None:
+            radio_button.set_selected(True)
+        self.selectionChanged.emit(radio_button)
+
+    def select_index(self, index):
+        """Select radio button by index (IndexError if out of range)"""
+        self.forget_destroyed()
+        self.select(self.radio_buttons[index])
+
+    def select_key(self, key):
+        """Select radio button by key (KeyError if unknown)"""
+        self.select(self.keys[key])
 
     def get_selected(self):
         """Return selected radio button"""
         return self.selected_button
 
+    def get_selected_index(self):
+        """Return index of selected radio button or None"""
+        self.forget_destroyed()
+        return self.positions.get(self.selected_button)
+
+    def get_selected_key(self):
+        """Return key of selected radio button or None"""
+        return self.button_keys.get(self.selected_button)
+
+    def index_of(self, radio_button):
+        """Return index of radio button in group or None"""
+        self.forget_destroyed()
+        return self.positions.get(radio_button)
+
+    def button(self, key):
+        """Return radio button with key or None"""
+        return self.keys.get(key)
+
     def clear_selection(self):
         """Clear selection"""
-        for button in self.radio_buttons:
-            button.set_selected(False)
-        self.selected_button = None
\ No newline at end of file
+        self.select(None)
\ No newline at end of file
@@ -2,71 +2,86 @@
 Виправлений widgets/minecraft_slider.py з фіксом горизонтального режиму
 """
 from PyQt6.QtWidgets import QFrame
-from PyQt6.QtCore import Qt, pyqtSignal
-from .minecraft_button import MinecraftButton
+from PyQt6.QtCore import Qt, QPoint, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter
+
+from .bordered_box import BorderedBox
+from .minecraft_button import MinecraftButton, ButtonStyle
+from .widget_style import WidgetStyle
+
+class SliderStyle(WidgetStyle):
+    """Стиль MinecraftSlider"""
+    NESTED = {'slider_button_config': ButtonStyle}
+    DEFAULTS = {
+        'scale': 8,
+        'orientation': 'vertical',  # 'vertical' або 'horizontal'
+        'track_width': 6,   # Ширина підложки (пропорційні пікселі)
+        'track_height': 30, # Висота підложки (пропорційні пікселі)
+        'track_border_color': '#F2F2F2',  # Колір бордера підложки
+        'track_fill_color': '#9A9FB4',    # Колір середини підложки
+        'slider_button_config': {
+            'button_width': 8,
+            'button_height': 6,
+            'scale': 8,
+            'border_color': '#413F54',
+            'button_normal': '#9A9FB4',
+            'button_hover': '#9A9FB4',     # Без hover ефекту
+            'button_pressed': '#9A9FB4',   # Без pressed ефекту
+            'border_normal': '#ADB0C4',
+            'border_hover': '#ADB0C4',     # Без hover ефекту
+            'border_pressed': '#ADB0C4',   # Без pressed ефекту
+            'bottom_normal': '#9A9FB4',
+            'bottom_hover': '#9A9FB4',     # Без hover ефекту
+            'bottom_pressed': '#9A9FB4',   # Без pressed ефекту
+            'text_color': 'white',
+            'font_family': 'Minecraftia',
+            'has_shadow': True,
+            'animation_enabled': False  # Відключаємо анімацію
+        }
+    }
+    __slots__ = tuple(DEFAULTS)
 
 class MinecraftSlider(QFrame):
     """
     Слайдер в стилі Minecraft
     """
-    valueChanged = pyqtSignal(float)  # Значення від 0.0 до 1.0
+    valueChanged = pyqtSignal(float)  # Значення від 0.0 до 1.0 (під час перетягування)
+    valueCommitted = pyqtSignal(float)  # Остаточне значення (відпускання, set_value)
+
+    DRAG_FRAME_INTERVAL = 16  # мс, один кадр при 60 Гц
+
+    # Ключі конфігурації, що змінюють розміри, і ключі кольорів підложки
+    GEOMETRY_KEYS = frozenset(('scale', 'orientation', 'track_width', 'track_height'))
+    TRACK_KEYS = frozenset(('track_border_color', 'track_fill_color'))
 
     def __init__(self, style_config=None, parent=None):
         super().__init__(parent)
 
-        # Дефолтна конфігурація
-        self.default_config = {
-            'scale': 8,
-            'orientation': 'vertical',  # 'vertical' або 'horizontal'
-            'track_width': 6,   # Ширина підложки (пропорційні пікселі)
-            'track_height': 30, # Висота підложки (пропорційні пікселі)
-            'track_border_color': '#F2F2F2',  # Колір бордера підложки
-            'track_fill_color': '#9A9FB4',    # Колір середини підложки
-            'slider_button_config': {
-                'button_width': 8,
-                'button_height': 6,
-                'scale': 8,
-                'border_color': '#413F54',
-                'button_normal': '#9A9FB4',
-                'button_hover': '#9A9FB4',     # Без hover ефекту
-                'button_pressed': '#9A9FB4',   # Без pressed ефекту
-                'border_normal': '#ADB0C4',
-                'border_hover': '#ADB0C4',     # Без hover ефекту
-                'border_pressed': '#ADB0C4',   # Без pressed ефекту
-                'bottom_normal': '#9A9FB4',
-                'bottom_hover': '#9A9FB4',     # Без hover ефекту
-                'bottom_pressed': '#9A9FB4',   # Без pressed ефекту
-                'text_color': 'white',
-                'font_family': 'Minecraftia',
-                'has_shadow': True,
-                'animation_enabled': False  # Відключаємо анімацію
-            }
-        }
-
-        # Застосовуємо користувацьку конфігурацію
-        self.config = self.default_config.copy()
-        if style_config:
-            for key, value in style_config.items():
-                if key == 'slider_button_config':
-                    # Оновлюємо конфігурацію кнопки окремо
-                    self.config['slider_button_config'].update(value)
-                else:
-                    self.config[key] = value
+        # Спільний незмінний стиль: дефолти з користувацькою конфігурацією
+        self.config = SliderStyle.compile(style_config)
 
         self.value = 0.0  # Поточне значення (0.0 - 1.0)
         self.dragging = False
         self.drag_offset = 0
 
+        # Рухи миші під час перетягування застосовуються не частіше ніж раз на кадр
+        self.pending_drag_pos = None
+        self.drag_timer = QTimer(self)
+        self.drag_timer.setSingleShot(True)
+        self.drag_timer.setInterval(self.DRAG_FRAME_INTERVAL)
+        self.drag_timer.timeout.connect(self.apply_drag)
+
+        self.slider_button = None
         self.setup_slider()
 
     def setup_slider(self):
         """Налаштування слайдера"""
-        self.scale = self.config['scale']
-        self.orientation = self.config['orientation']
+        self.scale = self.config.scale
+        self.orientation = self.config.orientation
 
         # Розрахунок розмірів підложки (БЕЗ зміни місцями для horizontal!)
-        track_width = self.config['track_width']   # Використовуємо як є
-        track_height = self.config['track_height'] # Використовуємо як є
+        track_width = self.config.track_width   # Використовуємо як є
+        track_height = self.config.track_height # Використовуємо як є
 
         # Загальні розміри з бордерами (тільки світлі бордери)
         self.track_width = (track_width + 2) * self.scale
@@ -89,8 +104,8 @@ class MinecraftSlider(QFrame):
 
     def create_track(self):
         """Створення підложки слайдера"""
-        track_border_color = self.config['track_border_color']  # #F2F2F2
-        track_fill_color = self.config['track_fill_color']      # #9A9FB4
+        track_border_color = self.config.track_border_color  # #F2F2F2
+        track_fill_color = self.config.track_fill_color      # #9A9FB4
 
         # Позиція підложки (центруємо)
         if self.orientation == 'vertical':
@@ -100,26 +115,31 @@ class MinecraftSlider(QFrame):
             track_x = 0
             track_y = (self.height() - self.track_height) // 2
 
-        # Світлі бордери (F2F2F2) - БЕЗ темного зовнішнього бордера
-        self.track_border = QFrame(self)
-        self.track_border.setGeometry(track_x, track_y, self.track_width, self.track_height)
-        self.track_border.setStyleSheet(f"background-color: {track_border_color}; border-radius: 0px;")
-
-        # Середина підложки (9A9FB4)
-        fill_x = track_x + self.scale
-        fill_y = track_y + self.scale
-        fill_width = self.track_width - 2 * self.scale
-        fill_height = self.track_height - 2 * self.scale
-
-        self.track_fill = QFrame(self)
-        self.track_fill.setGeometry(fill_x, fill_y, fill_width, fill_height)
-        self.track_fill.setStyleSheet(f"background-color: {track_fill_color}; border-radius: 0px;")
+        # Світлі бордери (F2F2F2) і середина (9A9FB4) - БЕЗ темного зовнішнього бордера
+        # Малюються в paintEvent, геометрія спільна для слайдерів з однаковим розміром
+        self.track_pos = QPoint(track_x, track_y)
+        self.track_box = BorderedBox.geometry(self.config.track_width, self.config.track_height,
+                                              self.scale, bottom_space=0)
+        self.track_border_color = QColor(track_border_color)
+        self.track_fill_color = QColor(track_fill_color)
+
+    def paintEvent(self, event):
+        """Малювання підложки"""
+        super().paintEvent(event)
+        painter = QPainter(self)
+        painter.translate(self.track_pos)
+        BorderedBox.paint(painter, self.track_box, self.track_border_color, self.track_fill_color)
+        painter.end()
 
     def create_slider_button(self):
         """Створення повзунка"""
         # Створюємо кнопку БЕЗ ефектів hover/press
-        button_config = self.config['slider_button_config'].copy()
-        button_config['scale'] = self.scale
+        button_config = self.config.slider_button_config.updated({'scale': self.scale})
+
+        # Повзунок створюється один раз, далі лише переналаштовується
+        if self.slider_button is not None:
+            self.slider_button.reconfigure(button_config)
+            return
 
         self.slider_button = MinecraftButton('', button_config, self)
 
@@ -149,40 +169,52 @@ class MinecraftSlider(QFrame):
     def button_mouse_move(self, event):
         """Обробка переміщення повзунка"""
         if self.dragging:
-            # Конвертуємо координати у координати батьківського віджета
-            global_pos = self.slider_button.mapToParent(event.pos())
+            # Конвертуємо координати у координати батьківського віджета.
+            # Рухи стискаються: застосовується лише остання позиція раз на кадр
+            self.pending_drag_pos = self.slider_button.mapToParent(event.pos())
+            if not self.drag_timer.isActive():
+                self.drag_timer.start()
+
+    def apply_drag(self):
+        """Застосування останньої позиції перетягування (не частіше ніж раз на кадр)"""
+        global_pos = self.pending_drag_pos
+        if global_pos is None:
+            return
+        self.pending_drag_pos = None
 
-            if self.orientation == 'vertical':
-                # Вертикальний слайдер - рух по Y
-                track_start = self.scale  # Початок області руху
-                track_end = self.track_height - self.scale  # Кінець області руху
-                current_pos = global_pos.y() - self.drag_offset
+        if self.orientation == 'vertical':
+            # Вертикальний слайдер - рух по Y
+            track_start = self.scale  # Початок області руху
+            track_end = self.track_height - self.scale  # Кінець області руху
+            current_pos = global_pos.y() - self.drag_offset
 
-                # Обмежуємо рух в межах підложки
-                current_pos = max(track_start, min(track_end - self.slider_button.height(), current_pos))
+            # Обмежуємо рух в межах підложки
+            current_pos = max(track_start, min(track_end - self.slider_button.height(), current_pos))
 
-                # Перерахунок значення (0.0 - 1.0)
-                track_range = track_end - track_start - self.slider_button.height()
-                if track_range > 0:
-                    self.value = (current_pos - track_start) / track_range
-                else:
-                    self.value = 0.0
+            # Перерахунок значення (0.0 - 1.0)
+            track_range = track_end - track_start - self.slider_button.height()
+            if track_range > 0:
+                value = (current_pos - track_start) / track_range
             else:
-                # Горизонтальний слайдер - рух по X
-                track_start = self.scale
-                track_end = self.track_width - self.scale
-                current_pos = global_pos.x() - self.drag_offset
+                value = 0.0
+        else:
+            # Горизонтальний слайдер - рух по X
+            track_start = self.scale
+            track_end = self.track_width - self.scale
+            current_pos = global_pos.x() - self.drag_offset
 
-                current_pos = max(track_start, min(track_end - self.slider_button.width(), current_pos))
+            current_pos = max(track_start, min(track_end - self.slider_button.width(), current_pos))
 
-                track_range = track_end - track_start - self.slider_button.width()
-                if track_range > 0:
-                    self.value = (current_pos - track_start) / track_range
-                else:
-                    self.value = 0.0
+            track_range = track_end - track_start - self.slider_button.width()
+            if track_range > 0:
+                value = (current_pos - track_start) / track_range
+            else:
+                value = 0.0
 
-            # Обмежуємо значення
-            self.value = max(0.0, min(1.0, self.value))
+        # Обмежуємо значення, сигнал лише якщо значення змінилось
+        value = max(0.0, min(1.0, value))
+        if value != self.value:
+            self.value = value
             self.update_slider_position()
             self.valueChanged.emit(self.value)
 
@@ -190,6 +222,10 @@ class MinecraftSlider(QFrame):
         """Обробка відпускання повзунка"""
         if self.dragging:
             self.dragging = False
+            # Застосовуємо останній рух одразу і фіксуємо значення
+            self.drag_timer.stop()
+            self.apply_drag()
+            self.valueCommitted.emit(self.value)
 
     def mousePressEvent(self, event):
         """Обробка кліку по підложці"""
@@ -223,6 +259,12 @@ class MinecraftSlider(QFrame):
             self.update_slider_position()
             self.valueChanged.emit(self.value)
 
+    def mouseReleaseEvent(self, event):
+        """Фіксація значення після кліку по підложці"""
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.valueCommitted.emit(self.value)
+        super().mouseReleaseEvent(event)
+
     def update_slider_position(self):
         """Оновлення позиції повзунка"""
         if self.orientation == 'vertical':
@@ -257,6 +299,7 @@ class MinecraftSlider(QFrame):
         self.value = max(0.0, min(1.0, value))
         self.update_slider_position()
         self.valueChanged.emit(self.value)
+        self.valueCommitted.emit(self.value)
 
     def get_value(self):
         """Отримання поточного значення"""
@@ -265,5 +308,25 @@ class MinecraftSlider(QFrame):
     def set_orientation(self, orientation):
         """Зміна орієнтації слайдера"""
         if orientation in ['vertical', 'horizontal']:
-            self.config['orientation'] = orientation
-            self.setup_slider()
\ No newline at end of file
+            self.reconfigure({'orientation': orientation})
+
+    def reconfigure(self, style_config):
+        """
+        Зміна конфігурації без перестворення
+
+        Перераховуються лише частини, яких стосуються змінені ключі, повзунок не перестворюється.
+        """
+        changed = self.config.changes(style_config)
+        if not changed:
+            return
+        self.config = self.config.updated(style_config)
+
+        if changed & self.GEOMETRY_KEYS:
+            self.setup_slider()
+        else:
+            if changed & self.TRACK_KEYS:
+                self.create_track()
+            if 'slider_button_config' in changed:
+                self.create_slider_button()
+                self.update_slider_position()
+        self.update()
@@ -2,10 +2,30 @@
 Minecraft-style toggle switch
 """
 from PyQt6.QtWidgets import QFrame
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QPoint, QRect, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter
 
 from managers import TogglePatternManager
+from .bordered_box import BorderedBox
 from .minecraft_button import MinecraftButton
+from .pattern_cache import PatternPixmapCache
+from .widget_style import WidgetStyle
+
+class ToggleButtonStyle(WidgetStyle):
+    """Style of MinecraftToggleButton"""
+    DEFAULTS = {
+        'scale': 8,
+        'border_color': '#413F54',  # (65, 63, 84)
+        'left_area_color': '#9CD3FF',  # Left area
+        'right_area_color': '#696D88',  # Right area
+        'button_normal': '#9A9FB4',
+        'button_pressed': '#9CD3FF',
+        'border_normal': '#ADB0C4',
+        'border_pressed': '#DAFFFF',
+        'bottom_normal': '#9A9FB4',
+        'bottom_pressed': '#708CBA'
+    }
+    __slots__ = tuple(DEFAULTS)
 
 class MinecraftToggleButton(QFrame):
     """
@@ -14,45 +34,27 @@ class MinecraftToggleButton(QFrame):
     clicked = pyqtSignal()
     stateChanged = pyqtSignal(bool)  # True when enabled
 
+    # Config keys of left/right areas and of moving button
+    AREA_KEYS = frozenset(('left_area_color', 'right_area_color'))
+    MOVING_BUTTON_KEYS = frozenset(('scale', 'button_normal', 'border_normal', 'bottom_normal'))
+
     def __init__(self, style_config=None, parent=None):
         super().__init__(parent)
 
-        # Default configuration for toggle switch (without text)
-        self.default_config = {
-            'scale': 8,
-            'border_color': '#413F54',  # (65, 63, 84)
-            'left_area_color': '#9CD3FF',  # Left area
-            'right_area_color': '#696D88',  # Right area
-            'button_normal': '#9A9FB4',
-            'button_pressed': '#9CD3FF',
-            'border_normal': '#ADB0C4',
-            'border_pressed': '#DAFFFF',
-            'bottom_normal': '#9A9FB4',
-            'bottom_pressed': '#708CBA'
-        }
-
-        # Apply user configuration
-        self.config = self.default_config.copy()
-        if style_config:
-            self.config.update(style_config)
+        # Shared immutable style: defaults with user configuration applied
+        self.config = ToggleButtonStyle.compile(style_config)
 
         self.toggled = False  # Toggle state
         self.hover_state = False  # Mouse hover state
         self.hover_active = True  # Whether hover effect is active (resets after click)
         self.pattern_name = 'Standard'  # Standard pattern by default
-        self.pattern_pixels = []  # List of QFrame elements for pattern
+        self.pattern_pixmap = None  # Rendered pattern overlay
         self.setup_toggle()
 
     def setup_toggle(self):
         """Setup toggle switch"""
-        self.scale = self.config['scale']
-
-        # Dimensions: 20x9 + borders (1+1)x(1+1) = 22x13
-        # Add extra space on top for moving button
-        self.toggle_width = 22 * self.scale
-        self.toggle_height = 13 * self.scale
-
-        self.setFixedSize(self.toggle_width, self.toggle_height)
+        # Top part has background color, not border color
+        self.setStyleSheet("background-color: #CBCCD4; border-radius: 0px;")
 
         # Create elements
         self.create_toggle_borders()
@@ -63,80 +65,46 @@ class MinecraftToggleButton(QFrame):
 
     def create_toggle_borders(self):
         """Create toggle switch borders"""
-        border_color = self.config['border_color']
+        self.scale = self.config.scale
 
-        # Moved down by 2 pixels for space under moving button
-        # Top border
-        self.top_border = QFrame(self)
-        self.top_border.setGeometry(0, 2 * self.scale, self.toggle_width, self.scale)
-        self.top_border.setStyleSheet(f"background-color: {border_color}; border-radius: 0px;")
-
-        # Left border (height 9 pixels)
-        self.left_border = QFrame(self)
-        self.left_border.setGeometry(0, 3 * self.scale, self.scale, 9 * self.scale)
-        self.left_border.setStyleSheet(f"background-color: {border_color}; border-radius: 0px;")
-
-        # Right border (position 21)
-        self.right_border = QFrame(self)
-        self.right_border.setGeometry(21 * self.scale, 3 * self.scale, self.scale, 9 * self.scale)
-        self.right_border.setStyleSheet(f"background-color: {border_color}; border-radius: 0px;")
-
-        # Bottom border (position 12)
-        self.bottom_border = QFrame(self)
-        self.bottom_border.setGeometry(0, 12 * self.scale, self.toggle_width, self.scale)
-        self.bottom_border.setStyleSheet(f"background-color: {border_color}; border-radius: 0px;")
+        # Dimensions: 20x9 + borders (1+1)x(1+1) = 22x13
+        # Add extra space on top for moving button
+        self.toggle_width = 22 * self.scale
+        self.toggle_height = 13 * self.scale
+
+        self.setFixedSize(self.toggle_width, self.toggle_height)
+
+        # Box of 20x9 without bottom space, moved down by 2 pixels for space under moving button
+        self.box = BorderedBox.geometry(20, 9, self.scale, bottom_space=0)
+        self.box_offset = 2 * self.scale
+        self.border_color = QColor(self.config.border_color)
 
     def create_toggle_areas(self):
         """Create left and right areas"""
         # Moved down by 2 pixels for space under moving button
+        # Areas are drawn in paintEvent together with the pattern
         # Left area (11x9)
-        self.left_area = QFrame(self)
-        self.left_area.setGeometry(self.scale, 3 * self.scale, 11 * self.scale, 9 * self.scale)
-        self.left_area.setStyleSheet(f"background-color: {self.config['left_area_color']}; border-radius: 0px;")
+        self.left_area_rect = QRect(self.scale, 3 * self.scale, 11 * self.scale, 9 * self.scale)
+        self.left_area_color = QColor(self.config.left_area_color)
 
         # Right area (9x9)
-        self.right_area = QFrame(self)
-        self.right_area.setGeometry(12 * self.scale, 3 * self.scale, 9 * self.scale, 9 * self.scale)
-        self.right_area.setStyleSheet(f"background-color: {self.config['right_area_color']}; border-radius: 0px;")
+        self.right_area_rect = QRect(12 * self.scale, 3 * self.scale, 9 * self.scale, 9 * self.scale)
+        self.right_area_color = QColor(self.config.right_area_color)
 
     def create_pattern(self):
         """Create pattern on background"""
-        self.clear_pattern()  # Clear previous pattern
-
-        patterns = TogglePatternManager.get_patterns()
-        colors = TogglePatternManager.get_pattern_colors()
-
-        if self.pattern_name not in patterns or patterns[self.pattern_name] is None:
-            return  # No pattern
-
-        pattern_data = patterns[self.pattern_name]
-
-        # Create pattern pixels (18x7 inside areas)
-        max_rows = min(7, len(pattern_data))  # Maximum 7 rows
-        for row_idx in range(max_rows):
-            row = pattern_data[row_idx]
-            max_cols = min(18, len(row))  # Maximum 18 columns
-            for col_idx in range(max_cols):
-                symbol = row[col_idx]
-                if symbol != '0':  # Not transparent pixel
-                    color = colors.get(symbol)
-                    if color:
-                        # Pixel position (moved down by 3 for borders)
-                        pixel_x = (1 + col_idx) * self.scale  # +1 for left border
-                        pixel_y = (3 + row_idx) * self.scale  # +3 for top border
-
-                        pixel = QFrame(self)
-                        pixel.setGeometry(pixel_x, pixel_y, self.scale, self.scale)
-                        pixel.setStyleSheet(f"background-color: {color}; border: none;")
-                        pixel.show()
-
-                        self.pattern_pixels.append(pixel)
+        # Pattern (18x7 inside areas) is shared between all toggles with same pattern and scale
+        self.pattern_pixmap = PatternPixmapCache.shared().get_pattern(
+            TogglePatternManager, self.pattern_name, self.scale, (18, 7)
+        )
+        # Pixel position (moved down by 3 for borders)
+        self.pattern_pos = QPoint(self.scale, 3 * self.scale)
+        self.update()
 
     def clear_pattern(self):
         """Clear previous pattern"""
-        for pixel in self.pattern_pixels:
-            pixel.deleteLater()
-        self.pattern_pixels.clear()
+        self.pattern_pixmap = None
+        self.update()
 
     def set_pattern(self, pattern_name):
         """Set new pattern"""
@@ -146,29 +114,46 @@ class MinecraftToggleButton(QFrame):
         if hasattr(self, 'moving_button'):
             self.moving_button.raise_()
 
-    def create_moving_button(self):
-        """Create moving button as real MinecraftButton"""
-        # Configuration for moving button (10x8)
-        button_config = {
+    def paintEvent(self, event):
+        """Draw borders, areas and pattern under moving button"""
+        super().paintEvent(event)
+        painter = QPainter(self)
+        painter.translate(0, self.box_offset)
+        BorderedBox.paint(painter, self.box, self.border_color)
+        painter.translate(0, -self.box_offset)
+        painter.fillRect(self.left_area_rect, self.left_area_color)
+        painter.fillRect(self.right_area_rect, self.right_area_color)
+        if self.pattern_pixmap is not None:
+            painter.drawPixmap(self.pattern_pos, self.pattern_pixmap)
+        painter.end()
+
+    def get_moving_button_config(self):
+        """Configuration for moving button (10x8)"""
+        return {
             'button_width': 10,  # Main area width
             'button_height': 8,  # Main area height
             'scale': self.scale,
             'border_color': '#413F54',  # Dark border
-            'button_normal': '#9A9FB4',  # Lighter color for visibility
-            'button_hover': '#9A9FB4',   # No hover effect
-            'button_pressed': '#9A9FB4', # No pressed effect
-            'border_normal': '#ADB0C4',  # Light border for contrast
-            'border_hover': '#ADB0C4',   # No hover effect
-            'border_pressed': '#ADB0C4', # No pressed effect
-            'bottom_normal': '#9A9FB4',  # Shadow
-            'bottom_hover': '#9A9FB4',   # No hover effect
-            'bottom_pressed': '#9A9FB4', # No pressed effect
+            # Button always has same color regardless of toggle state
+            'button_normal': self.config.button_normal,
+            'button_hover': self.config.button_normal,    # No hover effect
+            'button_pressed': self.config.button_normal,  # No pressed effect
+            'border_normal': self.config.border_normal,
+            'border_hover': self.config.border_normal,    # No hover effect
+            'border_pressed': self.config.border_normal,  # No pressed effect
+            'bottom_normal': self.config.bottom_normal,
+            'bottom_hover': self.config.bottom_normal,    # No hover effect
+            'bottom_pressed': self.config.bottom_normal,  # No pressed effect
             'text_color': 'white',
             'font_family': 'Minecraftia',
             'has_shadow': True,
             'animation_enabled': False  # Disable press animation
         }
 
+    def create_moving_button(self):
+        """Create moving button as real MinecraftButton"""
+        button_config = self.get_moving_button_config()
+
         # Create real Minecraft button
         self.moving_button = MinecraftButton('', button_config, self)
 
@@ -179,6 +164,31 @@ class MinecraftToggleButton(QFrame):
         # Initial position (off - left)
         self.update_button_position()
 
+    def reconfigure(self, style_config):
+        """
+        Apply config changes in place
+
+        Only parts affected by changed keys are rebuilt, moving button is reused.
+        """
+        changed = self.config.changes(style_config)
+        if not changed:
+            return
+        self.config = self.config.updated(style_config)
+
+        if 'scale' in changed:
+            self.create_toggle_borders()
+            self.create_toggle_areas()
+            self.create_pattern()
+        else:
+            if 'border_color' in changed:
+                self.border_color = QColor(self.config.border_color)
+            if changed & self.AREA_KEYS:
+                self.create_toggle_areas()
+        if changed & self.MOVING_BUTTON_KEYS:
+            self.moving_button.reconfigure(self.get_moving_button_config())
+            self.update_button_position()
+        self.update()
+
     def mousePressEvent(self, event):
         """Handle press"""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -251,26 +261,8 @@ class MinecraftToggleButton(QFrame):
 
     def update_toggle_styles(self):
         """Update toggle switch styles"""
-        # Button always has same color regardless of toggle state
-        self.moving_button.config.update({
-            'button_normal': self.config['button_normal'],
-            'button_hover': self.config['button_normal'],
-            'button_pressed': self.config['button_normal'],
-            'border_normal': self.config['border_normal'],
-            'border_hover': self.config['border_normal'],
-            'border_pressed': self.config['border_normal'],
-            'bottom_normal': self.config['bottom_normal'],
-            'bottom_hover': self.config['bottom_normal'],
-            'bottom_pressed': self.config['bottom_normal'],
-            # Ensure borders always have correct color
-            'border_color': '#413F54'
-        })
-
-        # Force set hover=False, pressed=False state
+        # Button always has same color regardless of toggle state,
+        # force set hover=False, pressed=False state
         self.moving_button.hover_state = False
         self.moving_button.pressed_state = False
-
-        # Apply updated styles to button
         self.moving_button.update_styles()
-        # Top part has background color, not border color
-        self.setStyleSheet(f"background-color: #CBCCD4; border-radius: 0px;")
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+LRU pixmap caches (pattern overlays, widget snapshots)
+"""
+from collections import OrderedDict
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QPainter, QPixmap
+
+from managers import PatternCompiler
+
+
+class PixmapCache:
+    """
+    LRU cache of pixmaps with a byte budget
+
+    Entries are evicted least recently used first when the total size
+    exceeds the byte budget.
+    """
+    DEFAULT_MAX_BYTES = 16 * 1024 * 1024  # 16 MB
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (QPixmap, size in bytes)
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return cached pixmap for key or None (counts hit or miss)"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def insert(self, key, pixmap):
+        """Store pixmap under key and evict entries over budget"""
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.current_bytes -= previous[1]
+        size = pixmap.width() * pixmap.height() * pixmap.depth() // 8
+        self.entries[key] = (pixmap, size)
+        self.current_bytes += size
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used entries until cache fits into budget"""
+        while self.current_bytes > self.max_bytes and self.entries:
+            _, (_, size) = self.entries.popitem(last=False)
+            self.current_bytes -= size
+            self.evictions += 1
+
+    def set_max_bytes(self, max_bytes):
+        """Change byte budget"""
+        self.max_bytes = max_bytes
+        self.evict()
+
+    def clear(self):
+        """Remove all entries (counters are kept)"""
+        self.entries.clear()
+        self.current_bytes = 0
+
+    def reset_stats(self):
+        """Reset hit/miss/eviction counters"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_stats(self):
+        """Return cache counters"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes
+        }
+
+
+class PatternPixmapCache(PixmapCache):
+    """
+    Process-wide LRU cache of rendered pattern overlays
+
+    Widgets with the same pattern, scale, colors and clip size share
+    one pixmap.
+    """
+    _shared = None
+
+    @classmethod
+    def shared(cls):
+        """Return cache instance shared by all widgets"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def get_pattern(self, manager, pattern_name, scale, clip_size):
+        """
+        Return pixmap with rendered pattern or None if there is no pattern
+
+        manager - pattern manager class (ButtonPatternManager, TogglePatternManager)
+        clip_size - (columns, rows) limit in proportional pixels
+        """
+        rows = manager.get_pattern(pattern_name)
+        if rows is None:
+            return None  # No pattern
+
+        # Rows are part of the key, so a pattern file edited on disk gets a new pixmap
+        colors = manager.get_pattern_colors()
+        color_map = tuple(sorted((symbol, color) for symbol, color in colors.items() if color))
+        rows = tuple(rows)
+        key = (manager.__name__, pattern_name, rows, scale, color_map, tuple(clip_size))
+
+        pixmap = self.get(key)
+        if pixmap is None:
+            compiled = PatternCompiler.compile(manager, pattern_name, clip_size)
+            pixmap = self.render_pattern(compiled, scale)
+            self.insert(key, pixmap)
+        return pixmap
+
+    @staticmethod
+    def render_pattern(compiled, scale):
+        """Render compiled pattern to transparent pixmap"""
+        pixmap = QPixmap(max(compiled.width, 1) * scale, max(compiled.height, 1) * scale)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        for color, rects in compiled.rects:
+            qcolor = QColor(color)
+            for x, y, w, h in rects:
+                painter.fillRect(x * scale, y * scale, w * scale, h * scale, qcolor)
+        painter.end()
+        return pixmap
@@ -0,0 +1,210 @@
+"""
+Performance HUD - frame time, section timings and input latency overlay
+"""
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+
+from PyQt6.QtCore import Qt, QObject, QEvent, QTimer
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QApplication, QLabel
+
+# Events that start an input-to-paint latency measurement
+INPUT_EVENTS = frozenset((
+    QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease, QEvent.Type.MouseButtonDblClick,
+    QEvent.Type.KeyPress, QEvent.Type.Wheel
+))
+
+
+def timed_section(name):
+    """
+    Decorator of argument-less widget methods (signal slots): time calls in owner's performance monitor
+
+    The owner keeps its PerformanceMonitor in performance_monitor (None - not timed).
+    """
+    def decorate(method):
+        @wraps(method)
+        def wrapper(self):
+            monitor = self.performance_monitor
+            if monitor is None:
+                return method(self)
+            with monitor.timed(name):
+                return method(self)
+        return wrapper
+    return decorate
+
+
+class PerformanceMonitor(QObject):
+    """
+    Rolling timings of one window
+
+    frame - time the window spends repainting (frame_started/frame_finished
+    around QEvent.UpdateRequest), interval - time between frames, latency -
+    from the first input event to the end of the next frame, other names -
+    sections timed with timed(). Every series keeps the last WINDOW samples.
+    While recording every sample is also written to a JSON Lines file.
+    """
+    WINDOW = 120
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.series = {}  # name -> deque of milliseconds
+        self.counts = {}  # name -> total number of samples
+        self.last_frame_end = None
+        self.frame_start = None
+        self.input_time = None  # First input event not followed by a frame yet
+        self.record_file = None
+        self.started = time.perf_counter()
+
+        app = QApplication.instance()
+        if app is not None:
+            app.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if self.input_time is None and event.type() in INPUT_EVENTS:
+            self.input_time = time.perf_counter()
+        return False
+
+    def add_sample(self, name, milliseconds):
+        """Add sample to series name"""
+        values = self.series.get(name)
+        if values is None:
+            values = self.series[name] = deque(maxlen=self.WINDOW)
+        values.append(milliseconds)
+        self.counts[name] = self.counts.get(name, 0) + 1
+        if self.record_file is not None:
+            self.record({'series': name, 'ms': round(milliseconds, 3)})
+
+    @contextmanager
+    def timed(self, name):
+        """Context manager adding duration of its body to series name"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_sample(name, (time.perf_counter() - start) * 1000)
+
+    def frame_started(self):
+        """Mark start of window repaint"""
+        self.frame_start = time.perf_counter()
+
+    def frame_finished(self):
+        """Mark end of window repaint: adds frame, interval and pending input latency"""
+        if self.frame_start is None:
+            return
+        now = time.perf_counter()
+        self.add_sample('frame', (now - self.frame_start) * 1000)
+        if self.last_frame_end is not None:
+            self.add_sample('interval', (now - self.last_frame_end) * 1000)
+        if self.input_time is not None:
+            self.add_sample('latency', (now - self.input_time) * 1000)
+            self.input_time = None
+        self.last_frame_end = now
+        self.frame_start = None
+
+    def summary(self, name):
+        """Return {'last', 'mean', 'max', 'count'} of series in ms or None without samples"""
+        values = self.series.get(name)
+        if not values:
+            return None
+        return {
+            'last': values[-1],
+            'mean': sum(values) / len(values),
+            'max': max(values),
+            'count': self.counts[name]
+        }
+
+    def get_stats(self):
+        """Return summaries of all series"""
+        return {name: self.summary(name) for name in self.series}
+
+    def start_recording(self, path):
+        """Write every following sample (and record() calls) to JSON Lines file"""
+        self.stop_recording()
+        self.record_file = open(path, 'w', encoding='utf-8')
+        self.record({'event': 'start'})
+
+    def stop_recording(self):
+        """Close recording file"""
+        if self.record_file is None:
+            return
+        self.record({'event': 'stop'})
+        self.record_file.close()
+        self.record_file = None
+
+    def is_recording(self):
+        """Check if samples are being recorded"""
+        return self.record_file is not None
+
+    def record(self, entry):
+        """Write entry (dict) with time in seconds since monitor start to recording file"""
+        if self.record_file is None:
+            return
+        entry = dict(entry, t=round(time.perf_counter() - self.started, 6))
+        self.record_file.write(json.dumps(entry) + '\n')
+
+    def close(self):
+        """Stop recording and watching input events"""
+        self.stop_recording()
+        app = QApplication.instance()
+        if app is not None:
+            app.removeEventFilter(self)
+
+
+class PerformanceHud(QLabel):
+    """
+    Overlay with monitor timings and child-widget counts, refreshed REFRESH_INTERVAL ms
+
+    counters - callable returning {label: value} shown below the timings
+    (and recorded while the monitor records). The HUD ignores the mouse;
+    its own refresh repaints the window too, so frame times include it.
+    """
+    REFRESH_INTERVAL = 250
+    SERIES = (
+        ('frame', "frame"),
+        ('interval', "frame interval"),
+        ('latency', "input->paint"),
+        ('update_preview', "update_preview"),
+        ('generate_widget', "generate_widget"),
+    )
+
+    def __init__(self, monitor, counters=None, parent=None):
+        super().__init__(parent)
+        self.monitor = monitor
+        self.counters = counters
+
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setFont(QFont('monospace', 9))
+        self.setStyleSheet("color: white; background-color: rgba(0, 0, 0, 170); padding: 6px;")
+        self.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self.REFRESH_INTERVAL)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start()
+        self.refresh()
+
+    def refresh(self):
+        """Redraw text from current monitor summaries and counters"""
+        lines = []
+        for name, label in self.SERIES:
+            summary = self.monitor.summary(name)
+            if summary is None:
+                lines.append(f"{label:<16}      -")
+            else:
+                lines.append(f"{label:<16} {summary['last']:6.2f} ms  avg {summary['mean']:6.2f}  "
+                             f"max {summary['max']:6.2f}")
+
+        counts = self.counters() if self.counters else {}
+        for label, value in counts.items():
+            lines.append(f"{label:<16} {value:6}")
+        if counts and self.monitor.is_recording():
+            self.monitor.record({'counters': counts})
+
+        if self.monitor.is_recording():
+            lines.append("● recording")
+        self.setText('\n'.join(lines))
+        self.adjustSize()
+        self.raise_()
@@ -0,0 +1,147 @@
+"""
+Multi-process sprite rendering - pool of offscreen renderers
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+
+from .sprite_renderer import SpriteRenderer, RenderResult, encode_png
+
+# Application and renderer of worker process, created once by worker initializer
+_worker_app = None
+_worker_renderer = None
+
+
+def _init_worker(slider_positions):
+    """Create offscreen application and renderer of worker process"""
+    global _worker_app, _worker_renderer
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    # Widgets need QApplication, QGuiApplication alone is not enough
+    from PyQt6.QtWidgets import QApplication
+    _worker_app = QApplication.instance() or QApplication([])
+    _worker_renderer = SpriteRenderer(slider_positions)
+
+
+def _render_chunk(jobs):
+    """Render list of (index, spec), errors are reported per spec"""
+    results = []
+    for index, spec in jobs:
+        try:
+            sprites = [(state, encode_png(image)) for state, image in _worker_renderer.render_spec(spec)]
+            results.append(RenderResult(index, spec, sprites, None))
+        except Exception as e:
+            results.append(RenderResult(index, spec, None, SpriteRenderer.error_text(e)))
+    return results
+
+
+class RenderPool:
+    """
+    Render specs in a pool of worker processes
+
+    Every worker owns one offscreen QApplication and SpriteRenderer.
+    Workers encode PNG themselves, so the parent only writes files.
+    Specs are sent in chunks, results come back in completion order.
+    Failures are reported per spec, also when a worker process dies.
+    """
+    CHUNK_SIZE = 8
+    IN_FLIGHT = 2  # Chunks submitted per process, a dying worker only fails these
+
+    def __init__(self, processes=None, slider_positions=SpriteRenderer.SLIDER_POSITIONS,
+                 chunk_size=CHUNK_SIZE):
+        self.processes = processes or os.cpu_count() or 1
+        self.slider_positions = tuple(slider_positions)
+        self.chunk_size = chunk_size
+
+    def render(self, specs):
+        """
+        Yield RenderResult for every spec as soon as its chunk is rendered
+
+        At most IN_FLIGHT chunks per process are submitted at a time. A worker
+        that dies (crash, killed) breaks the whole executor and fails every
+        chunk in flight, so the executor is recreated and those specs become
+        suspects: they are rendered again in parallel, one spec per job, and
+        halved on every further break until the spec that breaks the pool
+        alone is found and reported as failed. Other chunks wait meanwhile.
+        """
+        pending = deque(self.chunked(list(enumerate(specs))))
+        suspects = deque()  # Groups of specs in flight when a worker died
+        running = {}  # Future -> list of (index, spec)
+        isolating = False  # Running jobs are a group of suspects
+        executor = self.create_executor()
+        try:
+            while pending or suspects or running:
+                if suspects:
+                    if not running:
+                        isolating = True
+                        for job in suspects.popleft():
+                            running[executor.submit(_render_chunk, [job])] = [job]
+                else:
+                    isolating = False
+                    while pending and len(running) < self.IN_FLIGHT * self.processes:
+                        chunk = pending.popleft()
+                        running[executor.submit(_render_chunk, chunk)] = chunk
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                if any(isinstance(future.exception(), BrokenProcessPool) for future in done):
+                    # Every future of a broken executor is done once it has shut down
+                    executor.shutdown()
+                    done = list(running)
+
+                failed = []
+                for future in done:
+                    jobs = running.pop(future)
+                    try:
+                        yield from future.result()
+                    except BrokenProcessPool as e:
+                        failed.extend(jobs)
+                        broken_error = e
+                    except Exception as e:
+                        # Chunk couldn't be sent or returned (pickling) - its specs failed
+                        yield from (RenderResult(index, spec, None, SpriteRenderer.error_text(e))
+                                    for index, spec in jobs)
+                if not failed:
+                    continue
+
+                executor = self.create_executor()
+                if len(failed) == 1:
+                    # Worker died on this spec alone - it is the culprit
+                    index, spec = failed[0]
+                    yield RenderResult(index, spec, None, SpriteRenderer.error_text(broken_error))
+                elif isolating:
+                    failed.sort(key=lambda job: job[0])
+                    half = len(failed) // 2
+                    suspects.extendleft((failed[half:], failed[:half]))
+                else:
+                    suspects.append(sorted(failed, key=lambda job: job[0]))
+        finally:
+            executor.shutdown()
+
+    def chunked(self, jobs):
+        """Split list of (index, spec) into chunks of chunk_size"""
+        return [jobs[i:i + self.chunk_size] for i in range(0, len(jobs), self.chunk_size)]
+
+    def create_executor(self):
+        """Start executor with worker processes"""
+        # Qt doesn't survive fork, workers start a fresh interpreter
+        context = multiprocessing.get_context('spawn')
+        return ProcessPoolExecutor(self.processes, mp_context=context,
+                                   initializer=_init_worker, initargs=(self.slider_positions,))
+
+    def write_sprites(self, specs, output_dir):
+        """Render specs and write PNG per state, return (written paths, failed results)"""
+        os.makedirs(output_dir, exist_ok=True)
+        paths = []
+        failures = []
+        for result in self.render(specs):
+            if result.error is not None:
+                failures.append(result)
+                continue
+            name = SpriteRenderer.sprite_name(result.spec, result.index)
+            for state, png in result.sprites:
+                path = os.path.join(output_dir, f"{name}_{state}.png")
+                with open(path, 'wb') as sprite_file:
+                    sprite_file.write(png)
+                paths.append(path)
+        return paths, failures
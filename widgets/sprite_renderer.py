@@ -0,0 +1,127 @@
+"""
+Headless sprite rendering - images of every visual state of widgets
+"""
+import os
+from collections import namedtuple
+
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QPoint, QBuffer, QByteArray, QIODevice
+from PyQt6.QtGui import QImage, QRegion
+
+from .widget_specs import WidgetSpecs
+
+# Result of one spec: sprites is list of (state, PNG bytes) or None on failure, error is None or error text
+RenderResult = namedtuple('RenderResult', ['index', 'spec', 'sprites', 'error'])
+
+def encode_png(image):
+    """Return PNG file contents of image"""
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    buffer.close()
+    return bytes(data)
+
+class SpriteRenderer:
+    """
+    Render widget specs to QImage for every visual state without generator UI
+
+    Needs a QApplication. On machines without display run it with
+    QT_QPA_PLATFORM=offscreen (render_sprites.py does that).
+    """
+    SLIDER_POSITIONS = (0.0, 0.25, 0.5, 0.75, 1.0)
+
+    def __init__(self, slider_positions=SLIDER_POSITIONS):
+        self.slider_positions = tuple(slider_positions)
+
+    def render_spec(self, spec):
+        """Return list of (state name, QImage) for every visual state of spec widget"""
+        widget = WidgetSpecs.create_widget(spec)
+        states = getattr(self, f"{WidgetSpecs.get_type(spec)}_states")
+        # Each state is applied by the generator right before the widget is rendered
+        return [(state, self.render_widget(widget)) for state in states(widget)]
+
+    @staticmethod
+    def render_widget(widget):
+        """Render widget with its children to transparent image"""
+        image = QImage(widget.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        # Without window background, pixels the widget doesn't paint stay transparent
+        widget.render(image, QPoint(), QRegion(), QWidget.RenderFlag.DrawChildren)
+        return image
+
+    @staticmethod
+    def sprite_name(spec, index):
+        """Return file name prefix of spec sprites"""
+        return spec.get('name') or f"{index:04d}_{spec['type']}"
+
+    @staticmethod
+    def error_text(error):
+        """Return error text of spec that couldn't be rendered"""
+        return f"{type(error).__name__}: {error}"
+
+    def write_sprites(self, specs, output_dir):
+        """
+        Render all specs and write PNG per state, return (written paths, failed results)
+
+        A spec that can't be rendered (unknown type, preset...) is reported as
+        RenderResult with error and the remaining specs are still rendered.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        paths = []
+        failures = []
+        for index, spec in enumerate(specs):
+            try:
+                states = self.render_spec(spec)
+            except Exception as e:
+                failures.append(RenderResult(index, spec, None, self.error_text(e)))
+                continue
+            name = self.sprite_name(spec, index)
+            for state, image in states:
+                path = os.path.join(output_dir, f"{name}_{state}.png")
+                if not image.save(path, "PNG"):
+                    raise OSError(f"Can't write {path}")
+                paths.append(path)
+        return paths, failures
+
+    # Visual states of every widget type
+
+    @staticmethod
+    def button_states(button):
+        yield 'normal'
+        button.hover_state = True
+        button.update_styles()
+        yield 'hover'
+        button.on_pressed()
+        yield 'pressed'
+
+    @staticmethod
+    def radio_states(radio):
+        yield 'normal'
+        radio.hover_state = True
+        radio.update_radio_styles()
+        yield 'hover'
+        radio.hover_state = False
+        radio.set_selected(True)
+        yield 'selected'
+
+    @staticmethod
+    def toggle_states(toggle):
+        for toggled in (False, True):
+            name = 'on' if toggled else 'off'
+            toggle.hover_state = False
+            toggle.set_toggled(toggled)
+            toggle.update_button_position()
+            yield name
+            toggle.hover_state = True
+            toggle.update_button_position()
+            yield f"{name}_hover"
+
+    def slider_states(self, slider):
+        for position in self.slider_positions:
+            slider.set_value(position)
+            yield f"value_{round(position * 100):03d}"
+
+    @staticmethod
+    def entry_states(entry):
+        yield 'normal'
@@ -0,0 +1,46 @@
+"""
+Precomputed widget colors for every visual state
+"""
+from PyQt6.QtGui import QColor
+
+
+class StateStyles:
+    """
+    Color tables indexed by widget state
+
+    Tables are built once per combination of config values and shared by
+    all widgets with the same colors, so switching state is a tuple lookup
+    instead of building and parsing stylesheets.
+    """
+    NORMAL = 0
+    HOVER = 1
+    PRESSED = 2
+    SELECTED = 3
+
+    _tables = {}
+
+    @classmethod
+    def get(cls, config, state_keys):
+        """
+        Return tuple indexed by state with tuple of QColor for every key
+
+        state_keys - tuple indexed by state with config keys of colors
+                     (None for states the widget doesn't have)
+        """
+        values = tuple(
+            tuple(config[key] for key in keys) if keys is not None else None
+            for keys in state_keys
+        )
+        table = cls._tables.get(values)
+        if table is None:
+            table = tuple(
+                tuple(QColor(value) for value in state_values) if state_values is not None else None
+                for state_values in values
+            )
+            cls._tables[values] = table
+        return table
+
+    @classmethod
+    def clear(cls):
+        """Drop all shared tables"""
+        cls._tables.clear()
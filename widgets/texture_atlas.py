@@ -0,0 +1,271 @@
+"""
+Texture atlas exporter - all sprites packed into a few images with JSON manifest
+"""
+import os
+import json
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage, QPainter
+
+from .sprite_renderer import SpriteRenderer, RenderResult
+from .widget_specs import WidgetSpecs
+
+
+class MaxRectsBin:
+    """
+    Rectangle bin packer (MaxRects, best short side fit)
+
+    Keeps list of maximal free rectangles; every placement splits the free
+    rectangles it overlaps and drops the ones contained in others.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.free_rects = [(0, 0, width, height)]
+        self.used_width = 0
+        self.used_height = 0
+
+    def insert(self, width, height):
+        """Place rectangle and return its (x, y) or None if it doesn't fit"""
+        best = None
+        best_fit = None
+        for free_x, free_y, free_w, free_h in self.free_rects:
+            if width <= free_w and height <= free_h:
+                leftover_w = free_w - width
+                leftover_h = free_h - height
+                fit = (min(leftover_w, leftover_h), max(leftover_w, leftover_h))
+                if best_fit is None or fit < best_fit:
+                    best_fit = fit
+                    best = (free_x, free_y)
+        if best is None:
+            return None
+
+        self.place((best[0], best[1], width, height))
+        return best
+
+    def place(self, rect):
+        """Split free rectangles overlapped by rect and prune contained ones"""
+        x, y, w, h = rect
+        new_free = []
+        for free in self.free_rects:
+            free_x, free_y, free_w, free_h = free
+            if x >= free_x + free_w or x + w <= free_x or y >= free_y + free_h or y + h <= free_y:
+                new_free.append(free)
+                continue
+            # Up to four maximal rectangles around the placed one
+            if x > free_x:
+                new_free.append((free_x, free_y, x - free_x, free_h))
+            if x + w < free_x + free_w:
+                new_free.append((x + w, free_y, free_x + free_w - x - w, free_h))
+            if y > free_y:
+                new_free.append((free_x, free_y, free_w, y - free_y))
+            if y + h < free_y + free_h:
+                new_free.append((free_x, y + h, free_w, free_y + free_h - y - h))
+
+        self.free_rects = self.prune(new_free)
+        self.used_width = max(self.used_width, x + w)
+        self.used_height = max(self.used_height, y + h)
+
+    @staticmethod
+    def prune(rects):
+        """Drop rectangles contained in other rectangles"""
+        # Bigger rectangles first, a rectangle can only be contained in one that is not smaller
+        rects = sorted(set(rects), key=lambda rect: rect[2] * rect[3], reverse=True)
+        kept = []
+        for x, y, w, h in rects:
+            for kept_x, kept_y, kept_w, kept_h in kept:
+                if (x >= kept_x and y >= kept_y and
+                        x + w <= kept_x + kept_w and y + h <= kept_y + kept_h):
+                    break
+            else:
+                kept.append((x, y, w, h))
+        return kept
+
+
+class TextureAtlasExporter:
+    """
+    Render every state of every spec and pack sprites into atlas pages
+
+    Identical sprites are stored once. Manifest maps sprite names to page,
+    pixel rect, UV rect and nine-slice insets (None for sprites that can't
+    be stretched).
+    """
+    PAGE_SIZE = 2048
+    PADDING = 1  # px between sprites, keeps filtering from bleeding into neighbours
+
+    def __init__(self, renderer=None, page_size=PAGE_SIZE, padding=PADDING):
+        self.renderer = renderer or SpriteRenderer()
+        self.page_size = page_size
+        self.padding = padding
+
+    @staticmethod
+    def nine_slice_insets(spec, state):
+        """Return {'left', 'top', 'right', 'bottom'} in pixels or None if sprite can't be stretched"""
+        widget_type = WidgetSpecs.get_type(spec)
+        config = WidgetSpecs.build_config(spec)
+        scale = config['scale']
+
+        if widget_type == 'button' and WidgetSpecs.get_pattern(spec) != 'None':
+            # Pattern is drawn from (scale, scale) across the main area
+            return None
+        if widget_type == 'radio' and (config['text'] or state == 'selected'):
+            # Text and selection indicator sit inside the main area
+            return None
+        if widget_type in ('button', 'radio'):
+            # Outer + inner border, pressed main area moves down into bottom space
+            offset = scale if state == 'pressed' else 0
+            return {'left': 2 * scale, 'top': 2 * scale + offset,
+                    'right': 2 * scale, 'bottom': 4 * scale - offset}
+        if widget_type == 'entry':
+            # Outer border, top space of 2 pixels
+            return {'left': scale, 'top': 3 * scale, 'right': scale, 'bottom': scale}
+        return None
+
+    def collect_sprites(self, specs):
+        """Render all specs, return (list of (name, image, insets), failed results)"""
+        sprites = []
+        failures = []
+        for index, spec in enumerate(specs):
+            try:
+                states = self.renderer.render_spec(spec)
+                spec_sprites = [(f"{self.renderer.sprite_name(spec, index)}_{state}", image,
+                                 self.nine_slice_insets(spec, state)) for state, image in states]
+            except Exception as e:
+                failures.append(RenderResult(index, spec, None, self.renderer.error_text(e)))
+                continue
+            sprites.extend(spec_sprites)
+        return sprites, failures
+
+    def collect_pool_sprites(self, specs, pool):
+        """Render specs in RenderPool, return (list of (name, image, insets), failed results)"""
+        results = []
+        failures = []
+        for result in pool.render(specs):
+            if result.error is None:
+                results.append(result)
+            else:
+                failures.append(result)
+
+        # Results come in completion order, the atlas is built in spec order
+        results.sort(key=lambda result: result.index)
+        sprites = []
+        for result in results:
+            name = self.renderer.sprite_name(result.spec, result.index)
+            for state, png in result.sprites:
+                image = QImage.fromData(png, "PNG").convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+                sprites.append((f"{name}_{state}", image, self.nine_slice_insets(result.spec, state)))
+        return sprites, failures
+
+    @staticmethod
+    def image_key(image):
+        """Return hashable content of image"""
+        pixels = image.constBits()
+        pixels.setsize(image.sizeInBytes())
+        return image.width(), image.height(), bytes(pixels)
+
+    def pack(self, images):
+        """Pack images into bins, return (bins, placements) with placement (bin index, x, y) per image"""
+        limit = self.page_size - self.padding
+        order = sorted(range(len(images)),
+                       key=lambda i: (images[i].height(), images[i].width()), reverse=True)
+
+        bins = []
+        placements = [None] * len(images)
+        for i in order:
+            width = images[i].width() + self.padding
+            height = images[i].height() + self.padding
+            if width > limit or height > limit:
+                raise ValueError(f"Sprite {images[i].width()}x{images[i].height()} "
+                                 f"doesn't fit into {self.page_size}px atlas page")
+            for bin_index, atlas_bin in enumerate(bins):
+                position = atlas_bin.insert(width, height)
+                if position is not None:
+                    break
+            else:
+                bins.append(MaxRectsBin(limit, limit))
+                bin_index = len(bins) - 1
+                position = bins[-1].insert(width, height)
+            placements[i] = (bin_index, position[0] + self.padding, position[1] + self.padding)
+        return bins, placements
+
+    def export(self, specs, output_dir, name="atlas", pool=None):
+        """
+        Write atlas pages (<name>_<page>.png) and manifest (<name>.json), return manifest
+
+        pool - RenderPool to render specs in worker processes
+        Specs that failed are left out and listed in manifest 'failed'.
+        """
+        if pool is None:
+            sprites, failures = self.collect_sprites(specs)
+        else:
+            sprites, failures = self.collect_pool_sprites(specs, pool)
+
+        # Same pixels are packed once
+        unique_images = []
+        unique_index = {}
+        sprite_images = []
+        for _, image, _ in sprites:
+            key = self.image_key(image)
+            if key not in unique_index:
+                unique_index[key] = len(unique_images)
+                unique_images.append(image)
+            sprite_images.append(unique_index[key])
+
+        bins, placements = self.pack(unique_images)
+
+        os.makedirs(output_dir, exist_ok=True)
+        pages = []
+        page_images = []
+        for page_index, atlas_bin in enumerate(bins):
+            page = QImage(atlas_bin.used_width + self.padding, atlas_bin.used_height + self.padding,
+                          QImage.Format.Format_ARGB32_Premultiplied)
+            page.fill(Qt.GlobalColor.transparent)
+            page_images.append(page)
+            pages.append({
+                'file': f"{name}_{page_index}.png",
+                'width': page.width(),
+                'height': page.height()
+            })
+
+        painters = [QPainter(page) for page in page_images]
+        for image, (page_index, x, y) in zip(unique_images, placements):
+            painters[page_index].drawImage(x, y, image)
+        for painter in painters:
+            painter.end()
+
+        for page, page_info in zip(page_images, pages):
+            path = os.path.join(output_dir, page_info['file'])
+            if not page.save(path, "PNG"):
+                raise OSError(f"Can't write {path}")
+
+        manifest_sprites = {}
+        for (sprite_name, image, insets), image_index in zip(sprites, sprite_images):
+            page_index, x, y = placements[image_index]
+            page_width = pages[page_index]['width']
+            page_height = pages[page_index]['height']
+            manifest_sprites[sprite_name] = {
+                'page': page_index,
+                'x': x,
+                'y': y,
+                'width': image.width(),
+                'height': image.height(),
+                'uv': [
+                    round(x / page_width, 6),
+                    round(y / page_height, 6),
+                    round((x + image.width()) / page_width, 6),
+                    round((y + image.height()) / page_height, 6)
+                ],
+                'nine_slice': insets
+            }
+
+        manifest = {
+            'version': 1,
+            'pages': pages,
+            'sprites': manifest_sprites,
+            'failed': [{'index': result.index, 'error': result.error}
+                       for result in sorted(failures, key=lambda result: result.index)]
+        }
+        with open(os.path.join(output_dir, f"{name}.json"), 'w', encoding='utf-8') as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+        return manifest
@@ -0,0 +1,299 @@
+"""
+Virtualized gallery of generated widgets
+"""
+from bisect import bisect_left, bisect_right
+
+from PyQt6.QtWidgets import QAbstractScrollArea
+from PyQt6.QtCore import QRect, QTimer
+from PyQt6.QtGui import QColor, QPainter
+
+from .pattern_cache import PixmapCache
+
+
+class WidgetGallery(QAbstractScrollArea):
+    """
+    Grid of widgets where only cells in or near the viewport have live widgets
+
+    Cells are added as factories (callable taking parent widget and returning new widget).
+    While scrolling, cells without live widget are drawn from snapshot pixmaps;
+    live widgets are created and released once scrolling stops, so scroll cost
+    doesn't depend on number of cells.
+
+    Cells with the same key share size and snapshot, so key must describe everything
+    that changes look of a fresh widget. Released widgets are recreated by their
+    factory, state changed by user (selection, text, value) is not kept.
+    """
+    COLUMNS = 4
+    SPACING = 6
+    MARGIN = 9
+    LIVE_MARGIN = 200  # px above and below viewport where cells stay live
+    SETTLE_INTERVAL = 50  # ms without scrolling before live widgets are updated
+    SNAPSHOT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+    PLACEHOLDER_COLOR = QColor('#ADB0C4')
+
+    def __init__(self, columns=COLUMNS, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.snapshots = PixmapCache(self.SNAPSHOT_MAX_BYTES)
+        self.next_key = 0
+        self.batch_depth = 0
+
+        # Live widgets are updated when scrolling stops
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(self.SETTLE_INTERVAL)
+        self.settle_timer.timeout.connect(self.update_live_widgets)
+
+        self.verticalScrollBar().setSingleStep(20)
+        self.horizontalScrollBar().setSingleStep(20)
+        self.reset_cells()
+
+    def reset_cells(self):
+        """Forget all cells"""
+        self.factories = []  # cell index -> factory
+        self.keys = []  # cell index -> snapshot key
+        self.sizes = {}  # key -> QSize of widget
+        self.row_tops = []  # row -> y in content
+        self.row_heights = []
+        self.column_widths = [0] * self.columns
+        self.live_widgets = {}  # cell index -> widget
+
+    def add_widget(self, factory, key=None):
+        """
+        Add cell with widget built by factory and return cell index
+
+        Factory is called right away only if the cell is near viewport
+        or its key wasn't measured yet.
+        """
+        if key is None:
+            key = ('cell', self.next_key)
+            self.next_key += 1
+
+        index = len(self.factories)
+        self.factories.append(factory)
+        self.keys.append(key)
+
+        widget = None
+        size = self.sizes.get(key)
+        if size is None:
+            # Widgets can't be grabbed while updates are suspended, batch cells only get measured
+            widget = self.create_widget(index, snapshot=not self.batch_depth)
+            size = widget.size()
+
+        cells_changed = self.place_cell(index, size)
+
+        # In batch mode layout, live widgets and repaint wait for end_batch
+        if self.batch_depth:
+            if widget is not None:
+                self.release_widget(widget)
+            return index
+
+        if cells_changed:
+            self.position_live_widgets()
+
+        if self.is_live_row(index // self.columns):
+            if widget is None:
+                widget = self.create_widget(index)
+            self.live_widgets[index] = widget
+            self.position_widget(index, widget)
+            widget.show()
+        elif widget is not None:
+            self.release_widget(widget)
+
+        self.update_scroll_range()
+        self.viewport().update()
+        return index
+
+    def begin_batch(self):
+        """Suspend layout and repaint until matching end_batch (calls can be nested)"""
+        if not self.batch_depth:
+            self.setUpdatesEnabled(False)
+        self.batch_depth += 1
+
+    def end_batch(self):
+        """Lay out cells added since begin_batch and repaint once"""
+        self.batch_depth -= 1
+        if self.batch_depth:
+            return
+        self.setUpdatesEnabled(True)
+        self.update_scroll_range()
+        self.update_live_widgets()
+        self.viewport().update()
+
+    def clear(self):
+        """Remove all cells, release live widgets and drop snapshots"""
+        self.settle_timer.stop()
+        for widget in self.live_widgets.values():
+            self.release_widget(widget)
+        self.reset_cells()
+        self.snapshots.clear()
+        self.update_scroll_range()
+        self.viewport().update()
+
+    def count(self):
+        """Return number of cells"""
+        return len(self.factories)
+
+    def live_count(self):
+        """Return number of live widgets"""
+        return len(self.live_widgets)
+
+    def get_stats(self):
+        """Return cell, live widget and snapshot counters"""
+        return {
+            'cells': len(self.factories),
+            'live': len(self.live_widgets),
+            'snapshots': self.snapshots.get_stats()
+        }
+
+    def create_widget(self, index, snapshot=True):
+        """Build widget of cell, remember its size and take snapshot if missing"""
+        key = self.keys[index]
+        widget = self.factories[index](self.viewport())
+        widget.adjustSize()
+        self.sizes.setdefault(key, widget.size())
+        if snapshot and key not in self.snapshots.entries:
+            self.snapshots.insert(key, widget.grab())
+        return widget
+
+    @staticmethod
+    def release_widget(widget):
+        """Hide and delete widget that left the live area"""
+        widget.hide()
+        widget.deleteLater()
+
+    def place_cell(self, index, size):
+        """Grow row and column of cell to fit size, return True if column width or row height changed"""
+        row, col = divmod(index, self.columns)
+        if row == len(self.row_heights):
+            if self.row_heights:
+                top = self.row_tops[-1] + self.row_heights[-1] + self.SPACING
+            else:
+                top = self.MARGIN
+            self.row_tops.append(top)
+            self.row_heights.append(0)
+
+        changed = False
+        if size.height() > self.row_heights[row]:
+            # Widgets already in the row are centred on the old height
+            self.row_heights[row] = size.height()
+            changed = True
+        if size.width() > self.column_widths[col]:
+            self.column_widths[col] = size.width()
+            changed = True
+        return changed
+
+    def cell_rect(self, index):
+        """Return cell rect in content coordinates"""
+        row, col = divmod(index, self.columns)
+        x = self.MARGIN + sum(self.column_widths[:col]) + col * self.SPACING
+        return QRect(x, self.row_tops[row], self.column_widths[col], self.row_heights[row])
+
+    def widget_rect(self, index):
+        """Return rect of cell widget centered in cell, in viewport coordinates"""
+        cell = self.cell_rect(index)
+        size = self.sizes[self.keys[index]]
+        return QRect(
+            cell.x() + (cell.width() - size.width()) // 2 - self.horizontalScrollBar().value(),
+            cell.y() + (cell.height() - size.height()) // 2 - self.verticalScrollBar().value(),
+            size.width(),
+            size.height()
+        )
+
+    def content_size(self):
+        """Return (width, height) of whole grid"""
+        width = 2 * self.MARGIN + sum(self.column_widths) + (self.columns - 1) * self.SPACING
+        if self.row_heights:
+            height = self.row_tops[-1] + self.row_heights[-1] + self.MARGIN
+        else:
+            height = 0
+        return width, height
+
+    def update_scroll_range(self):
+        """Fit scroll bar ranges to content and viewport"""
+        width, height = self.content_size()
+        viewport = self.viewport()
+        self.horizontalScrollBar().setRange(0, max(0, width - viewport.width()))
+        self.horizontalScrollBar().setPageStep(viewport.width())
+        self.verticalScrollBar().setRange(0, max(0, height - viewport.height()))
+        self.verticalScrollBar().setPageStep(viewport.height())
+
+    def row_range(self, top, bottom):
+        """Return (first, last) rows intersecting content span [top, bottom), last excluded"""
+        first = max(bisect_right(self.row_tops, top) - 1, 0)
+        last = bisect_left(self.row_tops, bottom)
+        return first, last
+
+    def live_span(self):
+        """Return content span [top, bottom) where cells are live"""
+        top = self.verticalScrollBar().value()
+        return top - self.LIVE_MARGIN, top + self.viewport().height() + self.LIVE_MARGIN
+
+    def is_live_row(self, row):
+        """Check if row is inside the live area"""
+        top, bottom = self.live_span()
+        return self.row_tops[row] < bottom and self.row_tops[row] + self.row_heights[row] > top
+
+    def position_widget(self, index, widget):
+        """Move live widget to its cell"""
+        widget.move(self.widget_rect(index).topLeft())
+
+    def position_live_widgets(self):
+        """Move all live widgets to their cells"""
+        for index, widget in self.live_widgets.items():
+            self.position_widget(index, widget)
+
+    def update_live_widgets(self):
+        """Create widgets for cells that entered the live area and release the rest"""
+        if not self.factories:
+            return
+
+        first, last = self.row_range(*self.live_span())
+        first_index = first * self.columns
+        last_index = min(last * self.columns, len(self.factories))
+
+        for index in [index for index in self.live_widgets if not first_index <= index < last_index]:
+            self.release_widget(self.live_widgets.pop(index))
+
+        for index in range(first_index, last_index):
+            widget = self.live_widgets.get(index)
+            if widget is None:
+                widget = self.create_widget(index)
+                self.live_widgets[index] = widget
+            self.position_widget(index, widget)
+            widget.show()
+
+    def scrollContentsBy(self, dx, dy):
+        """Scroll pixels and live widgets, update live area when scrolling stops"""
+        self.viewport().scroll(dx, dy)
+        self.settle_timer.start()
+
+    def resizeEvent(self, event):
+        """Fit scroll range to new viewport size"""
+        super().resizeEvent(event)
+        self.update_scroll_range()
+        self.settle_timer.start()
+
+    def paintEvent(self, event):
+        """Draw snapshots of visible cells that have no live widget"""
+        if not self.factories:
+            return
+
+        rect = event.rect()
+        top = self.verticalScrollBar().value()
+        first, last = self.row_range(rect.top() + top, rect.bottom() + 1 + top)
+        last_index = min(last * self.columns, len(self.factories))
+
+        painter = QPainter(self.viewport())
+        for index in range(first * self.columns, last_index):
+            if index in self.live_widgets:
+                continue
+            target = self.widget_rect(index)
+            if not target.intersects(rect):
+                continue
+            pixmap = self.snapshots.get(self.keys[index])
+            if pixmap is not None:
+                painter.drawPixmap(target.topLeft(), pixmap)
+            else:
+                painter.fillRect(target, self.PLACEHOLDER_COLOR)
+        painter.end()
@@ -2,12 +2,14 @@
 Main button generator - program interface with Entry support
 """
 import sys
+import json
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QGroupBox, QGridLayout, QScrollArea, QTextEdit,
-    QLabel, QSpinBox, QCheckBox, QComboBox, QMessageBox
+    QGroupBox, QGridLayout, QTextEdit,
+    QLabel, QSpinBox, QCheckBox, QComboBox, QMessageBox, QFileDialog
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, QEvent
+from PyQt6.QtGui import QKeySequence, QShortcut
 
 from managers import TogglePatternManager, ButtonPatternManager, ButtonPresetManager
 from .minecraft_button import MinecraftButton
@@ -15,12 +17,32 @@ from .minecraft_radio_button import MinecraftRadioButton, MinecraftRadioGroup
 from .minecraft_toggle_button import MinecraftToggleButton
 from .minecraft_slider import MinecraftSlider
 from .minecraft_entry import MinecraftEntry
+from .widget_gallery import WidgetGallery
+from .widget_specs import WidgetSpecs
+from .code_exporter import CodeExporter
+from .performance_hud import PerformanceMonitor, PerformanceHud, timed_section
 
 class WidgetGenerator(QWidget):
     """
     Main button generator with support for all widgets
     """
 
+    PREVIEW_UPDATE_INTERVAL = 16  # ms, one frame at 60 Hz
+
+    # Optional performance HUD (F3), Ctrl+F3 records its samples to a file.
+    # Class attributes: window events arrive before __init__ finishes
+    performance_monitor = None
+    hud = None
+
+    # Preview widget attributes for every widget type
+    PREVIEW_ATTRIBUTES = {
+        "button": ("preview_button",),
+        "radio": ("preview_radio", "preview_radio2"),
+        "entry": ("preview_entry",),
+        "toggle": ("preview_toggle",),
+        "slider": ("preview_slider",)
+    }
+
     def __init__(self):
         super().__init__()
 
@@ -34,6 +56,7 @@ class WidgetGenerator(QWidget):
         self.preview_slider = None
         self.preview_entry = None
         self.preview_group = None
+        # Gallery cell indices of generated widgets
         self.generated_buttons = []
         self.generated_radios = []
         self.generated_toggles = []
@@ -41,8 +64,19 @@ class WidgetGenerator(QWidget):
         self.generated_entries = []
         self.code_dialog = None
 
+        # Preview updates are merged: settings changes within one frame cause one update
+        self.preview_requests = 0
+        self.preview_updates = 0
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(self.PREVIEW_UPDATE_INTERVAL)
+        self.preview_timer.timeout.connect(self.update_preview)
+
         self.setup_ui()
 
+        QShortcut(QKeySequence('F3'), self).activated.connect(self.toggle_hud)
+        QShortcut(QKeySequence('Ctrl+F3'), self).activated.connect(self.toggle_hud_recording)
+
     def setup_ui(self):
         """Setup interface"""
         main_layout = QHBoxLayout()
@@ -58,7 +92,7 @@ class WidgetGenerator(QWidget):
         self.setLayout(main_layout)
         self.setStyleSheet("background-color: #2C2C2C;")
 
-        self.update_preview()
+        self.schedule_preview()
 
     def create_settings_panel(self):
         """Create settings panel"""
@@ -111,7 +145,7 @@ class WidgetGenerator(QWidget):
         self.scale_input = QSpinBox()
         self.scale_input.setRange(4, 16)
         self.scale_input.setValue(8)
-        self.scale_input.valueChanged.connect(self.update_preview)
+        self.scale_input.valueChanged.connect(self.schedule_preview)
         basic_layout.addWidget(self.scale_input, 0, 1)
 
         # Button size (in proportional pixels) - only for regular buttons
@@ -120,7 +154,7 @@ class WidgetGenerator(QWidget):
         self.width_input = QSpinBox()
         self.width_input.setRange(4, 32)
         self.width_input.setValue(16)
-        self.width_input.valueChanged.connect(self.update_preview)
+        self.width_input.valueChanged.connect(self.schedule_preview)
         basic_layout.addWidget(self.width_input, 1, 1)
 
         self.size_label_height = QLabel("Button Height:")
@@ -128,7 +162,7 @@ class WidgetGenerator(QWidget):
         self.height_input = QSpinBox()
         self.height_input.setRange(4, 32)
         self.height_input.setValue(15)
-        self.height_input.valueChanged.connect(self.update_preview)
+        self.height_input.valueChanged.connect(self.schedule_preview)
         basic_layout.addWidget(self.height_input, 2, 1)
 
         # Entry width - only for Entry widgets
@@ -137,7 +171,7 @@ class WidgetGenerator(QWidget):
         self.entry_width_input = QSpinBox()
         self.entry_width_input.setRange(20, 100)
         self.entry_width_input.setValue(60)
-        self.entry_width_input.valueChanged.connect(self.update_preview)
+        self.entry_width_input.valueChanged.connect(self.schedule_preview)
         basic_layout.addWidget(self.entry_width_input, 3, 1)
 
         # Slider orientation
@@ -145,7 +179,7 @@ class WidgetGenerator(QWidget):
         basic_layout.addWidget(self.orientation_label, 4, 0)
         self.orientation_combo = QComboBox()
         self.orientation_combo.addItems(["Vertical", "Horizontal"])
-        self.orientation_combo.currentTextChanged.connect(self.update_preview)
+        self.orientation_combo.currentTextChanged.connect(self.schedule_preview)
         basic_layout.addWidget(self.orientation_combo, 4, 1)
 
         # Slider length
@@ -154,7 +188,7 @@ class WidgetGenerator(QWidget):
         self.slider_length_input = QSpinBox()
         self.slider_length_input.setRange(10, 60)
         self.slider_length_input.setValue(30)
-        self.slider_length_input.valueChanged.connect(self.update_preview)
+        self.slider_length_input.valueChanged.connect(self.schedule_preview)
         basic_layout.addWidget(self.slider_length_input, 5, 1)
 
         # Hide entry width fields by default
@@ -190,7 +224,7 @@ class WidgetGenerator(QWidget):
         pattern_layout = QVBoxLayout()
 
         self.pattern_combo = QComboBox()
-        self.pattern_combo.addItems(TogglePatternManager.get_patterns().keys())
+        self.pattern_combo.addItems(TogglePatternManager.get_pattern_names())
         self.pattern_combo.setCurrentText('Standard')  # Default standard pattern
         self.pattern_combo.currentTextChanged.connect(self.apply_pattern)
         pattern_layout.addWidget(self.pattern_combo)
@@ -204,7 +238,7 @@ class WidgetGenerator(QWidget):
         button_pattern_layout = QVBoxLayout()
 
         self.button_pattern_combo = QComboBox()
-        self.button_pattern_combo.addItems(ButtonPatternManager.get_patterns().keys())
+        self.button_pattern_combo.addItems(ButtonPatternManager.get_pattern_names())
         self.button_pattern_combo.setCurrentText('None')  # No pattern by default
         self.button_pattern_combo.currentTextChanged.connect(self.apply_button_pattern)
         button_pattern_layout.addWidget(self.button_pattern_combo)
@@ -219,7 +253,7 @@ class WidgetGenerator(QWidget):
 
         self.animation_check = QCheckBox("Enable Press Animation")
         self.animation_check.setChecked(True)
-        self.animation_check.toggled.connect(self.update_preview)
+        self.animation_check.toggled.connect(self.schedule_preview)
         options_layout.addWidget(self.animation_check)
 
         options_group.setLayout(options_layout)
@@ -233,6 +267,10 @@ class WidgetGenerator(QWidget):
         generate_btn.clicked.connect(self.generate_widget)
         actions_layout.addWidget(generate_btn)
 
+        generate_file_btn = QPushButton("📂 Generate From File")
+        generate_file_btn.clicked.connect(self.generate_from_file)
+        actions_layout.addWidget(generate_file_btn)
+
         save_preset_btn = QPushButton("💾 Save Preset")
         save_preset_btn.clicked.connect(self.save_preset)
         actions_layout.addWidget(save_preset_btn)
@@ -241,6 +279,10 @@ class WidgetGenerator(QWidget):
         export_code_btn.clicked.connect(self.export_code)
         actions_layout.addWidget(export_code_btn)
 
+        export_module_btn = QPushButton("📦 Export Module")
+        export_module_btn.clicked.connect(self.export_module)
+        actions_layout.addWidget(export_module_btn)
+
         layout.addLayout(actions_layout)
         layout.addStretch()
 
@@ -270,15 +312,12 @@ class WidgetGenerator(QWidget):
         generated_group = QGroupBox("🏭 GENERATED WIDGETS")
         generated_group.setStyleSheet("QGroupBox { color: white;}")
 
-        self.scroll_area = QScrollArea()
-        self.scroll_content = QWidget()
-        self.scroll_layout = QGridLayout(self.scroll_content)
-        self.scroll_area.setWidget(self.scroll_content)
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet("background-color: #CBCCD4;")
+        # Only widgets near the visible area are live, the rest are drawn from snapshots
+        self.gallery = WidgetGallery(columns=4)
+        self.gallery.setStyleSheet("background-color: #CBCCD4;")
 
         generated_layout = QVBoxLayout()
-        generated_layout.addWidget(self.scroll_area)
+        generated_layout.addWidget(self.gallery)
 
         clear_btn = QPushButton("🗑️ Clear All")
         clear_btn.setStyleSheet("QPushButton { color: white; background-color: #9A9FB4; border: 1px solid #ADB0C4; padding: 5px; }")
@@ -396,22 +435,39 @@ class WidgetGenerator(QWidget):
                 self.button_pattern_group.hide()
                 self.pattern_group.hide()
 
-            self.update_preview()
+            self.schedule_preview()
+
+    def schedule_preview(self, *args):
+        """Request preview update, all requests within one frame are merged into one update"""
+        self.preview_requests += 1
+        if not self.preview_timer.isActive():
+            self.preview_timer.start()
+
+    def get_preview_stats(self):
+        """Return number of requested and performed preview updates"""
+        return {
+            'requested': self.preview_requests,
+            'performed': self.preview_updates,
+            'saved': self.preview_requests - self.preview_updates
+        }
 
+    @timed_section('update_preview')
     def update_preview(self):
         """Update widget preview"""
-        # Remove old widgets
-        for widget in [self.preview_button, self.preview_radio, self.preview_radio2,
-                      self.preview_toggle, self.preview_slider, self.preview_entry]:
-            if widget:
-                widget.deleteLater()
-
-        self.preview_button = None
-        self.preview_radio = None
-        self.preview_radio2 = None
-        self.preview_toggle = None
-        self.preview_slider = None
-        self.preview_entry = None
+        self.preview_timer.stop()  # Pending request is handled by this update
+        self.preview_updates += 1
+
+        # Remove widgets of other types, widget of current type is reconfigured in place
+        for widget_type, attributes in self.PREVIEW_ATTRIBUTES.items():
+            if widget_type == self.current_widget_type:
+                continue
+            for attribute in attributes:
+                widget = getattr(self, attribute)
+                if widget:
+                    widget.deleteLater()
+                    setattr(self, attribute, None)
+        if self.current_widget_type != "radio":
+            self.preview_group = None
 
         # Create configuration depending on widget type
         if self.current_widget_type == "button":
@@ -424,7 +480,10 @@ class WidgetGenerator(QWidget):
             }
             config.update(self.current_config)
 
-            self.preview_button = MinecraftButton('', config, self.preview_container)
+            if self.preview_button:
+                self.preview_button.reconfigure(config)
+            else:
+                self.preview_button = MinecraftButton('', config, self.preview_container)
             button_pattern_name = self.button_pattern_combo.currentText()
             self.preview_button.set_pattern(button_pattern_name)
 
@@ -442,8 +501,19 @@ class WidgetGenerator(QWidget):
             }
             config.update(self.current_config)
 
-            self.preview_radio = MinecraftRadioButton("", config, self.preview_container)
-            self.preview_radio2 = MinecraftRadioButton("", config, self.preview_container)
+            if self.preview_radio:
+                self.preview_radio.reconfigure(config)
+                self.preview_radio2.reconfigure(config)
+            else:
+                self.preview_radio = MinecraftRadioButton("", config, self.preview_container)
+                self.preview_radio2 = MinecraftRadioButton("", config, self.preview_container)
+
+                self.preview_radio.set_selected(True)
+                self.preview_radio2.set_selected(False)
+
+                self.preview_group = MinecraftRadioGroup()
+                self.preview_group.add_radio_button(self.preview_radio)
+                self.preview_group.add_radio_button(self.preview_radio2)
 
             radio_spacing = 20
             total_width = self.preview_radio.width() * 2 + radio_spacing
@@ -453,13 +523,6 @@ class WidgetGenerator(QWidget):
             self.preview_radio.move(start_x, y_pos)
             self.preview_radio2.move(start_x + self.preview_radio.width() + radio_spacing, y_pos)
 
-            self.preview_radio.set_selected(True)
-            self.preview_radio2.set_selected(False)
-
-            self.preview_group = MinecraftRadioGroup()
-            self.preview_group.add_radio_button(self.preview_radio)
-            self.preview_group.add_radio_button(self.preview_radio2)
-
             self.preview_radio.show()
             self.preview_radio2.show()
 
@@ -472,7 +535,10 @@ class WidgetGenerator(QWidget):
             }
             config.update(self.current_config)
 
-            self.preview_entry = MinecraftEntry(placeholder="Sample text...", style_config=config, parent=self.preview_container)
+            if self.preview_entry:
+                self.preview_entry.reconfigure(config)
+            else:
+                self.preview_entry = MinecraftEntry(placeholder="Sample text...", style_config=config, parent=self.preview_container)
 
             self.preview_entry.move(
                 (self.preview_container.width() - self.preview_entry.width()) // 2,
@@ -487,7 +553,10 @@ class WidgetGenerator(QWidget):
             }
             config.update(self.current_config)
 
-            self.preview_toggle = MinecraftToggleButton(config, self.preview_container)
+            if self.preview_toggle:
+                self.preview_toggle.reconfigure(config)
+            else:
+                self.preview_toggle = MinecraftToggleButton(config, self.preview_container)
             pattern_name = self.pattern_combo.currentText()
             self.preview_toggle.set_pattern(pattern_name)
 
@@ -540,8 +609,11 @@ class WidgetGenerator(QWidget):
                 if 'button_normal' in self.current_config:
                     config['track_fill_color'] = self.current_config['button_normal']
 
-            self.preview_slider = MinecraftSlider(config, self.preview_container)
-            self.preview_slider.set_value(0.5)
+            if self.preview_slider:
+                self.preview_slider.reconfigure(config)
+            else:
+                self.preview_slider = MinecraftSlider(config, self.preview_container)
+                self.preview_slider.set_value(0.5)
 
             self.preview_slider.move(
                 (self.preview_container.width() - self.preview_slider.width()) // 2,
@@ -554,207 +626,183 @@ class WidgetGenerator(QWidget):
         presets = ButtonPresetManager.get_presets()
         if preset_name in presets:
             self.current_config.update(presets[preset_name])
-            self.update_preview()
+            self.schedule_preview()
 
     def apply_pattern(self, pattern_name):
         """Apply pattern for toggle switch"""
         if self.current_widget_type == "toggle" and self.preview_toggle:
             self.preview_toggle.set_pattern(pattern_name)
-            self.update_preview()
 
     def apply_button_pattern(self, pattern_name):
         """Apply pattern for button"""
         if self.current_widget_type == "button" and self.preview_button:
             self.preview_button.set_pattern(pattern_name)
 
-    def generate_widget(self):
-        """Generate new widget"""
+    def get_widget_spec(self):
+        """Return spec of widget described by current settings"""
+        orientation = self.orientation_combo.currentText().lower()
+        spec = {
+            'type': self.current_widget_type,
+            'scale': self.scale_input.value(),
+            'style': dict(self.current_config),
+            'animation_enabled': self.animation_check.isChecked()
+        }
         if self.current_widget_type == "button":
-            config = {
-                'button_width': self.width_input.value(),
-                'button_height': self.height_input.value(),
-                'scale': self.scale_input.value(),
-                'animation_enabled': self.animation_check.isChecked(),
-                'has_shadow': True
-            }
-            config.update(self.current_config)
-
-            button = MinecraftButton('', config)
-            button_pattern_name = self.button_pattern_combo.currentText()
-            button.set_pattern(button_pattern_name)
-            button.clicked.connect(lambda: print("Button clicked!"))
-
-            item_count = self.scroll_layout.count()
-            row = item_count // 4
-            col = item_count % 4
-            self.scroll_layout.addWidget(button, row, col)
-            self.generated_buttons.append(button)
-
-        elif self.current_widget_type == "radio":
-            config = {
-                'text': "",
-                'scale': self.scale_input.value(),
-                'has_shadow': True
-            }
-            config.update(self.current_config)
-
-            radio1 = MinecraftRadioButton("", config)
-            radio2 = MinecraftRadioButton("", config)
-
-            radio_group = MinecraftRadioGroup()
-            radio_group.add_radio_button(radio1)
-            radio_group.add_radio_button(radio2)
-
-            radio1.set_selected(True)
-            radio2.set_selected(False)
-
-            radio1.clicked.connect(lambda: print("Radio 1 clicked!"))
-            radio2.clicked.connect(lambda: print("Radio 2 clicked!"))
-            radio1.stateChanged.connect(lambda selected: print(f"Radio 1 {'selected' if selected else 'deselected'}"))
-            radio2.stateChanged.connect(lambda selected: print(f"Radio 2 {'selected' if selected else 'deselected'}"))
-
-            item_count = self.scroll_layout.count()
-            row = item_count // 4
-            col = item_count % 4
-
-            radio_container = QWidget()
-            radio_layout = QHBoxLayout(radio_container)
-            radio_layout.setSpacing(10)
-            radio_layout.setContentsMargins(0, 0, 0, 0)
-            radio_layout.addWidget(radio1)
-            radio_layout.addWidget(radio2)
-
-            self.scroll_layout.addWidget(radio_container, row, col)
-            self.generated_radios.extend([radio_container, radio_group])
-
+            spec.update(width=self.width_input.value(), height=self.height_input.value(),
+                        pattern=self.button_pattern_combo.currentText())
         elif self.current_widget_type == "entry":
-            config = {
-                'entry_width': self.entry_width_input.value(),
-                'entry_height': 12,
-                'scale': self.scale_input.value(),
-                'placeholder': "Enter text..."
-            }
-            config.update(self.current_config)
-
-            entry = MinecraftEntry(placeholder="Enter text...", style_config=config)
-            entry.textChanged.connect(lambda text: print(f"Entry text changed: {text}"))
-            entry.returnPressed.connect(lambda: print(f"Entry submitted: {entry.get_text()}"))
-
-            item_count = self.scroll_layout.count()
-            row = item_count // 4
-            col = item_count % 4
-            self.scroll_layout.addWidget(entry, row, col)
-
-            self.generated_entries.append(entry)
-            print(f"Generated Entry (width: {self.entry_width_input.value()}px) with {self.preset_combo.currentText()} preset")
-
+            spec['width'] = self.entry_width_input.value()
         elif self.current_widget_type == "toggle":
-            config = {
-                'scale': self.scale_input.value(),
-                'has_shadow': True
-            }
-            config.update(self.current_config)
-
-            toggle = MinecraftToggleButton(config)
-            pattern_name = self.pattern_combo.currentText()
-            toggle.set_pattern(pattern_name)
-
-            toggle.clicked.connect(lambda: print("Toggle clicked!"))
-            toggle.stateChanged.connect(lambda toggled: print(f"Toggle {'ON' if toggled else 'OFF'}"))
-
-            item_count = self.scroll_layout.count()
-            row = item_count // 4
-            col = item_count % 4
-            self.scroll_layout.addWidget(toggle, row, col)
-            self.generated_toggles.append(toggle)
-
+            spec['pattern'] = self.pattern_combo.currentText()
         elif self.current_widget_type == "slider":
-            orientation = self.orientation_combo.currentText().lower()
-            track_length = self.slider_length_input.value()
-
-            if orientation == 'vertical':
-                track_width = 6
-                track_height = track_length
-            else:
-                track_width = track_length
-                track_height = 6
-
-            config = {
-                'scale': self.scale_input.value(),
-                'orientation': orientation,
-                'track_width': track_width,
-                'track_height': track_height,
-                'has_shadow': True,
-                'slider_button_config': {
-                    'button_width': 8,
-                    'button_height': 6,
-                    'scale': self.scale_input.value(),
-                    'border_color': '#413F54',
-                    'animation_enabled': False,
-                    'button_normal': '#9A9FB4',
-                    'button_hover': '#9A9FB4',
-                    'button_pressed': '#9A9FB4',
-                    'border_normal': '#ADB0C4',
-                    'border_hover': '#ADB0C4',
-                    'border_pressed': '#ADB0C4',
-                    'bottom_normal': '#9A9FB4',
-                    'bottom_hover': '#9A9FB4',
-                    'bottom_pressed': '#9A9FB4',
-                    'text_color': 'white',
-                    'font_family': 'Minecraftia',
-                    'has_shadow': True
-                },
-                'track_border_color': '#F2F2F2',
-                'track_fill_color': '#9A9FB4'
-            }
-
-            if self.current_config:
-                button_config = config['slider_button_config']
-                if 'button_normal' in self.current_config:
-                    button_config['button_normal'] = self.current_config['button_normal']
-                    button_config['button_hover'] = self.current_config['button_normal']
-                    button_config['button_pressed'] = self.current_config['button_normal']
-                if 'border_normal' in self.current_config:
-                    button_config['border_normal'] = self.current_config['border_normal']
-                    button_config['border_hover'] = self.current_config['border_normal']
-                    button_config['border_pressed'] = self.current_config['border_normal']
-                if 'bottom_normal' in self.current_config:
-                    button_config['bottom_normal'] = self.current_config['bottom_normal']
-                    button_config['bottom_hover'] = self.current_config['bottom_normal']
-                    button_config['bottom_pressed'] = self.current_config['bottom_normal']
-                if 'button_normal' in self.current_config:
-                    config['track_fill_color'] = self.current_config['button_normal']
-                if 'border_color' in self.current_config:
-                    button_config['border_color'] = self.current_config['border_color']
-                config['track_border_color'] = '#F2F2F2'
-
-            slider = MinecraftSlider(config)
+            spec.update(orientation=orientation, length=self.slider_length_input.value())
+        return spec
+
+    def create_widget_factory(self, spec):
+        """
+        Return (factory, key) for widget spec (see WidgetSpecs)
+
+        factory - callable taking parent and returning new widget
+        key - describes look of the widget, equal keys share gallery snapshots
+        """
+        widget_type = WidgetSpecs.get_type(spec)
+        config = WidgetSpecs.build_config(spec)
+        pattern_name = WidgetSpecs.get_pattern(spec)
+        key = (widget_type, repr(config), pattern_name)
+
+        if widget_type == "button":
+            def create_button(parent):
+                button = MinecraftButton('', config, parent)
+                button.set_pattern(pattern_name)
+                button.clicked.connect(lambda: print("Button clicked!"))
+                return button
+
+            return create_button, key
+
+        if widget_type == "radio":
+            def create_radio_pair(parent):
+                radio_container = QWidget(parent)
+                radio1 = MinecraftRadioButton("", config)
+                radio2 = MinecraftRadioButton("", config)
+
+                # Container owns the group, Qt deletes it with the container
+                radio_group = MinecraftRadioGroup(radio_container)
+                radio_group.add_radio_button(radio1)
+                radio_group.add_radio_button(radio2)
+                radio_container.radio_group = radio_group
+
+                radio1.set_selected(True)
+                radio2.set_selected(False)
+
+                radio1.clicked.connect(lambda: print("Radio 1 clicked!"))
+                radio2.clicked.connect(lambda: print("Radio 2 clicked!"))
+                radio1.stateChanged.connect(lambda selected: print(f"Radio 1 {'selected' if selected else 'deselected'}"))
+                radio2.stateChanged.connect(lambda selected: print(f"Radio 2 {'selected' if selected else 'deselected'}"))
+
+                radio_layout = QHBoxLayout(radio_container)
+                radio_layout.setSpacing(10)
+                radio_layout.setContentsMargins(0, 0, 0, 0)
+                radio_layout.addWidget(radio1)
+                radio_layout.addWidget(radio2)
+                return radio_container
+
+            return create_radio_pair, key
+
+        if widget_type == "entry":
+            def create_entry(parent):
+                entry = MinecraftEntry(placeholder="Enter text...", style_config=config, parent=parent)
+                entry.textChanged.connect(lambda text: print(f"Entry text changed: {text}"))
+                entry.returnPressed.connect(lambda: print(f"Entry submitted: {entry.get_text()}"))
+                return entry
+
+            return create_entry, key
+
+        if widget_type == "toggle":
+            def create_toggle(parent):
+                toggle = MinecraftToggleButton(config, parent)
+                toggle.set_pattern(pattern_name)
+
+                toggle.clicked.connect(lambda: print("Toggle clicked!"))
+                toggle.stateChanged.connect(lambda toggled: print(f"Toggle {'ON' if toggled else 'OFF'}"))
+                return toggle
+
+            return create_toggle, key
+
+        # Slider
+        orientation = config['orientation']
+        track_length = config['track_height'] if orientation == 'vertical' else config['track_width']
+
+        def on_slider_change(value):
+            percentage = int(value * 100)
+            length_info = f"length {track_length}px"
+            print(f"Slider {orientation} ({length_info}): {percentage}%")
+
+        def create_slider(parent):
+            slider = MinecraftSlider(config, parent)
             slider.set_value(0.5)
             slider.valueChanged.connect(lambda value: print(f"Slider value: {value:.2f}"))
-
-            def on_slider_change(value):
-                percentage = int(value * 100)
-                length_info = f"length {track_length}px"
-                print(f"Slider {orientation} ({length_info}): {percentage}%")
-
             slider.valueChanged.connect(on_slider_change)
+            return slider
 
-            item_count = self.scroll_layout.count()
-            row = item_count // 4
-            col = item_count % 4
-            self.scroll_layout.addWidget(slider, row, col)
-            self.generated_sliders.append(slider)
+        return create_slider, key
 
-            print(f"Generated {orientation} slider (length: {track_length}px) with {self.preset_combo.currentText()} preset")
+    @timed_section('generate_widget')
+    def generate_widget(self):
+        """Generate new widget"""
+        self.generate_widgets([self.get_widget_spec()])
+
+        if self.current_widget_type == "entry":
+            print(f"Generated Entry (width: {self.entry_width_input.value()}px) with {self.preset_combo.currentText()} preset")
+        elif self.current_widget_type == "slider":
+            orientation = self.orientation_combo.currentText().lower()
+            print(f"Generated {orientation} slider (length: {self.slider_length_input.value()}px) with {self.preset_combo.currentText()} preset")
+
+    def generate_widgets(self, specs):
+        """
+        Generate widgets for a sequence of specs (see create_widget_factory)
+
+        Gallery layout and repaint are suspended for the whole batch,
+        the gallery is laid out once at the end. Returns gallery cell indices.
+        """
+        generated_lists = {
+            "button": self.generated_buttons,
+            "radio": self.generated_radios,
+            "entry": self.generated_entries,
+            "toggle": self.generated_toggles,
+            "slider": self.generated_sliders
+        }
+        indices = []
+        self.gallery.begin_batch()
+        try:
+            for spec in specs:
+                factory, key = self.create_widget_factory(spec)
+                index = self.gallery.add_widget(factory, key)
+                generated_lists[spec['type']].append(index)
+                indices.append(index)
+        finally:
+            self.gallery.end_batch()
+        return indices
+
+    def generate_widgets_from_file(self, path):
+        """Generate widgets from JSON file with a list of specs"""
+        with open(path, encoding='utf-8') as spec_file:
+            specs = json.load(spec_file)
+        return self.generate_widgets(specs)
+
+    def generate_from_file(self):
+        """Ask for spec file and generate all widgets from it"""
+        path, _ = QFileDialog.getOpenFileName(self, "Widget specs", "", "JSON files (*.json)")
+        if not path:
+            return
+        try:
+            indices = self.generate_widgets_from_file(path)
+            print(f"Generated {len(indices)} widgets from {path}")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            QMessageBox.warning(self, "Error", f"Can't generate widgets from file: {e}")
 
     def clear_generated_buttons(self):
         """Clear generated widgets"""
-        for i in reversed(range(self.scroll_layout.count())):
-            item = self.scroll_layout.itemAt(i)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
+        self.gallery.clear()
 
         self.generated_buttons.clear()
         self.generated_radios.clear()
@@ -762,10 +810,79 @@ class WidgetGenerator(QWidget):
         self.generated_sliders.clear()
         self.generated_entries.clear()
 
+    def set_hud_visible(self, visible):
+        """Show or hide performance HUD, timings are collected only while it is shown"""
+        if visible == (self.hud is not None):
+            return
+        if visible:
+            self.performance_monitor = PerformanceMonitor(self)
+            self.hud = PerformanceHud(self.performance_monitor, self.get_child_counts, self)
+            self.hud.move(8, 8)
+            self.hud.show()
+        else:
+            self.performance_monitor.close()
+            self.performance_monitor.deleteLater()
+            self.hud.deleteLater()
+            self.performance_monitor = None
+            self.hud = None
+
+    def toggle_hud(self):
+        """Show or hide performance HUD"""
+        self.set_hud_visible(self.hud is None)
+
+    def toggle_hud_recording(self):
+        """Start recording HUD samples to a chosen file or stop recording"""
+        if self.performance_monitor is not None and self.performance_monitor.is_recording():
+            self.performance_monitor.stop_recording()
+            self.hud.refresh()
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Record performance", "performance.jsonl",
+                                              "JSON Lines (*.jsonl)")
+        if not path:
+            return
+        self.set_hud_visible(True)
+        try:
+            self.performance_monitor.start_recording(path)
+        except OSError as e:
+            QMessageBox.warning(self, "Error", f"Can't record to file: {e}")
+        self.hud.refresh()
+
+    def get_child_counts(self):
+        """Return live child-widget counts of preview and gallery"""
+        return {
+            'preview widgets': len(self.preview_container.findChildren(QWidget)),
+            'gallery cells': self.gallery.count(),
+            'gallery live': self.gallery.live_count(),
+            'gallery widgets': len(self.gallery.viewport().findChildren(QWidget))
+        }
+
+    def event(self, event):
+        """Time window repaints for performance HUD"""
+        if self.performance_monitor is None or event.type() != QEvent.Type.UpdateRequest:
+            return super().event(event)
+        self.performance_monitor.frame_started()
+        result = super().event(event)
+        self.performance_monitor.frame_finished()
+        return result
+
     def save_preset(self):
         """Save preset"""
         QMessageBox.information(self, "Info", "Preset saved! (Demo)")
 
+    def export_module(self):
+        """Save standalone module with precomputed widget drawing"""
+        spec = self.get_widget_spec()
+        class_name = CodeExporter.class_name(spec)
+        path, _ = QFileDialog.getSaveFileName(self, "Export Module", f"{class_name.lower()}.py",
+                                              "Python files (*.py)")
+        if not path:
+            return
+        try:
+            CodeExporter().write_module(spec, path)
+            print(f"Exported {class_name} to {path}")
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Error", f"Can't export module: {e}")
+
     def export_code(self):
         """Export code"""
         if self.current_widget_type == "button":
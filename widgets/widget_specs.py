@@ -0,0 +1,183 @@
+"""
+Widget specs - plain dicts describing widgets to build
+"""
+from managers import ButtonPresetManager
+from .minecraft_button import MinecraftButton
+from .minecraft_radio_button import MinecraftRadioButton
+from .minecraft_toggle_button import MinecraftToggleButton
+from .minecraft_slider import MinecraftSlider
+from .minecraft_entry import MinecraftEntry
+
+
+class WidgetSpecs:
+    """
+    Build widget configs from specs
+
+    Spec is a dict with 'type' (button, radio, entry, toggle, slider) and optional
+    'width', 'height', 'scale', 'preset', 'pattern', 'orientation', 'length',
+    'animation_enabled' and 'style' (config overrides applied after preset).
+    """
+    TYPES = ('button', 'radio', 'entry', 'toggle', 'slider')
+
+    # Pattern used when spec has none (only buttons and toggles have patterns)
+    DEFAULT_PATTERNS = {
+        'button': 'None',
+        'toggle': 'Standard'
+    }
+
+    @staticmethod
+    def get_type(spec):
+        """Return widget type of spec"""
+        widget_type = spec['type']
+        if widget_type not in WidgetSpecs.TYPES:
+            raise ValueError(f"Unknown widget type: {widget_type}")
+        return widget_type
+
+    @staticmethod
+    def get_pattern(spec):
+        """Return pattern name of spec or None for widgets without pattern"""
+        widget_type = WidgetSpecs.get_type(spec)
+        if widget_type not in WidgetSpecs.DEFAULT_PATTERNS:
+            return None
+        return spec.get('pattern', WidgetSpecs.DEFAULT_PATTERNS[widget_type])
+
+    @staticmethod
+    def get_style(spec):
+        """Return preset colors updated with explicit overrides"""
+        style = {}
+        if spec.get('preset'):
+            presets = ButtonPresetManager.get_presets()
+            if spec['preset'] not in presets:
+                raise ValueError(f"Unknown preset: {spec['preset']}")
+            style.update(presets[spec['preset']])
+        style.update(spec.get('style') or {})
+        return style
+
+    @staticmethod
+    def build_config(spec):
+        """Return style config of the widget described by spec"""
+        widget_type = WidgetSpecs.get_type(spec)
+        scale = spec.get('scale', 8)
+        style = WidgetSpecs.get_style(spec)
+
+        if widget_type == "button":
+            config = {
+                'button_width': spec.get('width', 16),
+                'button_height': spec.get('height', 15),
+                'scale': scale,
+                'animation_enabled': spec.get('animation_enabled', True),
+                'has_shadow': True
+            }
+            config.update(style)
+            return config
+
+        if widget_type == "radio":
+            config = {
+                'text': "",
+                'scale': scale,
+                'has_shadow': True
+            }
+            config.update(style)
+            return config
+
+        if widget_type == "entry":
+            config = {
+                'entry_width': spec.get('width', 60),
+                'entry_height': 12,
+                'scale': scale,
+                'placeholder': "Enter text..."
+            }
+            config.update(style)
+            return config
+
+        if widget_type == "toggle":
+            config = {
+                'scale': scale,
+                'has_shadow': True
+            }
+            config.update(style)
+            return config
+
+        # Slider
+        orientation = spec.get('orientation', 'vertical')
+        track_length = spec.get('length', 30)
+
+        if orientation == 'vertical':
+            track_width = 6
+            track_height = track_length
+        else:
+            track_width = track_length
+            track_height = 6
+
+        config = {
+            'scale': scale,
+            'orientation': orientation,
+            'track_width': track_width,
+            'track_height': track_height,
+            'has_shadow': True,
+            'slider_button_config': {
+                'button_width': 8,
+                'button_height': 6,
+                'scale': scale,
+                'border_color': '#413F54',
+                'animation_enabled': False,
+                'button_normal': '#9A9FB4',
+                'button_hover': '#9A9FB4',
+                'button_pressed': '#9A9FB4',
+                'border_normal': '#ADB0C4',
+                'border_hover': '#ADB0C4',
+                'border_pressed': '#ADB0C4',
+                'bottom_normal': '#9A9FB4',
+                'bottom_hover': '#9A9FB4',
+                'bottom_pressed': '#9A9FB4',
+                'text_color': 'white',
+                'font_family': 'Minecraftia',
+                'has_shadow': True
+            },
+            'track_border_color': '#F2F2F2',
+            'track_fill_color': '#9A9FB4'
+        }
+
+        # Slider knob takes normal colors of the style for all its states
+        if style:
+            button_config = config['slider_button_config']
+            if 'button_normal' in style:
+                button_config['button_normal'] = style['button_normal']
+                button_config['button_hover'] = style['button_normal']
+                button_config['button_pressed'] = style['button_normal']
+            if 'border_normal' in style:
+                button_config['border_normal'] = style['border_normal']
+                button_config['border_hover'] = style['border_normal']
+                button_config['border_pressed'] = style['border_normal']
+            if 'bottom_normal' in style:
+                button_config['bottom_normal'] = style['bottom_normal']
+                button_config['bottom_hover'] = style['bottom_normal']
+                button_config['bottom_pressed'] = style['bottom_normal']
+            if 'button_normal' in style:
+                config['track_fill_color'] = style['button_normal']
+            if 'border_color' in style:
+                button_config['border_color'] = style['border_color']
+            config['track_border_color'] = '#F2F2F2'
+        return config
+
+    @staticmethod
+    def create_widget(spec, parent=None):
+        """Create single widget for spec without any signal connections"""
+        widget_type = WidgetSpecs.get_type(spec)
+        config = WidgetSpecs.build_config(spec)
+
+        if widget_type == "button":
+            widget = MinecraftButton('', config, parent)
+        elif widget_type == "radio":
+            widget = MinecraftRadioButton('', config, parent)
+        elif widget_type == "entry":
+            widget = MinecraftEntry(placeholder=config['placeholder'], style_config=config, parent=parent)
+        elif widget_type == "toggle":
+            widget = MinecraftToggleButton(config, parent)
+        else:
+            widget = MinecraftSlider(config, parent)
+
+        pattern_name = WidgetSpecs.get_pattern(spec)
+        if pattern_name is not None:
+            widget.set_pattern(pattern_name)
+        return widget
@@ -0,0 +1,141 @@
+"""
+Compiled widget styles - immutable, interned config objects
+"""
+from collections.abc import Mapping
+from weakref import WeakValueDictionary
+
+
+class WidgetStyle(Mapping):
+    """
+    Resolved style configuration of one widget type
+
+    Subclasses declare DEFAULTS and __slots__ = tuple(DEFAULTS), so every
+    key is a plain attribute (style.scale). compile() resolves defaults ->
+    preset -> user overrides once; keys the widget type doesn't know are
+    ignored. Styles are immutable and interned: widgets with identical
+    configuration share one object, updated() returns another shared style.
+    Read-only mapping access (style['scale'], style.get(...)) keeps working.
+    """
+    DEFAULTS = {}
+    NESTED = {}  # key -> WidgetStyle subclass of nested style (given as dict in DEFAULTS)
+
+    __slots__ = ('_values', '__weakref__')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.KEYS = tuple(cls.DEFAULTS)
+        cls.INDEX = {key: index for index, key in enumerate(cls.KEYS)}
+        cls._interned = WeakValueDictionary()
+        # Defaults are kept alive, widgets without user config always share them
+        cls.DEFAULT = cls.intern(tuple(
+            cls.NESTED[key].compile(value) if key in cls.NESTED else value
+            for key, value in cls.DEFAULTS.items()
+        ))
+
+    @classmethod
+    def intern(cls, values):
+        """Return shared style for tuple of values in KEYS order"""
+        try:
+            style = cls._interned.get(values)
+        except TypeError:
+            return cls.build(values)  # Unhashable value - style can't be shared
+        if style is None:
+            style = cls.build(values)
+            cls._interned[values] = style
+        return style
+
+    @classmethod
+    def build(cls, values):
+        """Create style object without interning"""
+        style = object.__new__(cls)
+        set_value = object.__setattr__
+        set_value(style, '_values', values)
+        for key, value in zip(cls.KEYS, values):
+            set_value(style, key, value)
+        return style
+
+    @classmethod
+    def compile(cls, *layers):
+        """
+        Return style with layers (mappings or None) applied over defaults in order
+
+        Nested styles are merged key by key, so a layer may change only part of them.
+        """
+        if len(layers) == 1 and type(layers[0]) is cls:
+            return layers[0]
+
+        values = list(cls.DEFAULT._values)
+        index = cls.INDEX
+        for layer in layers:
+            if not layer:
+                continue
+            for key, value in layer.items():
+                position = index.get(key)
+                if position is None:
+                    continue  # Key of another widget type
+                if key in cls.NESTED:
+                    value = values[position].updated(value)
+                values[position] = value
+        return cls.intern(tuple(values))
+
+    def updated(self, changes):
+        """Return style with changes (mapping) applied"""
+        return self.compile(self, changes) if changes else self
+
+    def changes(self, overrides):
+        """Return set of known keys whose values in overrides differ from this style"""
+        changed = set()
+        index = self.INDEX
+        for key, value in overrides.items():
+            position = index.get(key)
+            if position is None:
+                continue
+            current = self._values[position]
+            if key in self.NESTED:
+                if current.changes(value):
+                    changed.add(key)
+            elif current != value:
+                changed.add(key)
+        return changed
+
+    def to_dict(self):
+        """Return mutable copy (nested styles become dicts)"""
+        return {
+            key: value.to_dict() if isinstance(value, WidgetStyle) else value
+            for key, value in zip(self.KEYS, self._values)
+        }
+
+    def __getitem__(self, key):
+        position = self.INDEX.get(key)
+        if position is None:
+            raise KeyError(key)
+        return self._values[position]
+
+    def __contains__(self, key):
+        return key in self.INDEX
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __eq__(self, other):
+        if isinstance(other, WidgetStyle):
+            return self is other or (type(self) is type(other) and self._values == other._values)
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self):
+        return hash((type(self), self._values))
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} is immutable, use updated()")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"{type(self).__name__} is immutable, use updated()")
+
+    def __reduce__(self):
+        return (type(self).compile, (self.to_dict(),))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"